@@ -7,13 +7,29 @@ from rcv.commands import (
     init,
     new,
     branch,
+    apply,
     list_cmd,
     tree,
     build,
+    check,
+    report,
+    render,
+    section,
+    backends,
     tag,
     watch,
     archive,
     diff,
+    pack,
+    snapshot,
+    status,
+    sync,
+    search,
+    similar,
+    match,
+    worker,
+    publish,
+    mirror,
     completion,
 )
 
@@ -30,21 +46,45 @@ console = Console()
 app.command(name="init")(init.init)
 app.command(name="new")(new.new)
 app.command(name="branch")(branch.branch)
+app.command(name="apply")(apply.apply)
 app.command(name="list")(list_cmd.list_resumes)
 app.command(name="tree")(tree.tree)
 app.command(name="build")(build.build)
+app.command(name="check")(check.check)
+app.command(name="report")(report.report)
+app.command(name="render")(render.render)
+app.command(name="backends")(backends.backends)
 app.command(name="tag")(tag.tag)
 app.command(name="untag")(tag.untag)
 app.command(name="watch")(watch.watch)
 app.command(name="archive")(archive.archive)
 app.command(name="diff")(diff.diff)
+app.command(name="pack")(pack.pack)
+app.command(name="unpack")(pack.unpack)
+app.command(name="gc")(pack.gc)
+app.command(name="snapshot")(snapshot.snapshot)
+app.command(name="log")(snapshot.log)
+app.command(name="show")(snapshot.show)
+app.command(name="restore")(snapshot.restore)
+app.command(name="status")(status.status)
+app.command(name="sync")(sync.sync)
+app.command(name="similar")(similar.similar)
+app.command(name="grep")(search.grep)
+app.command(name="search")(search.search)
+app.command(name="match")(match.match)
+app.command(name="worker")(worker.worker)
+app.command(name="publish")(publish.publish)
+app.add_typer(section.app, name="section")
+app.add_typer(mirror.app, name="mirror")
 app.command(name="setup-fish-completion")(completion.setup_fish_completion)
 
 
 @app.callback()
-def main():
+def main(ctx: typer.Context):
     """RCV - Resume Control Versioning"""
-    pass
+    if ctx.invoked_subcommand != "mirror":
+        mirror.pull_origin_changes()
+        ctx.call_on_close(mirror.schedule_writeback)
 
 
 if __name__ == "__main__":
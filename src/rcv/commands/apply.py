@@ -0,0 +1,146 @@
+"""Apply command - Create resumes and variants declared in a plan file."""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.markup import escape
+
+from rcv.commands.branch import base_hash_of, create_variant
+from rcv.commands.new import create_resume
+from rcv.commands.search import load_index
+from rcv.core.config import Config
+from rcv.core.plan import PLAN_NEW, PlanError, read_plan, resolve_plan
+from rcv.core.resume import Resume, get_all_resumes
+
+console = Console()
+
+
+def apply(
+    plan: Path = typer.Argument(..., help="Plan file (.toml or .json)"),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Check the plan and show what would change without writing",
+    ),
+) -> None:
+    """Create the resumes and variants declared in a plan file.
+
+    The plan lists [[new]] base resumes and [[branch]] variants with their
+    seed files, tags and notes. It is checked as a whole before anything
+    is created. Resumes that already exist are kept; only missing tags and
+    changed notes are applied to them, so re-running a plan is safe.
+
+    Examples:
+        rcv apply plan.toml
+        rcv apply plan.toml --dry-run
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    if not plan.is_file():
+        console.print(f"[red]Plan not found:[/red] {plan}")
+        raise typer.Exit(1)
+
+    resumes = get_all_resumes(resumes_dir)
+    try:
+        entries = resolve_plan(
+            read_plan(plan),
+            plan.resolve().parent,
+            resumes_dir,
+            resumes,
+            config.default_format,
+        )
+    except PlanError as e:
+        console.print("[red]Invalid plan:[/red]")
+        for error in e.errors:
+            console.print(f"  {escape(error)}", highlight=False)
+        raise typer.Exit(1)
+
+    prefix = "would " if dry_run else ""
+    created: Dict[str, Resume] = {resume.full_name: resume for resume in resumes}
+    base_hashes: Dict[str, Optional[str]] = {}
+    new_resumes: List[Resume] = []
+    updated = unchanged = 0
+    failure = False
+
+    for entry in entries:
+        if entry.existing is not None:
+            changes = entry.pending_changes(entry.existing.metadata)
+            if not changes:
+                unchanged += 1
+                continue
+            if not dry_run:
+                try:
+                    with entry.existing.edit_metadata() as metadata:
+                        entry.update(metadata)
+                except (OSError, ValueError) as e:
+                    console.print(
+                        f"[red]Failed to update {entry.full_name}:[/red] "
+                        f"{escape(str(e))}"
+                    )
+                    failure = True
+                    break
+            updated += 1
+            console.print(
+                f"[yellow]{prefix}update[/yellow] {entry.full_name} "
+                f"[dim]({', '.join(changes)})[/dim]"
+            )
+            continue
+
+        origin = "new" if entry.kind == PLAN_NEW else f"from {entry.source}"
+        console.print(
+            f"[green]{prefix}create[/green] {entry.full_name} [dim]({origin})[/dim]"
+        )
+        if dry_run:
+            continue
+        metadata = entry.metadata()
+        try:
+            if entry.kind == PLAN_NEW:
+                resume = create_resume(entry.path, entry.format, entry.seed, metadata)
+            else:
+                source = created[entry.source]
+                # Sibling variants share their parent's base content
+                if entry.source not in base_hashes:
+                    base_hashes[entry.source] = base_hash_of(source)
+                metadata.base_hash = base_hashes[entry.source]
+                create_variant(
+                    source,
+                    entry.name,
+                    entry.seed,
+                    entry.assets,
+                    entry.link_assets,
+                    metadata,
+                )
+                resume = Resume.load(entry.path)
+        except (OSError, ValueError) as e:
+            # Nothing of the failed entry is left behind, so applying the
+            # plan again resumes from here.
+            console.print(
+                f"[red]Failed to create {entry.full_name}:[/red] {escape(str(e))}"
+            )
+            failure = True
+            break
+        created[entry.full_name] = resume
+        new_resumes.append(resume)
+
+    if new_resumes:
+        # One index update covers every resume created above
+        load_index(
+            resumes_dir,
+            True,
+            resumes=sorted(created.values(), key=lambda r: r.full_name),
+        )
+
+    count = len(new_resumes) if not dry_run else len(entries) - updated - unchanged
+    summary = (
+        f"{'Would create' if dry_run else 'Created'} {count}, "
+        f"{'would update' if dry_run else 'updated'} {updated}, "
+        f"unchanged {unchanged}"
+    )
+    if failure:
+        console.print(f"[red]{summary}[/red]")
+        console.print("[dim]Fix the problem and apply the plan again[/dim]")
+        raise typer.Exit(1)
+    console.print(f"[green]{summary}[/green]")
@@ -1,11 +1,14 @@
 """Archive command - Archive/unarchive resumes."""
 
+from typing import List
+
 import typer
 from rich.console import Console
 
 from rcv.core.config import Config
-from rcv.core.resume import find_resume
+from rcv.core.resume import MetadataError, find_resume
 from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
@@ -35,24 +38,24 @@ def archive(
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
-    resume = find_resume(resumes_dir, name)
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
     if resume is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {name}")
         raise typer.Exit(1)
 
+    with resume.edit_metadata() as metadata:
+        was_archived = metadata.archived
+        metadata.archived = not unarchive
+
     if unarchive:
-        if not resume.metadata.archived:
+        if not was_archived:
             console.print(f"[yellow]Resume is not archived:[/yellow] {name}")
             return
-
-        resume.metadata.archived = False
-        resume.save()
         console.print(f"[green]Unarchived:[/green] {name}")
     else:
-        if resume.metadata.archived:
+        if was_archived:
             console.print(f"[yellow]Resume is already archived:[/yellow] {name}")
             return
-
-        resume.metadata.archived = True
-        resume.save()
         console.print(f"[green]Archived:[/green] {name}")
@@ -0,0 +1,57 @@
+"""Backends command - List the available build backends."""
+
+import shutil
+
+from rich.console import Console
+from rich.table import Table
+
+from rcv.core.backends import BUILTIN_BACKENDS, available_backends
+from rcv.core.config import Config
+
+console = Console()
+
+
+def backends() -> None:
+    """List build backends and what they support.
+
+    Built-in backends are latex, latexmk, tectonic and typst; installed
+    packages can add more. Select one per project with latex_backend /
+    typst_backend in .rcv.toml, or per resume with "backend" in
+    .meta.json.
+
+    Examples:
+        rcv backends
+    """
+    config = Config.load()
+    selected = {config.get_backend_name("latex"), config.get_backend_name("typst")}
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Backend", style="cyan")
+    table.add_column("Formats")
+    table.add_column("Program")
+    table.add_column("Incremental")
+    table.add_column("Profile settings")
+    table.add_column("Description")
+
+    for name, backend in available_backends().items():
+        compiler = (
+            config.typst_compiler
+            if backend.formats == ("typst",)
+            else config.latex_compiler
+        )
+        program = backend.executable(compiler)
+        found = shutil.which(program) is not None
+        label = name + (" *" if name in selected else "")
+        if name not in BUILTIN_BACKENDS:
+            label += " [dim](plugin)[/dim]"
+        table.add_row(
+            label,
+            ", ".join(backend.formats),
+            program if found else f"[red]{program} (not found)[/red]",
+            "yes" if backend.incremental else "no",
+            ", ".join(backend.profile_settings) or "-",
+            backend.description,
+        )
+
+    console.print(table)
+    console.print("[dim]* selected for this project[/dim]")
@@ -1,18 +1,216 @@
 """Branch command - Create a variant of an existing resume."""
 
+import errno
+import os
 import shutil
+import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
 import typer
 from rich.console import Console
 
 from rcv.core.config import Config
-from rcv.core.resume import Resume, ResumeMetadata, find_resume, VARIANTS_DIR
+from rcv.core.deps import rebase_references
+from rcv.core.objects import ObjectStore
+from rcv.core.resume import (
+    METADATA_FILE,
+    VARIANTS_DIR,
+    MetadataError,
+    Resume,
+    ResumeMetadata,
+    find_resume,
+    find_seed_file,
+    seed_format,
+)
+from rcv.core.storage import (
+    CLONE_COPY,
+    CLONE_HARDLINK,
+    CLONE_REFLINK,
+    atomic_write_text,
+    clone_file,
+    file_lock,
+    is_binary_file,
+)
+from rcv.core.template import DATA_FILES, TEMPLATE_STEM, find_data_file
 from rcv.utils.completion import complete_resume_name, complete_seed_file
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
+# Build intermediates that should never be carried into a new variant.
+ARTIFACT_SUFFIXES = {
+    ".aux",
+    ".log",
+    ".out",
+    ".fls",
+    ".fdb_latexmk",
+    ".toc",
+}
+
+
+def iter_asset_files(resume: Resume) -> Iterator[Path]:
+    """Yield extra files in a resume directory that a branch should inherit.
+
+    Skips the resume source itself, metadata, hidden files, nested
+    variants, LaTeX build artifacts, and the template and data files a
+    variant inherits from its parent anyway.
+    """
+    stack = [resume.path]
+    while stack:
+        directory = stack.pop()
+        for item in sorted(directory.iterdir()):
+            if item.name.startswith("."):
+                continue
+            if item.is_dir():
+                if directory == resume.path and item.name == VARIANTS_DIR:
+                    continue
+                stack.append(item)
+                continue
+            if directory == resume.path and item.name in {
+                METADATA_FILE,
+                "resume.tex",
+                "resume.typ",
+                f"{TEMPLATE_STEM}.tex",
+                f"{TEMPLATE_STEM}.typ",
+                *DATA_FILES,
+            }:
+                continue
+            if item.suffix in ARTIFACT_SUFFIXES or item.name.endswith(".synctex.gz"):
+                continue
+            yield item
+
+
+def base_hash_of(resume: Resume) -> Optional[str]:
+    """Store a resume's source as the base of a new variant.
+
+    None if it has no source, or one that is not UTF-8 text, which
+    status and sync cannot compare anyway.
+    """
+    if not resume.has_source():
+        return None
+    try:
+        text = resume.read_source()
+    except UnicodeDecodeError:
+        return None
+    return ObjectStore.for_project(resume.project_dir).put_text(text)
+
+
+def create_variant(
+    source_resume: Resume,
+    name: str,
+    seed_file: Optional[Path] = None,
+    assets: bool = True,
+    link_assets: bool = False,
+    metadata: Optional[ResumeMetadata] = None,
+) -> Dict[str, int]:
+    """Create a variant of source_resume; returns the files cloned per method.
+
+    The variant starts from seed_file (default: the source's own file),
+    which must have the source's format. metadata, if given, is saved for
+    the variant; its base_hash is filled in unless already set. The
+    variant is assembled in a hidden directory next to its final place
+    and renamed into it, so a failure never leaves a partial variant.
+    Raises FileExistsError if the variant appeared meanwhile.
+    """
+    variant_path = source_resume.variants_dir / name
+    staging = variant_path.with_name(f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+    staging.mkdir(parents=True)
+    try:
+        clone_counts = _fill_variant(
+            source_resume, variant_path, staging, seed_file, assets, link_assets
+        )
+
+        # Create new metadata for variant, recording the parent content it
+        # was branched from so status/sync can tell later edits on either
+        # side apart.
+        if metadata is None:
+            metadata = ResumeMetadata(format=source_resume.metadata.format)
+        if metadata.base_hash is None:
+            metadata.base_hash = base_hash_of(source_resume)
+        metadata.save(staging)
+        # On POSIX, rename silently replaces an empty directory, so check
+        # for the variant under the lock other creators take as well.
+        with file_lock(source_resume.variants_dir):
+            if variant_path.exists():
+                raise FileExistsError(
+                    errno.EEXIST, "Variant already exists", str(variant_path)
+                )
+            os.rename(staging, variant_path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return clone_counts
+
+
+def _fill_variant(
+    source_resume: Resume,
+    variant_path: Path,
+    staging: Path,
+    seed_file: Optional[Path],
+    assets: bool,
+    link_assets: bool,
+) -> Dict[str, int]:
+    """Write a variant's files into staging, to be renamed to variant_path."""
+    clone_counts = {CLONE_REFLINK: 0, CLONE_HARDLINK: 0, CLONE_COPY: 0}
+    if seed_file is None and source_resume.is_packed:
+        # Expand a packed source in memory; unpacking it to disk would
+        # undo the pack for good just to copy its text.
+        source_file = source_resume.resume_file
+        atomic_write_text(
+            staging / source_file.name,
+            rebase_references(
+                source_resume.read_source(),
+                source_resume.metadata.format,
+                source_file.parent,
+                variant_path,
+            ),
+        )
+        clone_counts[CLONE_COPY] += 1
+    elif seed_file is None and source_resume.resume_file.exists():
+        seed_file = source_resume.resume_file
+
+    # Clone the seed file into the new variant as resume.<ext>
+    if seed_file is not None:
+        dest_file = staging / f"resume{seed_file.suffix}"
+        # Includes of shared files (preambles, library sections) are
+        # relative to the seed's directory; point them at the same files
+        # from the variant's deeper one. A seed that is not UTF-8 is
+        # cloned byte for byte.
+        try:
+            text: Optional[str] = seed_file.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            text = None
+        rebased = text
+        if text is not None:
+            rebased = rebase_references(
+                text, seed_format(seed_file), seed_file.parent, variant_path
+            )
+        if rebased is not None and rebased != text:
+            atomic_write_text(dest_file, rebased)
+            clone_counts[CLONE_COPY] += 1
+        else:
+            clone_counts[clone_file(seed_file, dest_file)] += 1
+
+    # Clone extra files; text files stay private so editing them in place
+    # never touches the source resume.
+    if assets:
+        for asset in iter_asset_files(source_resume):
+            dest_asset = staging / asset.relative_to(source_resume.path)
+            share = link_assets and is_binary_file(asset)
+            clone_counts[clone_file(asset, dest_asset, share=share)] += 1
+
+    # A variant of a templated resume is templated too; its data file
+    # starts empty and inherits every value from the parent's.
+    source_data = find_data_file(source_resume.path)
+    if source_data is not None:
+        (staging / source_data.name).write_text(
+            "{}\n"
+            if source_data.suffix == ".json"
+            else f"# Overrides of {source_resume.full_name}\n"
+        )
+    return clone_counts
+
 
 def branch(
     source: str = typer.Argument(
@@ -28,6 +226,16 @@ def branch(
         help="Seed the new variant from a .tex/.typ file path instead of the source resume.",
         shell_complete=complete_seed_file,
     ),
+    assets: bool = typer.Option(
+        True,
+        "--assets/--no-assets",
+        help="Also clone extra files (images, fonts, includes) from the source resume directory.",
+    ),
+    link_assets: bool = typer.Option(
+        False,
+        "--link-assets",
+        help="Share unchanged binary assets with the source via hardlinks instead of copying them.",
+    ),
 ) -> None:
     """Create a new variant (branch) of an existing resume.
 
@@ -36,48 +244,28 @@ def branch(
     Examples:
         rcv branch swe google        # Creates swe/variants/google
         rcv branch swe/google meta   # Creates swe/variants/google/variants/meta
+        rcv branch swe big --link-assets
     """
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
     # Find source resume
-    source_resume = find_resume(resumes_dir, source)
+    corrupt: List[MetadataError] = []
+    source_resume = find_resume(resumes_dir, source, corrupt)
     if source_resume is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {source}")
         raise typer.Exit(1)
 
-    # Create variant path
     variant_path = source_resume.variants_dir / name
-
     if variant_path.exists():
         console.print(f"[red]Variant already exists:[/red] {source}/{name}")
         raise typer.Exit(1)
 
-    # Create variants directory if needed
-    source_resume.variants_dir.mkdir(exist_ok=True)
-
-    # Copy source resume to variant
-    variant_path.mkdir(parents=True)
-
     # Determine seed file (source resume file by default, or --from file path)
     seed_file: Optional[Path] = None
-    seed_format: Optional[str] = source_resume.metadata.format
-
     if seed is not None:
-        seed_path = Path(seed)
-        candidates = []
-        if seed_path.is_absolute():
-            candidates.append(seed_path)
-        else:
-            candidates.append(Path.cwd() / seed_path)
-            candidates.append(resumes_dir / seed_path)
-
-        for candidate in candidates:
-            if candidate.is_file() and candidate.suffix in {".tex", ".typ"}:
-                seed_file = candidate
-                seed_format = "latex" if candidate.suffix == ".tex" else "typst"
-                break
-
+        seed_file = find_seed_file(seed, [Path.cwd(), resumes_dir])
         if seed_file is None:
             console.print(
                 f"[red]Seed source not found:[/red] {seed}\n"
@@ -85,25 +273,25 @@ def branch(
             )
             raise typer.Exit(1)
 
-        if seed_format != source_resume.metadata.format:
+        if seed_format(seed_file) != source_resume.metadata.format:
             console.print(
                 "[red]Format mismatch:[/red] Seed file format must match the base resume format."
             )
             raise typer.Exit(1)
-    else:
-        source_file = source_resume.resume_file
-        if source_file.exists():
-            seed_file = source_file
 
-    # Copy the seed file into the new variant as resume.<ext>
-    if seed_file is not None:
-        dest_file = variant_path / f"resume{seed_file.suffix}"
-        shutil.copy2(seed_file, dest_file)
-
-    # Create new metadata for variant
-    metadata = ResumeMetadata(format=source_resume.metadata.format)
-    metadata.save(variant_path)
+    try:
+        clone_counts = create_variant(
+            source_resume, name, seed_file, assets, link_assets
+        )
+    except FileExistsError:
+        console.print(f"[red]Variant already exists:[/red] {source}/{name}")
+        raise typer.Exit(1)
 
     console.print(f"[green]Created variant:[/green] {source}/{name}")
     console.print(f"[dim]Location: {variant_path}[/dim]")
     console.print(f"[dim]Branched from: {source}[/dim]")
+    cloned = ", ".join(
+        f"{count} {method}" for method, count in clone_counts.items() if count
+    )
+    if cloned:
+        console.print(f"[dim]Files: {cloned}[/dim]")
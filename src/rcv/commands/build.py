@@ -1,18 +1,53 @@
 """Build command - Compile resume to PDF."""
 
-import subprocess
+import asyncio
+import os
 import shutil
+import time
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
 
+from rcv.commands.check import print_issues
+from rcv.core.backends import Backend, get_backend
+from rcv.core.cache import HashCache, get_cache_dir
 from rcv.core.config import Config
-from rcv.core.resume import find_resume
+from rcv.core.engine import BuildEngine, ProcessResult
+from rcv.core.lint import lint_resumes
+from rcv.core.manifest import BuildInputs, BuildManifest, backend_id, collect_inputs
+from rcv.core.pages import (
+    PAGE_CHECK_FAIL,
+    PAGE_CHECK_MODES,
+    PAGE_CHECK_OFF,
+    PageCheck,
+    count_pages,
+)
+from rcv.core.profiles import BUILTIN_PROFILES, FINAL, BuildProfile
+from rcv.core.resume import MetadataError, Resume, find_resume, get_all_resumes
+from rcv.core.snapshots import TRIGGER_BUILD, SnapshotLog, inputs_hash
+from rcv.core.storage import clone_file
+from rcv.core.worker import (
+    LOCAL,
+    TOKEN_ENV,
+    BuildResult,
+    RemoteWorker,
+    WorkerPool,
+    make_job,
+    parse_address,
+)
 from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
+# Overfull box warnings printed per resume; the rest are only counted.
+SHOWN_WARNINGS = 3
+
 
 def ensure_output_settings(config: Config) -> None:
     """Prompt once for missing output settings and persist to .rcv.toml."""
@@ -36,10 +71,9 @@ def ensure_output_settings(config: Config) -> None:
         console.print("[dim]Saved output defaults to .rcv.toml[/dim]")
 
 
-def cleanup_latex_artifacts(output_dir: Path, stem: str) -> None:
-    """Remove common LaTeX intermediate files for a build target."""
-    for ext in (".aux", ".log", ".out"):
-        artifact = output_dir / f"{stem}{ext}"
+def cleanup_artifacts(artifacts: List[Path]) -> None:
+    """Remove a build's intermediate files."""
+    for artifact in artifacts:
         try:
             artifact.unlink(missing_ok=True)
         except OSError:
@@ -69,9 +103,596 @@ def resolve_output_file(
     )
 
 
+def profile_for(
+    resume: Resume, config: Config, name: Optional[str] = None
+) -> BuildProfile:
+    """Get the build profile for a resume.
+
+    An explicit name wins over the resume's own `profile` setting, which
+    wins over the project's default_profile. Raises ValueError for an
+    unknown profile.
+    """
+    return config.get_profile(name or resume.metadata.profile)
+
+
+def compiler_for(
+    resume: Resume, config: Config, profile: Optional[BuildProfile] = None
+) -> str:
+    """Get the compiler for a resume's format, honoring profile overrides."""
+    if resume.metadata.format == "latex":
+        return (profile and profile.latex_compiler) or config.latex_compiler
+    return (profile and profile.typst_compiler) or config.typst_compiler
+
+
+def backend_for(resume: Resume, config: Config) -> Backend:
+    """Get the build backend for a resume.
+
+    The resume's own `backend` setting wins over the project's backend
+    for its format. Raises ValueError for an unknown backend or one that
+    cannot build the resume's format.
+    """
+    format = resume.metadata.format
+    return get_backend(
+        resume.metadata.backend or config.get_backend_name(format), format
+    )
+
+
+@dataclass
+class BuildTarget:
+    """A resume resolved for building: where to, with which backend and how."""
+
+    resume: Resume
+    output_file: Path
+    profile: BuildProfile
+    backend: Backend
+    compiler: str
+    work_dir: Path  # where the backend builds; kept across builds if incremental
+
+    @property
+    def backend_id(self) -> str:
+        return backend_id(self.backend, self.resume.metadata.format)
+
+
+def resolve_target(
+    resume: Resume,
+    config: Config,
+    output_file: Path,
+    profile_name: Optional[str] = None,
+) -> BuildTarget:
+    """Resolve a resume's profile, backend and compiler.
+
+    Incremental backends build in a directory of the project cache per
+    resume and profile, so their state survives between builds and
+    switching profiles does not throw it away. Raises ValueError for an
+    unknown profile or backend.
+    """
+    profile = profile_for(resume, config, profile_name)
+    backend = backend_for(resume, config)
+    work_dir = output_file.parent
+    if backend.incremental:
+        work_dir = (
+            get_cache_dir(config.get_resumes_dir())
+            / "build"
+            / backend.name
+            / profile.name
+            / Path(*resume.full_name.split("/"))
+        )
+    return BuildTarget(
+        resume=resume,
+        output_file=output_file,
+        profile=profile,
+        backend=backend,
+        compiler=compiler_for(resume, config, profile),
+        work_dir=work_dir,
+    )
+
+
+async def compile_resume_async(
+    target: BuildTarget, engine: BuildEngine
+) -> BuildResult:
+    """Unpack the source if needed and compile it to the target's output."""
+    resume_file = target.resume.ensure_source_file()
+    output_file = target.output_file
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Outputs of identical builds may share an inode; never let a compiler
+    # write through it into the other resumes' PDFs.
+    if output_file.exists() and output_file.stat().st_nlink > 1:
+        output_file.unlink()
+    return await build_source_async(
+        target.backend,
+        resume_file,
+        output_file,
+        target.compiler,
+        engine,
+        job=target.resume.full_name,
+        profile=target.profile,
+        work_dir=target.work_dir,
+    )
+
+
+def compile_resume(target: BuildTarget, engine: BuildEngine) -> BuildResult:
+    """Compile one resume outside of an event loop."""
+    return asyncio.run(compile_resume_async(target, engine))
+
+
+def report_killed(engine: BuildEngine) -> None:
+    """Print the jobs whose compiler was killed, if any."""
+    if not engine.killed:
+        return
+    table = Table(show_header=True, header_style="bold", title="Killed jobs")
+    table.add_column("Job")
+    table.add_column("Reason")
+    table.add_column("After", justify="right")
+    for killed in engine.killed:
+        table.add_row(
+            killed.job, f"[red]{killed.reason}[/red]", f"{killed.duration:.1f}s"
+        )
+    console.print(table)
+
+
+def page_budget_for(resume: Resume, config: Config) -> Optional[int]:
+    """Get a resume's page budget: its own max_pages, else the project's."""
+    if resume.metadata.max_pages is not None:
+        return resume.metadata.max_pages
+    return config.max_pages
+
+
+def check_output(
+    target: BuildTarget,
+    config: Config,
+    warnings: List[str],
+    pdf: Optional[Path] = None,
+) -> Optional[PageCheck]:
+    """Run the post-build checks on a built PDF (default: the target's).
+
+    Counts the pages and compares them with the resume's budget; None if
+    page_check is off.
+    """
+    if config.page_check == PAGE_CHECK_OFF:
+        return None
+    try:
+        pages = count_pages((pdf or target.output_file).read_bytes())
+    except OSError:
+        pages = None
+    return PageCheck(pages, page_budget_for(target.resume, config), warnings)
+
+
+def report_page_check(name: str, check: PageCheck, mode: str) -> bool:
+    """Print what a post-build check found; False if the build should fail."""
+    if check.over_budget:
+        style = "red" if mode == PAGE_CHECK_FAIL else "yellow"
+        console.print(
+            f"[{style}]{name}: {check.pages} pages, over its budget of "
+            f"{check.budget}[/{style}]"
+        )
+    if check.overfull_count:
+        console.print(
+            f"[yellow]{name}: {check.overfull_count} overfull box warning(s)[/yellow]"
+        )
+        for line in check.overfull[:SHOWN_WARNINGS]:
+            console.print(f"  [dim]{escape(line)}[/dim]")
+    return not (check.over_budget and mode == PAGE_CHECK_FAIL)
+
+
+def collect_target_inputs(target: BuildTarget, hashes: HashCache) -> BuildInputs:
+    """Hash everything that determines a target's PDF.
+
+    Raises OSError if the source or a dependency cannot be read.
+    """
+    return collect_inputs(
+        target.resume,
+        target.compiler,
+        hashes,
+        target.profile.fingerprint(),
+        target.backend,
+    )
+
+
+def record_build(
+    manifest: BuildManifest,
+    target: BuildTarget,
+    hashes: HashCache,
+    inputs: Optional[BuildInputs] = None,
+    check: Optional[PageCheck] = None,
+) -> None:
+    """Record the inputs, output and checks of a successful build."""
+    try:
+        if inputs is None:
+            inputs = collect_target_inputs(target, hashes)
+        manifest.record(
+            target.resume.full_name,
+            inputs,
+            target.output_file,
+            hashes.hash_file(target.output_file),
+            check,
+        )
+    except OSError as e:
+        console.print(f"[yellow]Could not update build manifest:[/yellow] {e}")
+
+
+def link_output(source: Path, output_file: Path) -> str:
+    """Place an identical build's PDF at output_file; returns the method used."""
+    if output_file.exists() and output_file.samefile(source):
+        return "existing"
+    output_file.unlink(missing_ok=True)
+    return clone_file(source, output_file, share=True)
+
+
+def prune_outputs(
+    config: Config, manifest: BuildManifest, resumes: List[Resume]
+) -> List[Path]:
+    """Delete outputs of resumes that no longer exist; returns removed files.
+
+    Orphans are manifest entries without a resume, plus output PDFs in the
+    output root whose location matches no resume. Emptied directories are
+    removed as well.
+    """
+    output_root = config.get_output_root_dir()
+    live = {r.full_name for r in resumes}
+    expected = {
+        resolve_output_file(r.full_name, r.resume_file, config, None).resolve()
+        for r in resumes
+    }
+
+    candidates = set()
+    for name in manifest.orphans(live):
+        candidates.add(manifest.output_path(manifest.entries[name]))
+        manifest.remove(name)
+    if output_root.is_dir():
+        candidates.update(output_root.rglob(config.get_output_pdf_filename()))
+
+    removed = []
+    for path in sorted(candidates):
+        if path.resolve() in expected or not path.is_file():
+            continue
+        try:
+            path.unlink()
+        except OSError as e:
+            console.print(f"[yellow]Could not remove {path}:[/yellow] {e}")
+            continue
+        removed.append(path)
+        parent = path.parent
+        while parent != output_root and output_root in parent.parents:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+    return removed
+
+
+def prune_project(config: Config) -> None:
+    """Remove orphan outputs without building (`rcv build --prune`).
+
+    Refuses while any resume has corrupt metadata, since such a resume
+    is not listed and its outputs would look orphaned.
+    """
+    resumes_dir = config.get_resumes_dir()
+    ensure_output_settings(config)
+    corrupt: List[MetadataError] = []
+    resumes = get_all_resumes(resumes_dir, corrupt)
+    if corrupt:
+        print_metadata_errors(corrupt)
+        console.print(
+            "[red]Not pruning: the outputs of resumes with corrupt "
+            "metadata would look orphaned[/red]"
+        )
+        raise typer.Exit(1)
+    manifest = BuildManifest(config.get_output_root_dir(), resumes_dir)
+    removed = prune_outputs(config, manifest, resumes)
+    manifest.save()
+    for path in removed:
+        console.print(f"[dim]Removed orphan output {path}[/dim]")
+    console.print(f"[green]Removed {len(removed)} orphan output(s)[/green]")
+
+
+def make_pool(specs: List[str], engine: BuildEngine) -> WorkerPool:
+    """Create a worker pool from --workers entries (`local` or addresses).
+
+    Raises ValueError for an invalid address.
+    """
+    token = os.environ.get(TOKEN_ENV)
+    remotes = [
+        RemoteWorker(parse_address(spec), token=token)
+        for spec in specs
+        if spec != LOCAL
+    ]
+    local_slots = engine.jobs if LOCAL in specs else 0
+
+    def on_drop(name: str, error: str) -> None:
+        console.print(f"[yellow]Dropped worker {name}:[/yellow] {error}")
+
+    return WorkerPool(remotes, local_slots, fallback_slots=engine.jobs, on_drop=on_drop)
+
+
+def write_remote_output(result: BuildResult, output_file: Path) -> None:
+    """Write a PDF returned by a remote worker.
+
+    Written beside the target and renamed into place, so readers never see
+    a partial PDF and a hardlinked previous output is left untouched.
+    """
+    assert result.pdf is not None
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    partial = output_file.with_name(f".{output_file.name}.{os.getpid()}.part")
+    try:
+        partial.write_bytes(result.pdf)
+        os.replace(partial, output_file)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def build_all(
+    config: Config,
+    stale_only: bool,
+    prune: bool,
+    engine: BuildEngine,
+    pool: Optional[WorkerPool] = None,
+    profile_name: Optional[str] = None,
+    check: bool = True,
+    strict_check: bool = False,
+) -> None:
+    """Build every active resume, or only out-of-date ones, into the output root.
+
+    Resumes are grouped by effective input hash (source, dependencies and
+    compiler). Each group is compiled once and the PDF is linked to the
+    other members. With stale_only, a group whose output already exists
+    from an earlier build is not compiled at all. Groups compile
+    concurrently, up to the engine's job limit, or spread over the
+    pool's workers if one is given. With check, problems found by the
+    static checks of `rcv check` are reported first; with strict_check,
+    resumes that fail them are not compiled.
+    """
+    resumes_dir = config.get_resumes_dir()
+    ensure_output_settings(config)
+    manifest = BuildManifest(config.get_output_root_dir(), resumes_dir)
+    hashes = HashCache(resumes_dir)
+
+    corrupt: List[MetadataError] = []
+    resumes = get_all_resumes(resumes_dir, corrupt)
+    print_metadata_errors(corrupt)
+    active = [r for r in resumes if not r.metadata.archived and r.has_source()]
+
+    groups: Dict[str, List[Tuple[BuildTarget, BuildInputs]]] = {}
+    queued = fresh = 0
+    built = failed = compiles = 0
+    compile_seconds = 0.0
+    targets: List[BuildTarget] = []
+    for resume in active:
+        output_file = resolve_output_file(
+            resume.full_name, resume.resume_file, config, None
+        )
+        try:
+            target = resolve_target(resume, config, output_file, profile_name)
+        except ValueError as e:
+            console.print(f"[red]{resume.full_name}:[/red] {e}")
+            failed += 1
+            continue
+        if stale_only and not manifest.is_stale(
+            resume.full_name,
+            resume.source_hash(hashes),
+            target.compiler,
+            output_file,
+            hashes,
+            target.profile.fingerprint(),
+            target.backend_id,
+        ):
+            fresh += 1
+            continue
+        targets.append(target)
+
+    if check and targets:
+        reports = lint_resumes([t.resume for t in targets], resumes_dir, engine.jobs)
+        passed = {report.resume.path for report in reports if report.ok}
+        for report in reports:
+            if not report.ok:
+                print_issues(report, "red" if strict_check else "yellow")
+        if strict_check:
+            failed += len(targets) - len(passed)
+            targets = [t for t in targets if t.resume.path in passed]
+        elif len(passed) < len(targets):
+            console.print(
+                f"[yellow]{len(targets) - len(passed)} resume(s) failed the static "
+                "checks; compiling them anyway (use --strict-check to skip "
+                "them)[/yellow]"
+            )
+
+    for target in targets:
+        resume = target.resume
+        try:
+            resume.ensure_source_file()
+            inputs = collect_target_inputs(target, hashes)
+        except OSError as e:
+            console.print(f"[red]Cannot read inputs of {resume.full_name}:[/red] {e}")
+            failed += 1
+            continue
+        groups.setdefault(inputs.input_hash, []).append((target, inputs))
+        queued += 1
+
+    async def compile_local(target: BuildTarget) -> BuildResult:
+        console.print(f"[bold]Building {target.resume.full_name}[/bold]")
+        return await compile_resume_async(target, engine)
+
+    async def compile_leader(target: BuildTarget, inputs: BuildInputs) -> BuildResult:
+        if pool is None:
+            async with engine.slot():
+                return await compile_local(target)
+
+        async def build_here() -> BuildResult:
+            return await compile_local(target)
+
+        resume, output_file = target.resume, target.output_file
+        try:
+            job = make_job(
+                resume.full_name,
+                inputs.format,
+                inputs.compiler,
+                resume.resume_file,
+                list(inputs.dependencies),
+                target.profile,
+                inputs.backend,
+            )
+        except OSError as e:
+            console.print(f"[red]Cannot bundle {resume.full_name}:[/red] {e}")
+            return BuildResult(ok=False)
+        result = await pool.run(job, build_here)
+        if result.worker == LOCAL:
+            return result
+        if not result.ok:
+            console.print(
+                f"[red]Compilation errors ({resume.full_name} on {result.worker}):"
+                f"[/red]"
+            )
+            console.print(f"  {result.diagnostics}")
+            return result
+        try:
+            write_remote_output(result, output_file)
+        except OSError as e:
+            console.print(f"[red]Could not write {output_file}:[/red] {e}")
+            return BuildResult(ok=False)
+        console.print(
+            f"[bold]Built {resume.full_name}[/bold] "
+            f"[dim]on {result.worker} ({result.duration:.1f}s)[/dim]"
+        )
+        return result
+
+    # Members of each group counted as built or failed so far
+    settled: Dict[str, int] = {}
+
+    def settle(input_hash: str, ok: bool, count: int = 1) -> None:
+        nonlocal built, failed
+        if ok:
+            built += count
+        else:
+            failed += count
+        settled[input_hash] = settled.get(input_hash, 0) + count
+
+    async def build_group(
+        input_hash: str, members: List[Tuple[BuildTarget, BuildInputs]]
+    ) -> None:
+        nonlocal compiles, compile_seconds
+        leader, leader_inputs = members[0]
+        source = None
+        check = None  # post-build checks of the shared PDF
+        if stale_only:
+            previous = manifest.find_build(input_hash, hashes)
+            if previous is not None:
+                source = manifest.output_path(previous)
+                if config.page_check != PAGE_CHECK_OFF:
+                    check = previous.page_check
+        if source is None:
+            started = time.monotonic()
+            result = await compile_leader(leader, leader_inputs)
+            compile_seconds += time.monotonic() - started
+            compiles += 1
+            if not result.ok:
+                settle(input_hash, False, len(members))
+                names = ", ".join(target.resume.full_name for target, _ in members)
+                console.print(f"[red]Build failed:[/red] {names}")
+                return
+            source = leader.output_file
+            check = check_output(leader, config, result.warnings)
+        elif check is None:
+            check = check_output(leader, config, [], pdf=source)
+
+        for target, inputs in members:
+            resume, output_file = target.resume, target.output_file
+            if output_file != source:
+                try:
+                    method = link_output(source, output_file)
+                except OSError as e:
+                    settle(input_hash, False)
+                    console.print(f"[red]Could not write {output_file}:[/red] {e}")
+                    continue
+                console.print(
+                    f"[dim]{resume.full_name}: identical input, {method}[/dim]"
+                )
+            member_check = None
+            if check is not None:
+                member_check = replace(
+                    check, budget=page_budget_for(resume, config)
+                )
+                if not report_page_check(
+                    resume.full_name, member_check, config.page_check
+                ):
+                    settle(input_hash, False)
+                    continue
+            settle(input_hash, True)
+            record_build(manifest, target, hashes, inputs, member_check)
+            if config.snapshot_on_build and not target.profile.fingerprint():
+                record_build_snapshot(resume, output_file)
+
+    async def build_isolated(
+        input_hash: str, members: List[Tuple[BuildTarget, BuildInputs]]
+    ) -> None:
+        # One group's error must not abort the others' builds
+        try:
+            await build_group(input_hash, members)
+        except Exception as e:
+            rest = members[settled.get(input_hash, 0) :]
+            names = ", ".join(target.resume.full_name for target, _ in rest)
+            console.print(f"[red]Build failed:[/red] {names}: {escape(str(e))}")
+            settle(input_hash, False, len(rest))
+
+    async def build_groups() -> None:
+        if pool is not None and groups:
+            await pool.start()
+        await asyncio.gather(
+            *(
+                build_isolated(input_hash, members)
+                for input_hash, members in groups.items()
+            )
+        )
+
+    interrupted = False
+    try:
+        try:
+            asyncio.run(build_groups())
+        except KeyboardInterrupt:
+            interrupted = True
+        if prune and not interrupted and corrupt:
+            console.print(
+                "[yellow]Not pruning: the outputs of resumes with corrupt "
+                "metadata would look orphaned[/yellow]"
+            )
+        elif prune and not interrupted:
+            for path in prune_outputs(config, manifest, resumes):
+                console.print(f"[dim]Removed orphan output {path}[/dim]")
+    finally:
+        manifest.save()
+        hashes.save()
+
+    report_killed(engine)
+    if pool is not None and pool.stats.jobs:
+        spread = ", ".join(f"{n} {c}" for n, c in sorted(pool.stats.jobs.items()))
+        console.print(f"[dim]Compiles per worker: {spread}[/dim]")
+    if interrupted:
+        console.print(
+            f"[yellow]Interrupted: stopped all running compilers "
+            f"({built} built before the interrupt)[/yellow]"
+        )
+        raise typer.Exit(130)
+
+    summary = f"Built {built}, failed {failed}"
+    if stale_only:
+        summary += f", {fresh} up to date"
+    style = "red" if failed else "green"
+    console.print(f"[{style}]{summary}[/{style}]")
+    saved = queued - compiles
+    if saved > 0:
+        estimate = ""
+        if compiles:
+            estimate = f", about {saved * compile_seconds / compiles:.1f}s"
+        console.print(
+            f"[dim]{compiles} compile(s) for {queued} resume(s): "
+            f"{saved} skipped as identical{estimate} saved[/dim]"
+        )
+    if failed:
+        raise typer.Exit(1)
+
+
 def build(
-    name: str = typer.Argument(
-        ...,
+    name: Optional[str] = typer.Argument(
+        None,
         help="Name of the resume to build",
         shell_complete=complete_resume_name,
     ),
@@ -81,127 +702,319 @@ def build(
         "-o",
         help="Output directory for the PDF. Defaults to project output_dir layout from .rcv.toml.",
     ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Build every resume that is not archived",
+    ),
+    stale: bool = typer.Option(
+        False,
+        "--stale",
+        help="Build only resumes whose PDF is missing or out of date",
+    ),
+    prune: bool = typer.Option(
+        False,
+        "--prune",
+        help="Delete output PDFs of resumes that no longer exist",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of concurrent builds (default: build_jobs or CPU count)",
+    ),
+    timeout: Optional[float] = typer.Option(
+        None,
+        "--timeout",
+        help="Kill a compiler run after this many seconds (0 disables)",
+    ),
+    workers: Optional[str] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Comma-separated build workers (HOST:PORT, unix:PATH, local) "
+        "for --all/--stale",
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        "-p",
+        help="Build profile, e.g. draft or final (default: the resume's profile "
+        "or default_profile)",
+    ),
+    no_check: bool = typer.Option(
+        False,
+        "--no-check",
+        help="Compile --all/--stale resumes without running `rcv check` first",
+    ),
+    strict_check: bool = typer.Option(
+        False,
+        "--strict-check",
+        help="Do not compile --all/--stale resumes that fail `rcv check`",
+    ),
 ) -> None:
     """Compile a resume to PDF.
 
-    Supports both LaTeX and Typst formats.
+    Supports both LaTeX and Typst formats. Each build is recorded in a
+    manifest in the output root (source, dependency and output hashes),
+    which --stale uses to skip resumes whose PDF is up to date. Profiles
+    from .rcv.toml select how thoroughly to compile (passes, images,
+    engine); `draft` is a fast single pass. --all and --stale first run
+    the static checks of `rcv check` and warn about resumes that fail
+    them (--strict-check skips those resumes instead).
+
+    With --workers, compiles are spread over `rcv worker` processes (and
+    this machine, if `local` is listed), retrying elsewhere when a worker
+    drops out. Compilers run with a wall-clock timeout and optional
+    CPU/memory limits from .rcv.toml; Ctrl+C stops every running compiler.
 
     Examples:
         rcv build swe
         rcv build swe/google -o ~/Documents/
+        rcv build swe -p draft
+        rcv build --stale --prune
+        rcv build --all --workers local,buildbox:7878
     """
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
+    engine = BuildEngine.from_config(config, jobs)
+    if timeout is not None:
+        engine.limits.timeout = timeout or None
+
+    if profile is not None:
+        try:
+            config.get_profile(profile)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+
+    if config.page_check not in PAGE_CHECK_MODES:
+        console.print(
+            f"[red]Invalid page_check in .rcv.toml:[/red] {config.page_check} "
+            f"(expected {', '.join(PAGE_CHECK_MODES)})"
+        )
+        raise typer.Exit(1)
+
+    pool = None
+    if workers is not None:
+        if not (all or stale):
+            console.print("[red]--workers requires --all or --stale[/red]")
+            raise typer.Exit(1)
+        specs = [spec.strip() for spec in workers.split(",") if spec.strip()]
+        try:
+            pool = make_pool(specs, engine)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+
+    if all or stale or prune:
+        if name is not None or output is not None:
+            console.print(
+                "[red]--all, --stale and --prune build into the project output "
+                "directory and take no NAME or --output[/red]"
+            )
+            raise typer.Exit(1)
+        if not all and not stale:
+            prune_project(config)
+            return
+        build_all(
+            config,
+            stale_only=stale,
+            prune=prune,
+            engine=engine,
+            pool=pool,
+            profile_name=profile,
+            check=not no_check,
+            strict_check=strict_check,
+        )
+        return
+
+    if name is None:
+        console.print("[red]Specify a resume name, or --all / --stale[/red]")
+        raise typer.Exit(1)
+
     # Find the resume
-    resume = find_resume(resumes_dir, name)
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
     if resume is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {name}")
         raise typer.Exit(1)
 
-    resume_file = resume.resume_file
-    if not resume_file.exists():
-        console.print(f"[red]Resume file not found:[/red] {resume_file}")
+    if not resume.has_source():
+        console.print(f"[red]Resume file not found:[/red] {resume.resume_file}")
         raise typer.Exit(1)
 
     ensure_output_settings(config)
-    output_file = resolve_output_file(resume.full_name, resume_file, config, output)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Build based on format
-    if resume.metadata.format == "latex":
-        success = build_latex(resume_file, output_file, config.latex_compiler)
-    else:
-        success = build_typst(resume_file, output_file, config.typst_compiler)
+    output_file = resolve_output_file(
+        resume.full_name, resume.resume_file, config, output
+    )
+    try:
+        target = resolve_target(resume, config, output_file, profile)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
 
-    if success:
+    try:
+        result = compile_resume(target, engine)
+    except KeyboardInterrupt:
+        report_killed(engine)
+        raise typer.Exit(130)
+    report_killed(engine)
+
+    if result.ok:
+        check = check_output(target, config, result.warnings)
+        if check is not None and not report_page_check(
+            resume.full_name, check, config.page_check
+        ):
+            console.print(f"[red]Over the page budget:[/red] {output_file}")
+            raise typer.Exit(1)
         console.print(f"[green]Built successfully:[/green] {output_file}")
+        if output is None:
+            hashes = HashCache(resumes_dir)
+            manifest = BuildManifest(config.get_output_root_dir(), resumes_dir)
+            record_build(manifest, target, hashes, check=check)
+            manifest.save()
+            hashes.save()
+        if config.snapshot_on_build and not target.profile.fingerprint():
+            record_build_snapshot(resume, output_file)
     else:
         console.print("[red]Build failed. See errors above.[/red]")
         raise typer.Exit(1)
 
 
-def build_latex(source: Path, output_file: Path, compiler: str) -> bool:
-    """Build a LaTeX resume."""
-    # Check if compiler exists
-    if not shutil.which(compiler):
-        console.print(f"[red]LaTeX compiler not found:[/red] {compiler}")
-        console.print(
-            "[dim]Install LaTeX or configure a different compiler in .rcv.toml[/dim]"
+def record_build_snapshot(resume: Resume, output_file: Path) -> None:
+    """Snapshot the source and PDF of a successful build (best effort)."""
+    try:
+        text = resume.read_source()
+        snapshot, created = SnapshotLog.for_resume(resume).record(
+            text,
+            resume.metadata.format,
+            pdf_file=output_file,
+            trigger=TRIGGER_BUILD,
+            inputs=inputs_hash(resume, text),
         )
-        return False
-
-    output_dir = output_file.parent
-    generated_pdf = output_dir / f"{source.stem}.pdf"
-
-    cleanup_dirs = [output_dir]
-    if source.parent != output_dir:
-        cleanup_dirs.append(source.parent)
+    except (OSError, ValueError) as e:
+        # ValueError covers sources that are not UTF-8 text
+        console.print(f"[yellow]Could not record snapshot:[/yellow] {e}")
+        return
+    if created:
+        console.print(f"[dim]Recorded snapshot #{snapshot.number}[/dim]")
+
+
+def build_source(
+    backend: Backend,
+    source: Path,
+    output_file: Path,
+    compiler: str,
+    engine: Optional[BuildEngine] = None,
+    profile: Optional[BuildProfile] = None,
+    work_dir: Optional[Path] = None,
+) -> BuildResult:
+    """Build a resume source with a backend."""
+    return asyncio.run(
+        build_source_async(
+            backend,
+            source,
+            output_file,
+            compiler,
+            engine or BuildEngine(),
+            profile=profile,
+            work_dir=work_dir,
+        )
+    )
 
-    try:
-        # Run pdflatex (need to run twice for references)
-        # Compile from the source directory with just the filename.
-        # This avoids TeX parsing issues with absolute paths containing '~'
-        # (common in iCloud paths like com~apple~CloudDocs).
-        result = None
-        for _ in range(2):
-            result = subprocess.run(
-                [
-                    compiler,
-                    "-interaction=nonstopmode",
-                    f"-output-directory={output_dir}",
-                    source.name,
-                ],
-                cwd=source.parent,
-                capture_output=True,
-                text=True,
-            )
 
-        if result is None or result.returncode != 0:
-            console.print("[red]LaTeX compilation errors:[/red]")
-            # Extract relevant error lines
-            if result is not None:
-                for line in result.stdout.split("\n"):
-                    if line.startswith("!") or "Error" in line:
-                        console.print(f"  {line}")
-            return False
+def _print_killed(result: ProcessResult, job: str) -> None:
+    console.print(
+        f"[red]{result.argv[0]} killed ({result.killed}) after "
+        f"{result.duration:.1f}s:[/red] {job}"
+    )
 
-        if generated_pdf != output_file:
-            output_file.unlink(missing_ok=True)
-            shutil.move(str(generated_pdf), str(output_file))
 
+def check_program(backend: Backend, program: str) -> bool:
+    """Check that a backend's program is installed, printing a hint if not."""
+    if shutil.which(program):
         return True
+    console.print(f"[red]Compiler not found for {backend.name}:[/red] {program}")
+    if backend.install_hint:
+        console.print(f"[dim]{backend.install_hint}[/dim]")
+    return False
+
+
+async def run_commands(
+    backend: Backend,
+    commands: List[List[str]],
+    cwd: Path,
+    engine: BuildEngine,
+    job: str,
+) -> Optional[ProcessResult]:
+    """Run a build's commands in order, printing diagnostics on failure.
+
+    Returns the last command's result, or None if the build failed.
+    """
+    result = None
+    for argv in commands:
+        result = await engine.run(job, argv, cwd=cwd)
+        if result.killed is not None:
+            _print_killed(result, job)
+            return None
+        if result.returncode != 0:
+            break
+
+    if result is None or result.returncode != 0:
+        console.print(f"[red]Compilation errors ({job}):[/red]")
+        if result is not None:
+            for line in backend.diagnostics(result):
+                console.print(f"  {line}")
+        return None
+    return result
+
+
+async def build_source_async(
+    backend: Backend,
+    source: Path,
+    output_file: Path,
+    compiler: str,
+    engine: BuildEngine,
+    job: Optional[str] = None,
+    profile: Optional[BuildProfile] = None,
+    work_dir: Optional[Path] = None,
+) -> BuildResult:
+    """Build a resume source under the engine's supervision.
+
+    The backend builds into work_dir (default: the output directory) and
+    the PDF is then moved to output_file, or copied if the backend is
+    incremental and needs it for its next build. The result carries the
+    build's layout warnings.
+    """
+    job = job or source.name
+    program = backend.executable(compiler)
+    if not check_program(backend, program):
+        return BuildResult(ok=False)
 
-    except Exception as e:
-        console.print(f"[red]Error running {compiler}:[/red] {e}")
-        return False
-    finally:
-        for cleanup_dir in cleanup_dirs:
-            cleanup_latex_artifacts(cleanup_dir, source.stem)
-
-
-def build_typst(source: Path, output_file: Path, compiler: str) -> bool:
-    """Build a Typst resume."""
-    # Check if compiler exists
-    if not shutil.which(compiler):
-        console.print(f"[red]Typst compiler not found:[/red] {compiler}")
-        console.print("[dim]Install Typst: https://typst.app/[/dim]")
-        return False
-
+    work_dir = work_dir or output_file.parent
+    plan = backend.plan(source, work_dir, compiler, profile or BUILTIN_PROFILES[FINAL])
     try:
-        result = subprocess.run(
-            [compiler, "compile", str(source), str(output_file)],
-            capture_output=True,
-            text=True,
-        )
+        work_dir.mkdir(parents=True, exist_ok=True)
+        result = await run_commands(backend, plan.commands, plan.cwd, engine, job)
+        if result is None:
+            return BuildResult(ok=False)
+        warnings = backend.warnings(result, plan)
 
-        if result.returncode != 0:
-            console.print("[red]Typst compilation errors:[/red]")
-            console.print(result.stderr)
-            return False
+        if plan.pdf != output_file:
+            output_file.unlink(missing_ok=True)
+            if backend.incremental:
+                clone_file(plan.pdf, output_file)
+            else:
+                shutil.move(str(plan.pdf), str(output_file))
 
-        return True
+        return BuildResult(ok=True, warnings=warnings)
 
     except Exception as e:
-        console.print(f"[red]Error running typst:[/red] {e}")
-        return False
+        console.print(f"[red]Error running {program}:[/red] {e}")
+        return BuildResult(ok=False)
+    finally:
+        cleanup_artifacts(plan.artifacts)
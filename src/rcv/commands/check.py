@@ -0,0 +1,88 @@
+"""Check command - Find broken resume sources without compiling them."""
+
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from rcv.core.config import Config
+from rcv.core.lint import LintReport, lint_resumes
+from rcv.core.resume import MetadataError, find_resume, get_all_resumes
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def print_issues(report: LintReport, style: str = "red") -> None:
+    """Print a failed check's issues under the resume's name."""
+    console.print(f"[{style}]{report.resume.full_name}[/{style}]")
+    for issue in report.issues:
+        console.print(f"  {issue}")
+
+
+def check(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Resume to check (default: every resume that is not archived)",
+        shell_complete=complete_resume_name,
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
+) -> None:
+    """Check resume sources for errors without compiling them.
+
+    Finds unbalanced braces and environments, \\input files, images and
+    typst imports that do not exist, malformed typst package imports, and
+    sources whose format does not match .meta.json. Results are cached by
+    content hash, so re-checking an unchanged tree is fast. `rcv build
+    --all` and `--stale` run the same checks first.
+
+    Examples:
+        rcv check
+        rcv check swe/google
+        rcv check --all
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    if name is not None:
+        corrupt: List[MetadataError] = []
+        resume = find_resume(resumes_dir, name, corrupt)
+        if resume is None:
+            print_metadata_errors(corrupt)
+            console.print(f"[red]Resume not found:[/red] {name}")
+            raise typer.Exit(1)
+        resumes = [resume]
+    else:
+        resumes = get_all_resumes(resumes_dir)
+        if not all:
+            resumes = [r for r in resumes if not r.metadata.archived]
+
+    reports = lint_resumes(resumes, resumes_dir, jobs)
+    failed: List[LintReport] = [report for report in reports if not report.ok]
+    for report in failed:
+        print_issues(report)
+
+    files = sum(report.files for report in reports)
+    cached = sum(report.cached for report in reports)
+    style = "red" if failed else "green"
+    console.print(
+        f"[{style}]Checked {len(reports)} resume(s): "
+        f"{len(failed)} with problems[/{style}]"
+    )
+    console.print(
+        f"[dim]{files} file(s), {cached} unchanged since the last check[/dim]"
+    )
+    if failed:
+        raise typer.Exit(1)
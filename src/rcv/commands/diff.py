@@ -1,26 +1,184 @@
 """Diff command - Show differences between resumes."""
 
 import difflib
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.syntax import Syntax
+from rich.table import Table
+from rich.text import Text
 
 from rcv.core.config import Config
-from rcv.core.resume import find_resume
+from rcv.core.drift import ParentDiff, compute_parent_diffs
+from rcv.core.resume import MetadataError, Resume, find_resume, get_all_resumes
+from rcv.core.sections import (
+    CHANGE_ADDED,
+    CHANGE_REMOVED,
+    SectionCache,
+    StructuralDiff,
+    structural_diff,
+)
 from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
+OP_STYLES = {"-": "red", "+": "green", "~": "cyan"}
+
+
+def _section_label(path: Tuple[str, ...]) -> str:
+    return " / ".join(path)
+
+
+def print_structural_diff(result: StructuralDiff) -> None:
+    """Print a structural diff section by section as it is rendered."""
+    for section in result.changes:
+        label = escape(_section_label(section.path))
+        if section.change == CHANGE_ADDED:
+            console.print(
+                f"[bold green]+ {label}[/bold green] [dim](new section)[/dim]"
+            )
+        elif section.change == CHANGE_REMOVED:
+            console.print(
+                f"[bold red]- {label}[/bold red] [dim](removed section)[/dim]"
+            )
+        else:
+            console.print(f"[bold]@ {label}[/bold]")
+
+        for block in section.blocks:
+            lines = block.text.rstrip("\n").splitlines() or [""]
+            line = Text(f"{block.op} {lines[0]}", style=OP_STYLES[block.op])
+            if block.moved_from is not None:
+                origin = (
+                    "reordered"
+                    if block.moved_from == section.path
+                    else f"moved from {_section_label(block.moved_from)}"
+                )
+                line.append(f"  ({origin})", style="dim")
+            elif block.moved_to is not None:
+                line.append(
+                    f"  (moved to {_section_label(block.moved_to)})", style="dim"
+                )
+            console.print(line)
+            for extra in lines[1:]:
+                console.print(Text(f"{block.op} {extra}", style=OP_STYLES[block.op]))
+        console.print()
+
+    summary = f"{len(result.changes)} section(s) changed, {result.unchanged} unchanged"
+    if result.moved:
+        summary += f", {result.moved} bullet(s) moved"
+    if result.reordered:
+        summary += ", sections reordered"
+    console.print(f"[dim]{summary}[/dim]")
+
+
+def print_text_diff(
+    source_a: str, source_b: str, label_a: str, label_b: str, context: int
+) -> bool:
+    """Print a highlighted unified diff; returns False if there is none."""
+    diff_lines = list(
+        difflib.unified_diff(
+            source_a.splitlines(keepends=True),
+            source_b.splitlines(keepends=True),
+            fromfile=label_a,
+            tofile=label_b,
+            n=context,
+        )
+    )
+    if not diff_lines:
+        return False
+    diff_text = "".join(diff_lines)
+    console.print(Syntax(diff_text, "diff", theme="monokai", line_numbers=False))
+    return True
+
+
+def diff_against_parents(
+    resumes: List[Resume],
+    resumes_dir: Path,
+    full: bool,
+    structural: bool,
+    context: int,
+    jobs: Optional[int],
+) -> None:
+    """Print a diffstat table of variants against their parents."""
+    results: List[ParentDiff] = compute_parent_diffs(resumes, resumes_dir, jobs)
+    if not results:
+        console.print("[dim]No variants found.[/dim]")
+        return
+    results.sort(key=lambda r: r.resume.full_name)
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Variant")
+    table.add_column("Parent")
+    table.add_column("Lines")
+    for result in results:
+        if result.identical:
+            lines = "[dim]identical[/dim]"
+        elif result.unreadable:
+            lines = "[red]unreadable[/red]"
+        elif result.counts is None:
+            lines = "[red]missing[/red]"
+        else:
+            added, removed = result.counts
+            lines = f"[green]+{added}[/green] [red]-{removed}[/red]"
+        parent = result.parent.full_name if result.parent is not None else "-"
+        table.add_row(result.resume.full_name, parent, lines)
+    console.print(table)
+
+    changed = [r for r in results if r.counts is not None]
+    identical = sum(1 for r in results if r.identical)
+    unreadable = sum(1 for r in results if r.unreadable)
+    summary = f"{len(changed)} changed, {identical} identical"
+    if unreadable:
+        summary += f", {unreadable} unreadable"
+    console.print(f"[dim]{summary}[/dim]")
+
+    if not full:
+        return
+    parses = SectionCache(resumes_dir) if structural else None
+    for result in changed:
+        variant, parent = result.resume, result.parent
+        try:
+            source_parent = parent.read_source()
+            source_variant = variant.read_source()
+        except (OSError, ValueError) as e:
+            console.print(
+                f"\n[yellow]Skipping {variant.full_name}:[/yellow] cannot read source ({e})"
+            )
+            continue
+        console.print()
+        if parses is None:
+            print_text_diff(
+                source_parent,
+                source_variant,
+                parent.full_name,
+                variant.full_name,
+                context,
+            )
+            continue
+        console.print(f"[bold]--- {parent.full_name}[/bold]")
+        console.print(f"[bold]+++ {variant.full_name}[/bold]\n")
+        print_structural_diff(
+            structural_diff(
+                parses.parse(source_parent, parent.metadata.format),
+                parses.parse(source_variant, variant.metadata.format),
+            )
+        )
+    if parses is not None:
+        parses.save()
+
 
 def diff(
-    a: str = typer.Argument(
-        ...,
-        help="First resume name",
+    a: Optional[str] = typer.Argument(
+        None,
+        help="First resume name (or the variant/subtree with --against-parent)",
         shell_complete=complete_resume_name,
     ),
-    b: str = typer.Argument(
-        ...,
+    b: Optional[str] = typer.Argument(
+        None,
         help="Second resume name",
         shell_complete=complete_resume_name,
     ),
@@ -30,61 +188,126 @@ def diff(
         "-c",
         help="Number of context lines around changes",
     ),
+    structural: bool = typer.Option(
+        False,
+        "--structural",
+        "-s",
+        help="Diff section by section and detect moved bullets",
+    ),
+    against_parent: bool = typer.Option(
+        False,
+        "--against-parent",
+        "-p",
+        help="Compare variants with their parents instead of two resumes",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="With --against-parent, compare every variant in the project",
+    ),
+    subtree: bool = typer.Option(
+        False,
+        "--subtree",
+        help="With --against-parent, include all descendants of the named resume",
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="With --against-parent, print full diffs after the summary table",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
 ) -> None:
     """Show differences between two resumes.
 
-    This performs a text diff between the resume files.
+    This performs a text diff between the resume files. With --structural,
+    sections are matched by heading, unchanged sections are skipped and
+    bullets that moved between sections are shown as moves.
+
+    With --against-parent, every selected variant is compared with its
+    parent in one pass and summarized as added/removed lines.
 
     Examples:
         rcv diff swe swe/google
         rcv diff swe/google swe/meta -c 5
+        rcv diff swe swe/google --structural
+        rcv diff --against-parent --all
+        rcv diff swe --against-parent --subtree --full
     """
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
+    corrupt: List[MetadataError] = []
+
+    if against_parent:
+        if b is not None:
+            console.print("[red]--against-parent takes at most one resume name[/red]")
+            raise typer.Exit(1)
+        if all:
+            resumes = get_all_resumes(resumes_dir, corrupt)
+            print_metadata_errors(corrupt)
+        elif a is not None:
+            root = find_resume(resumes_dir, a, corrupt)
+            if root is None:
+                print_metadata_errors(corrupt)
+                console.print(f"[red]Resume not found:[/red] {a}")
+                raise typer.Exit(1)
+            resumes = [root, *root.get_all_descendants()] if subtree else [root]
+        else:
+            console.print("[red]Specify a resume name or --all[/red]")
+            raise typer.Exit(1)
+        diff_against_parents(resumes, resumes_dir, full, structural, context, jobs)
+        return
+
+    if a is None or b is None:
+        console.print(
+            "[red]Specify two resumes to compare, or use --against-parent[/red]"
+        )
+        raise typer.Exit(1)
 
     # Find both resumes
-    resume_a = find_resume(resumes_dir, a)
+    resume_a = find_resume(resumes_dir, a, corrupt)
     if resume_a is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {a}")
         raise typer.Exit(1)
 
-    resume_b = find_resume(resumes_dir, b)
+    resume_b = find_resume(resumes_dir, b, corrupt)
     if resume_b is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {b}")
         raise typer.Exit(1)
 
-    # Get resume files
-    file_a = resume_a.resume_file
-    file_b = resume_b.resume_file
-
-    if not file_a.exists():
-        console.print(f"[red]Resume file not found:[/red] {file_a}")
+    # Check resume sources (packed variants are expanded in memory)
+    if not resume_a.has_source():
+        console.print(f"[red]Resume file not found:[/red] {resume_a.resume_file}")
         raise typer.Exit(1)
 
-    if not file_b.exists():
-        console.print(f"[red]Resume file not found:[/red] {file_b}")
+    if not resume_b.has_source():
+        console.print(f"[red]Resume file not found:[/red] {resume_b.resume_file}")
         raise typer.Exit(1)
 
     # Read contents
-    content_a = file_a.read_text().splitlines(keepends=True)
-    content_b = file_b.read_text().splitlines(keepends=True)
+    source_a = resume_a.read_source()
+    source_b = resume_b.read_source()
 
-    # Generate diff
-    diff_lines = list(
-        difflib.unified_diff(
-            content_a,
-            content_b,
-            fromfile=a,
-            tofile=b,
-            n=context,
+    if structural:
+        parses = SectionCache(resumes_dir)
+        result = structural_diff(
+            parses.parse(source_a, resume_a.metadata.format),
+            parses.parse(source_b, resume_b.metadata.format),
         )
-    )
-
-    if not diff_lines:
-        console.print(f"[green]No differences between {a} and {b}[/green]")
+        parses.save()
+        if not result.changes and not result.reordered:
+            console.print(f"[green]No differences between {a} and {b}[/green]")
+            return
+        console.print(f"[bold]--- {a}[/bold]\n[bold]+++ {b}[/bold]\n")
+        print_structural_diff(result)
         return
 
-    # Print diff with syntax highlighting
-    diff_text = "".join(diff_lines)
-    syntax = Syntax(diff_text, "diff", theme="monokai", line_numbers=False)
-    console.print(syntax)
+    if not print_text_diff(source_a, source_b, a, b, context):
+        console.print(f"[green]No differences between {a} and {b}[/green]")
@@ -5,7 +5,8 @@ from rich.console import Console
 from rich.table import Table
 
 from rcv.core.config import Config
-from rcv.core.resume import get_all_resumes
+from rcv.core.resume import MetadataError, get_all_resumes
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
@@ -32,7 +33,9 @@ def list_resumes(
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
-    resumes = get_all_resumes(resumes_dir)
+    errors: list[MetadataError] = []
+    resumes = get_all_resumes(resumes_dir, errors)
+    print_metadata_errors(errors)
 
     if not resumes:
         console.print("[dim]No resumes found. Create one with 'rcv new <name>'[/dim]")
@@ -60,7 +63,12 @@ def list_resumes(
     table.add_column("Status")
 
     for resume in resumes:
-        status = "[dim]archived[/dim]" if resume.metadata.archived else ""
+        states = []
+        if resume.metadata.archived:
+            states.append("archived")
+        if resume.is_packed:
+            states.append("packed")
+        status = f"[dim]{', '.join(states)}[/dim]" if states else ""
         tags_str = (
             ", ".join(resume.metadata.tags) if resume.metadata.tags else "[dim]-[/dim]"
         )
@@ -0,0 +1,124 @@
+"""Match command - Rank resumes against a job description."""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from rcv.core.cache import HashCache
+from rcv.core.config import Config
+from rcv.core.drift import hash_sources
+from rcv.core.match import TermVectorCache, rank, tokenize
+from rcv.core.resume import MetadataError, Resume, get_all_resumes
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def match(
+    job_description: Path = typer.Argument(
+        ...,
+        help="Text file with the job description",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    top: int = typer.Option(
+        10,
+        "--top",
+        "-k",
+        help="Number of resumes to show",
+    ),
+    keywords: int = typer.Option(
+        8,
+        "--keywords",
+        help="Number of matching/missing keywords to show per resume",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
+) -> None:
+    """Rank resumes by how well they fit a job description.
+
+    Resume sources are reduced to keywords (LaTeX/typst markup stripped)
+    and scored with TF-IDF cosine similarity. Keyword counts are cached by
+    content hash, so unchanged resumes are never re-tokenized.
+
+    Examples:
+        rcv match jd.txt
+        rcv match postings/acme.txt -k 3 --keywords 12
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    try:
+        query = tokenize(job_description.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError) as e:
+        console.print(f"[red]Failed to read job description:[/red] {e}")
+        raise typer.Exit(1)
+    if not query:
+        console.print("[red]No keywords found in the job description[/red]")
+        raise typer.Exit(1)
+
+    corrupt: List[MetadataError] = []
+    resumes = [
+        r
+        for r in get_all_resumes(resumes_dir, corrupt)
+        if all or not r.metadata.archived
+    ]
+    print_metadata_errors(corrupt)
+    hashes = HashCache(resumes_dir)
+    source_hashes = hash_sources(resumes, hashes, jobs)
+    hashes.save()
+
+    by_hash: Dict[str, List[Resume]] = {}
+    for resume in resumes:
+        digest = source_hashes.get(resume.path)
+        if digest is not None:
+            by_hash.setdefault(digest, []).append(resume)
+    if not by_hash:
+        console.print("[dim]No resumes found.[/dim]")
+        return
+
+    vectors = TermVectorCache(resumes_dir)
+    unreadable: List[str] = []
+    documents = vectors.load(
+        {d: members[0] for d, members in by_hash.items()}, jobs, unreadable
+    )
+    vectors.save()
+    for digest in unreadable:
+        names = ", ".join(resume.full_name for resume in by_hash[digest])
+        console.print(f"[yellow]Skipping unreadable source:[/yellow] {names}")
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("#", justify="right")
+    table.add_column("Resume")
+    table.add_column("Score", justify="right")
+    table.add_column("Matching keywords")
+    table.add_column("Missing keywords")
+
+    position = 0
+    for result in rank(query, documents, limit=top, keywords=keywords):
+        for resume in by_hash[result.key]:
+            position += 1
+            if position > top:
+                break
+            table.add_row(
+                str(position),
+                resume.full_name,
+                f"{result.score:.0%}",
+                f"[green]{', '.join(result.overlap) or '-'}[/green]",
+                f"[yellow]{', '.join(result.missing) or '-'}[/yellow]",
+            )
+    console.print(table)
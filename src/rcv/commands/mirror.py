@@ -0,0 +1,291 @@
+"""Mirror commands - Work on a local copy of a project on a synced drive."""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from rcv.core.config import Config
+from rcv.core.mirror import (
+    MIRROR_PENDING_FILE,
+    NO_MIRROR_ENV,
+    Mirror,
+    SyncResult,
+    is_mirror,
+)
+
+console = Console()
+
+app = typer.Typer(
+    help="Keep a local working copy of a project on iCloud or a network drive",
+    no_args_is_help=True,
+)
+
+# Seconds a scheduled write-back waits, so consecutive commands share a batch.
+WRITEBACK_DELAY = 2.0
+# A pending marker older than this belongs to a write-back that died.
+STALE_PENDING_SECONDS = 600
+# Seconds between the checks for synced-folder edits made before commands.
+ORIGIN_CHECK_INTERVAL = 60.0
+
+
+def open_mirror(config: Config) -> Mirror:
+    """Get the mirror of the current project, or exit if mirroring is off."""
+    resumes_dir = config.get_resumes_dir()
+    if config.origin_dir is not None:
+        return Mirror(config.origin_dir, resumes_dir)
+    if is_mirror(resumes_dir):
+        return Mirror.for_local(resumes_dir)
+    if config.mirror:
+        return Mirror(resumes_dir)
+    console.print("[red]Mirror mode is not enabled.[/red] Run 'rcv mirror enable'.")
+    raise typer.Exit(1)
+
+
+def print_result(result: SyncResult, verb: str) -> None:
+    for relpath in result.copied:
+        console.print(f"[green]{verb}[/green] {relpath}")
+    for relpath in result.deleted:
+        console.print(f"[red]deleted[/red] {relpath}")
+    for relpath in result.conflicts:
+        console.print(f"[yellow]conflict[/yellow] {relpath}")
+    for relpath, error in result.failed:
+        console.print(f"[red]Failed {relpath}:[/red] {error}")
+    console.print(
+        f"[dim]{len(result.copied)} copied, {len(result.deleted)} deleted, "
+        f"{len(result.conflicts)} conflict(s)[/dim]"
+    )
+    if result.conflicts:
+        console.print(
+            "[yellow]Conflicting files were changed on both sides and left "
+            "alone. Keep one version, then rerun with --force.[/yellow]"
+        )
+
+
+def pull_origin_changes() -> None:
+    """Bring synced-folder edits into the mirror before a command runs.
+
+    Called before every command. To keep commands off the slow
+    filesystem, the synced folder is checked at most once per
+    ORIGIN_CHECK_INTERVAL, and only for edited files (sources, assets,
+    configuration), not rcv's state or PDFs; `rcv mirror pull` checks
+    everything. Refuses to run the command if an edited file also
+    changed in the mirror.
+    """
+    try:
+        config = Config.load()
+    except (OSError, ValueError):
+        return
+    if config.origin_dir is None:
+        return
+    mirror = Mirror(config.origin_dir, config.get_resumes_dir())
+    if not mirror.origin_check_due(ORIGIN_CHECK_INTERVAL):
+        return
+    if not mirror.origin_changed(edits_only=True):
+        return
+    result = mirror.pull()
+    if result.copied or result.deleted:
+        console.print(
+            f"[dim]Pulled {len(result.copied) + len(result.deleted)} file(s) "
+            "changed in the synced folder[/dim]"
+        )
+    if result.conflicts or result.failed:
+        for relpath in result.conflicts:
+            console.print(f"[yellow]conflict[/yellow] {relpath}")
+        for relpath, error in result.failed:
+            console.print(f"[red]Failed {relpath}:[/red] {error}")
+        console.print(
+            "[red]The local copy is out of date with the synced folder.[/red] "
+            "Keep one version with 'rcv mirror pull --force' or "
+            "'rcv mirror push --force', or set RCV_NO_MIRROR=1 to work on the "
+            "synced folder directly."
+        )
+        raise typer.Exit(1)
+
+
+def schedule_writeback() -> None:
+    """Start a background push if the current project's mirror has changes.
+
+    Called after every command. At most one write-back is pending at a
+    time; it waits briefly and then pushes everything changed so far.
+    """
+    try:
+        config = Config.load()
+    except (OSError, ValueError):
+        return
+    if config.origin_dir is None:
+        return
+    mirror = Mirror(config.origin_dir, config.get_resumes_dir())
+    if mirror.conflicts:
+        console.print(
+            f"[yellow]Mirror has {len(set(mirror.conflicts))} conflict(s); "
+            f"see 'rcv mirror status'[/yellow]"
+        )
+    if not mirror.local_changes():
+        return
+
+    pending = mirror.local / MIRROR_PENDING_FILE
+    try:
+        if time.time() - pending.stat().st_mtime < STALE_PENDING_SECONDS:
+            return  # a write-back is already scheduled and will pick this up
+    except FileNotFoundError:
+        pass
+    pending.touch()
+    subprocess.Popen(
+        [sys.executable, "-m", "rcv.cli", "mirror", "push", "--scheduled", "-q"],
+        cwd=mirror.local,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+@app.command()
+def enable(
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Number of parallel copies (default: 8)"
+    ),
+) -> None:
+    """Turn on mirror mode and make the initial local copy.
+
+    From then on, rcv commands run in the project work on a copy in the
+    local cache directory and write changes back in the background.
+    Files edited in the synced folder are pulled in before each command.
+
+    Examples:
+        rcv mirror enable
+    """
+    os.environ[NO_MIRROR_ENV] = "1"
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    if is_mirror(resumes_dir):
+        console.print("[red]This is a mirror; run the command in the project.[/red]")
+        raise typer.Exit(1)
+
+    if not config.mirror:
+        config.mirror = True
+        config.save()
+    mirror = Mirror(resumes_dir)
+    console.print(f"[dim]Copying {resumes_dir} to {mirror.local}...[/dim]")
+    result = mirror.pull(jobs=jobs)
+    if result.failed:
+        print_result(result, "pulled")
+        raise typer.Exit(1)
+    console.print(
+        f"[green]Mirror enabled:[/green] {len(mirror.files)} file(s) in {mirror.local}"
+    )
+    console.print(f"[dim]Edit your resumes in {mirror.local}[/dim]")
+
+
+@app.command()
+def disable(
+    remove: bool = typer.Option(
+        False, "--remove", help="Delete the local copy after writing it back"
+    ),
+) -> None:
+    """Write back pending changes and turn mirror mode off.
+
+    Examples:
+        rcv mirror disable --remove
+    """
+    config = Config.load()
+    mirror = open_mirror(config)
+    if mirror.exists:
+        result = mirror.push()
+        if result.conflicts or result.failed:
+            print_result(result, "pushed")
+            console.print(
+                "[red]Mirror left enabled until the conflicts are fixed[/red]"
+            )
+            raise typer.Exit(1)
+
+    origin_config = Config.load_from_project_dir(mirror.origin)
+    origin_config.mirror = False
+    origin_config.save()
+    if remove and mirror.local.is_dir():
+        shutil.rmtree(mirror.local)
+    console.print("[green]Mirror disabled[/green]")
+
+
+@app.command()
+def pull(
+    force: bool = typer.Option(
+        False, "--force", help="Overwrite local changes that conflict"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Number of parallel copies (default: 8)"
+    ),
+) -> None:
+    """Bring changes made in the synced folder into the local copy.
+
+    Examples:
+        rcv mirror pull
+    """
+    mirror = open_mirror(Config.load())
+    print_result(mirror.pull(force=force, jobs=jobs), "pulled")
+
+
+@app.command()
+def push(
+    force: bool = typer.Option(
+        False, "--force", help="Overwrite synced files that conflict"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Number of parallel copies (default: 8)"
+    ),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print nothing"),
+    scheduled: bool = typer.Option(False, "--scheduled", hidden=True),
+) -> None:
+    """Write local changes back to the synced folder now.
+
+    Examples:
+        rcv mirror push
+    """
+    mirror = open_mirror(Config.load())
+    if scheduled:
+        time.sleep(WRITEBACK_DELAY)
+        # Changes from here on schedule a new write-back.
+        (mirror.local / MIRROR_PENDING_FILE).unlink(missing_ok=True)
+    result = mirror.push(force=force, jobs=jobs)
+    if not quiet:
+        print_result(result, "pushed")
+    if result.conflicts or result.failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def status() -> None:
+    """Show pending changes on both sides and unresolved conflicts.
+
+    Examples:
+        rcv mirror status
+    """
+    mirror = open_mirror(Config.load())
+    console.print(f"[bold]Origin:[/bold] {mirror.origin}")
+    console.print(f"[bold]Local copy:[/bold] {mirror.local}")
+    if not mirror.exists:
+        console.print("[yellow]No local copy yet; run 'rcv mirror pull'[/yellow]")
+        return
+    for label, value in (("pulled", mirror.pulled_at), ("pushed", mirror.pushed_at)):
+        if value is not None:
+            console.print(f"[dim]Last {label}: {value:%Y-%m-%d %H:%M:%S}[/dim]")
+
+    state = mirror.status()
+    sections = (
+        ("Not yet written back", state.local_changes, "green"),
+        ("Changed in the synced folder", state.origin_changes, "cyan"),
+        ("Conflicts", state.conflicts, "yellow"),
+    )
+    for title, paths, style in sections:
+        if paths:
+            console.print(f"\n[bold]{title}:[/bold]")
+            for relpath in paths:
+                console.print(f"  [{style}]{relpath}[/{style}]")
+    if not any(paths for _, paths, _ in sections):
+        console.print("[green]Local copy and synced folder are in sync[/green]")
@@ -1,6 +1,8 @@
 """New command - Create a new base resume."""
 
+import os
 import shutil
+import uuid
 from pathlib import Path
 from typing import Optional
 
@@ -8,12 +10,37 @@ import typer
 from rich.console import Console
 
 from rcv.core.config import Config
-from rcv.core.resume import Resume
+from rcv.core.resume import Resume, ResumeMetadata, find_seed_file, seed_format
 from rcv.utils.completion import complete_resume_format, complete_seed_file
 
 console = Console()
 
 
+def create_resume(
+    path: Path,
+    format: str,
+    seed_file: Optional[Path] = None,
+    metadata: Optional[ResumeMetadata] = None,
+) -> Resume:
+    """Create a base resume at path, optionally seeded from a file.
+
+    The resume is assembled in a hidden directory next to path and renamed
+    into place, so a failure never leaves a partial resume behind.
+    """
+    staging = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        created = Resume.create(staging, format=format, metadata=metadata)
+        # Place the seed itself as resume.<ext>, keeping its bytes and
+        # timestamps
+        if seed_file is not None:
+            shutil.copy2(seed_file, created.resume_file)
+        os.rename(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return Resume.load(path)
+
+
 def new(
     name: str = typer.Argument(..., help="Name for the new resume"),
     format: str = typer.Option(
@@ -39,32 +66,19 @@ def new(
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
-    template_content: Optional[str] = None
     template_format: Optional[str] = None
     source_file_path: Optional[Path] = None
 
     if source is not None:
         # --from accepts only file paths (tex/typ)
-        source_path = Path(source)
-        candidates = []
-        if source_path.is_absolute():
-            candidates.append(source_path)
-        else:
-            candidates.append(Path.cwd() / source_path)
-            candidates.append(resumes_dir / source_path)
-
-        for candidate in candidates:
-            if candidate.is_file() and candidate.suffix in {".tex", ".typ"}:
-                source_file_path = candidate
-                template_format = "latex" if candidate.suffix == ".tex" else "typst"
-                break
-
+        source_file_path = find_seed_file(source, [Path.cwd(), resumes_dir])
         if source_file_path is None:
             console.print(
                 f"[red]Source not found:[/red] {source}\n"
                 "Provide a .tex/.typ file path (absolute, cwd-relative, or project-root-relative)."
             )
             raise typer.Exit(1)
+        template_format = seed_format(source_file_path)
 
     if template_format is not None and format is not None:
         if format != template_format:
@@ -92,22 +106,7 @@ def new(
         console.print(f"[red]Resume already exists:[/red] {name}")
         raise typer.Exit(1)
 
-    # If sourcing from a file path, copy its content; otherwise use template_content
-    if source_file_path is not None:
-        template_content = source_file_path.read_text()
-
-    # Create the resume
-    resume = Resume.create(
-        resume_path, format=format, template_content=template_content
-    )
-
-    # If sourcing from a file path, ensure the file is placed as resume.<ext>
-    if source_file_path is not None:
-        dest_file = resume.resume_file
-        if dest_file.exists():
-            dest_file.unlink()
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_file_path, dest_file)
+    resume = create_resume(resume_path, format, source_file_path)
 
     console.print(f"[green]Created new resume:[/green] {name}")
     if source is not None:
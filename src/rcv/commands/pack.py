@@ -0,0 +1,209 @@
+"""Pack commands - Store cold variants as deltas against their parent."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from rcv.core.config import Config
+from rcv.core.objects import ObjectStore
+from rcv.core.pack import (
+    PackError,
+    collect_garbage,
+    is_cold,
+    pack_resume,
+    referenced_objects,
+    repack_resume,
+)
+from rcv.core.resume import MetadataError, Resume, find_resume, get_all_resumes
+from rcv.core.snapshots import referenced_objects as snapshot_objects
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count for display."""
+    if abs(num_bytes) < 1024:
+        return f"{num_bytes} B"
+    size = num_bytes / 1024
+    for unit in ("KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _select_resumes(
+    resumes_dir: Path, name: Optional[str], recursive: bool
+) -> List[Resume]:
+    """Resolve the resumes a pack/unpack command operates on."""
+    if name is None:
+        return get_all_resumes(resumes_dir)
+
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
+    if resume is None:
+        print_metadata_errors(corrupt)
+        console.print(f"[red]Resume not found:[/red] {name}")
+        raise typer.Exit(1)
+
+    if recursive:
+        return [resume, *resume.get_all_descendants()]
+    return [resume]
+
+
+def pack(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Resume to pack. Omit to select from the whole project.",
+        shell_complete=complete_resume_name,
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Also consider all descendants of NAME",
+    ),
+    archived: bool = typer.Option(
+        False,
+        "--archived",
+        help="Only pack archived variants",
+    ),
+    cold: Optional[float] = typer.Option(
+        None,
+        "--cold",
+        help="Only pack variants not modified for this many days",
+    ),
+) -> None:
+    """Pack variant sources into the project object store.
+
+    Each packed variant's resume file is replaced by a compressed delta
+    against its parent, stored under .rcv/objects. Commands that need the
+    file (build, watch, branch) unpack it transparently; diff reads it
+    without unpacking.
+
+    Examples:
+        rcv pack swe/old-company
+        rcv pack --archived
+        rcv pack swe -r --cold 90
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    if name is None and not archived and cold is None:
+        console.print(
+            "[red]Nothing selected:[/red] pass a resume name, --archived or --cold DAYS."
+        )
+        raise typer.Exit(1)
+
+    candidates = _select_resumes(resumes_dir, name, recursive or name is None)
+    candidates = [r for r in candidates if not r.is_packed and r.parent_path]
+    if archived:
+        candidates = [r for r in candidates if r.metadata.archived]
+    if cold is not None:
+        candidates = [r for r in candidates if is_cold(r, cold)]
+
+    if not candidates:
+        console.print("[dim]No variants to pack.[/dim]")
+        return
+
+    store = ObjectStore.for_project(resumes_dir)
+    packed = 0
+    saved = 0
+    for resume in candidates:
+        try:
+            result = pack_resume(resume, store)
+        except PackError as e:
+            console.print(f"[yellow]Skipped {resume.full_name}:[/yellow] {e}")
+            continue
+        packed += 1
+        saved += result.saved
+        console.print(
+            f"[green]Packed:[/green] {resume.full_name} "
+            f"[dim]({_format_size(result.original_size)} -> "
+            f"{_format_size(result.stored_size)})[/dim]"
+        )
+
+    console.print(
+        f"[bold]Packed {packed} variant(s), saved ~{_format_size(saved)}[/bold]"
+    )
+
+
+def unpack(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Resume to unpack. Omit with --all to unpack everything.",
+        shell_complete=complete_resume_name,
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Also unpack all descendants of NAME",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Unpack every packed resume in the project",
+    ),
+) -> None:
+    """Restore packed resume sources back to regular files.
+
+    Examples:
+        rcv unpack swe/old-company
+        rcv unpack --all
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    if name is None and not all:
+        console.print("[red]Nothing selected:[/red] pass a resume name or --all.")
+        raise typer.Exit(1)
+
+    resumes = [r for r in _select_resumes(resumes_dir, name, recursive) if r.is_packed]
+    if not resumes:
+        console.print("[dim]No packed resumes selected.[/dim]")
+        return
+
+    for resume in resumes:
+        resume.ensure_source_file()
+        console.print(f"[green]Unpacked:[/green] {resume.full_name}")
+
+
+def gc(
+    prune: bool = typer.Option(
+        True,
+        "--prune/--no-prune",
+        help="Delete objects no longer referenced by any resume",
+    ),
+) -> None:
+    """Repack packed variants and remove unreferenced objects.
+
+    Packed variants are re-delta'd against their parent's current source,
+    so siblings share one base and stale bases can be pruned. Objects
+    referenced by snapshot history are always kept.
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    store = ObjectStore.for_project(resumes_dir)
+
+    resumes = get_all_resumes(resumes_dir)
+    repacked = 0
+    for resume in resumes:
+        if resume.is_packed and repack_resume(resume, store):
+            repacked += 1
+    console.print(f"[green]Repacked:[/green] {repacked} variant(s)")
+
+    if not prune:
+        return
+
+    live = referenced_objects(get_all_resumes(resumes_dir))
+    live |= snapshot_objects(resumes_dir)
+    removed, freed = collect_garbage(store, live)
+    console.print(
+        f"[green]Pruned:[/green] {removed} object(s), freed {_format_size(freed)}"
+    )
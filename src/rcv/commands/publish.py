@@ -0,0 +1,126 @@
+"""Publish command - Mirror built PDFs to a synced folder."""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import typer
+from rich.console import Console
+
+from rcv.commands.build import ensure_output_settings, resolve_output_file
+from rcv.core.cache import HashCache
+from rcv.core.config import Config
+from rcv.core.publish import Publisher
+from rcv.core.resume import get_all_resumes
+
+console = Console()
+
+
+def publish(
+    destination: Path = typer.Argument(
+        ...,
+        help="Folder to mirror the output PDFs into",
+        file_okay=False,
+    ),
+    delete: bool = typer.Option(
+        False,
+        "--delete",
+        help="Remove PDFs in the destination that belong to no resume",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show what would be copied or removed without writing",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Also publish PDFs of archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel copies (default: 8)",
+    ),
+) -> None:
+    """Copy changed PDFs to a destination, mirroring the output layout.
+
+    Each resume's PDF is published to the same relative path it has under
+    output_dir. Only PDFs whose content differs from the destination are
+    copied, each through a temp file renamed into place, so sync clients
+    never upload partial or unchanged files.
+
+    Examples:
+        rcv publish ~/Library/Mobile\\ Documents/com~apple~CloudDocs/Resumes
+        rcv publish /mnt/share/resumes --delete
+        rcv publish ~/Dropbox/Resumes -n
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    ensure_output_settings(config)
+    output_root = config.get_output_root_dir().resolve()
+
+    destination = destination.expanduser().resolve()
+    if destination == output_root or output_root in destination.parents:
+        console.print("[red]Destination must be outside the output directory[/red]")
+        raise typer.Exit(1)
+
+    files: Dict[str, Path] = {}
+    keep = []
+    for resume in get_all_resumes(resumes_dir):
+        output_file = resolve_output_file(
+            resume.full_name, resume.resume_file, config, None
+        )
+        relpath = output_file.resolve().relative_to(output_root).as_posix()
+        if (all or not resume.metadata.archived) and output_file.is_file():
+            files[relpath] = output_file
+        else:
+            keep.append(relpath)
+
+    if not files and not delete:
+        console.print("[dim]No built PDFs to publish. Run rcv build --all first.[/dim]")
+        return
+
+    hashes = HashCache(resumes_dir)
+    publisher = Publisher(resumes_dir, destination, hashes, jobs)
+    try:
+        plan = publisher.plan(files, keep=keep, delete=delete)
+    except OSError as e:
+        console.print(f"[red]Failed to read PDFs:[/red] {e}")
+        raise typer.Exit(1)
+
+    if dry_run:
+        for relpath in plan.copy:
+            console.print(f"[green]would copy[/green]  {relpath}")
+        for relpath in plan.orphans:
+            console.print(f"[red]would remove[/red] {relpath}")
+        console.print(
+            f"[dim]{len(plan.copy)} to copy, {len(plan.unchanged)} unchanged, "
+            f"{len(plan.orphans)} to remove[/dim]"
+        )
+        publisher.save()
+        hashes.save()
+        return
+
+    result = publisher.publish(plan)
+    publisher.save()
+    hashes.save()
+
+    for relpath in result.copied:
+        console.print(f"[green]copied[/green]  {relpath}")
+    for relpath in result.removed:
+        console.print(f"[red]removed[/red] {relpath}")
+    for relpath, error in result.failed:
+        console.print(f"[red]Failed {relpath}:[/red] {error}")
+
+    summary = (
+        f"Published {len(result.copied)}, unchanged {len(plan.unchanged)}"
+        + (f", removed {len(result.removed)}" if delete else "")
+        + (f", failed {len(result.failed)}" if result.failed else "")
+    )
+    style = "red" if result.failed else "green"
+    console.print(f"[{style}]{summary}[/{style}]")
+    if result.failed:
+        raise typer.Exit(1)
@@ -0,0 +1,137 @@
+"""Render command - Generate templated resume sources from their data."""
+
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.markup import escape
+
+from rcv.core.cache import HashCache
+from rcv.core.config import Config
+from rcv.core.resume import MetadataError, find_resume, get_all_resumes
+from rcv.core.template import (
+    DATA_FILES,
+    RENDER_CHANGED,
+    RENDER_EDITED,
+    RENDER_FAILED,
+    RENDER_UNCHANGED,
+    Renderer,
+    is_templated,
+)
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def render(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Templated resume to render",
+        shell_complete=complete_resume_name,
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Render every templated resume that is not archived",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Overwrite sources that were edited by hand since the last render",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show which sources would change without writing",
+    ),
+) -> None:
+    """Render templated resumes from their template and data files.
+
+    A resume with a data.toml (or data.json) is rendered from the nearest
+    template.tex / template.typ in its directory or its parents, with the
+    data of its ancestors merged under its own. Each template is parsed
+    once per run, and a source is only rewritten when its rendered text
+    changed, so `rcv build --stale` rebuilds just those resumes.
+
+    Examples:
+        rcv render swe/google
+        rcv render --all
+        rcv render --all -n
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    if name is not None and all:
+        console.print("[red]Specify a resume name or --all, not both[/red]")
+        raise typer.Exit(1)
+    if name is not None:
+        corrupt: List[MetadataError] = []
+        resume = find_resume(resumes_dir, name, corrupt)
+        if resume is None:
+            print_metadata_errors(corrupt)
+            console.print(f"[red]Resume not found:[/red] {name}")
+            raise typer.Exit(1)
+        if not is_templated(resume):
+            console.print(
+                f"[red]{resume.full_name} is not templated[/red] "
+                f"(no {' or '.join(DATA_FILES)} in {resume.path})"
+            )
+            raise typer.Exit(1)
+        resumes = [resume]
+    elif all:
+        resumes = [
+            resume
+            for resume in get_all_resumes(resumes_dir)
+            if not resume.metadata.archived and is_templated(resume)
+        ]
+        if not resumes:
+            console.print(
+                "[dim]No templated resumes. Add a data.toml to a resume and a "
+                "template.tex (or .typ) to it or a parent.[/dim]"
+            )
+            return
+    else:
+        console.print("[red]Specify a resume name, or --all[/red]")
+        raise typer.Exit(1)
+
+    hashes = HashCache(resumes_dir)
+    renderer = Renderer(hashes)
+    counts = {
+        RENDER_CHANGED: 0,
+        RENDER_UNCHANGED: 0,
+        RENDER_EDITED: 0,
+        RENDER_FAILED: 0,
+    }
+    for resume in resumes:
+        result = renderer.render(resume, force=force, dry_run=dry_run)
+        counts[result.status] += 1
+        if result.status == RENDER_CHANGED:
+            verb = "would render" if dry_run else "rendered"
+            console.print(f"[green]{verb}[/green] {resume.full_name}")
+        elif result.status == RENDER_EDITED:
+            console.print(
+                f"[yellow]skipped[/yellow] {resume.full_name}: edited by hand "
+                "since the last render (use --force to overwrite)"
+            )
+        elif result.status == RENDER_FAILED:
+            console.print(
+                f"[red]Failed {resume.full_name}:[/red] {escape(result.error or '')}"
+            )
+    hashes.save()
+
+    summary = (
+        f"{'Would render' if dry_run else 'Rendered'} {counts[RENDER_CHANGED]}, "
+        f"unchanged {counts[RENDER_UNCHANGED]}"
+        + (f", skipped {counts[RENDER_EDITED]}" if counts[RENDER_EDITED] else "")
+        + (f", failed {counts[RENDER_FAILED]}" if counts[RENDER_FAILED] else "")
+    )
+    problems = counts[RENDER_EDITED] + counts[RENDER_FAILED]
+    style = "red" if problems else "green"
+    console.print(f"[{style}]{summary}[/{style}]")
+    console.print(f"[dim]{renderer.compiled} template(s) parsed[/dim]")
+    if problems:
+        raise typer.Exit(1)
@@ -0,0 +1,145 @@
+"""Report command - Summarize recorded builds without opening any PDF."""
+
+from typing import List, Optional, Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from rcv.commands.build import page_budget_for
+from rcv.core.config import Config
+from rcv.core.manifest import BuildManifest, ManifestEntry
+from rcv.core.pages import PageCheck
+from rcv.core.resume import Resume, get_all_resumes
+
+console = Console()
+
+# Sort order of the page report: problems first.
+_OVER_BUDGET, _OVERFULL, _OK, _UNCHECKED, _NOT_BUILT = range(5)
+
+
+def page_status(check: Optional[PageCheck], built: bool) -> Tuple[int, str]:
+    """Classify a resume for the page report (sort key, table cell)."""
+    if not built:
+        return _NOT_BUILT, "[dim]not built[/dim]"
+    if check is None or check.pages is None:
+        return _UNCHECKED, "[dim]not checked[/dim]"
+    if check.over_budget:
+        return _OVER_BUDGET, "[red]over budget[/red]"
+    if check.overfull_count:
+        return _OVERFULL, "[yellow]overfull boxes[/yellow]"
+    return _OK, "[green]ok[/green]"
+
+
+def report(
+    pages: bool = typer.Option(
+        False,
+        "--pages",
+        help="Report page counts against each resume's budget and overfull boxes",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+) -> None:
+    """Summarize the last build of every resume.
+
+    Everything comes from the build manifest written by `rcv build`, so
+    the report is instant on any tree and opens no PDF. With --pages, it
+    lists each resume's page count against its budget (max_pages in
+    .meta.json or .rcv.toml) and the overfull box warnings of its build,
+    problems first.
+
+    Examples:
+        rcv report
+        rcv report --pages
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resumes = get_all_resumes(resumes_dir)
+    if not all:
+        resumes = [r for r in resumes if not r.metadata.archived]
+    if not resumes:
+        console.print("[dim]No resumes found. Create one with 'rcv new <name>'[/dim]")
+        return
+
+    manifest = None
+    if config.output_dir is not None:
+        manifest = BuildManifest(config.get_output_root_dir(), resumes_dir)
+    entries = [
+        (resume, manifest.get(resume.full_name) if manifest is not None else None)
+        for resume in resumes
+    ]
+    if pages:
+        report_pages(entries, config)
+    else:
+        report_builds(entries)
+
+
+def report_builds(entries: List[Tuple[Resume, Optional[ManifestEntry]]]) -> None:
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Resume", style="cyan")
+    table.add_column("Built")
+    table.add_column("Profile")
+    table.add_column("Backend")
+    table.add_column("Pages", justify="right")
+
+    built = 0
+    for resume, entry in entries:
+        if entry is None:
+            table.add_row(resume.full_name, "[dim]never[/dim]", "", "", "")
+            continue
+        built += 1
+        table.add_row(
+            resume.full_name,
+            entry.built_at.strftime("%Y-%m-%d %H:%M"),
+            entry.profile or "[dim]final[/dim]",
+            entry.backend or f"[dim]{resume.metadata.format}[/dim]",
+            str(entry.pages) if entry.pages is not None else "[dim]-[/dim]",
+        )
+    console.print(table)
+    console.print(f"[dim]{built} of {len(entries)} resume(s) built[/dim]")
+
+
+def report_pages(
+    entries: List[Tuple[Resume, Optional[ManifestEntry]]], config: Config
+) -> None:
+    rows = []
+    for resume, entry in entries:
+        check = entry.page_check if entry is not None else None
+        budget = page_budget_for(resume, config)
+        if check is not None:
+            check.budget = budget
+        order, status = page_status(check, entry is not None)
+        rows.append((order, resume.full_name, check, budget, status))
+    rows.sort(key=lambda row: (row[0], row[1]))
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Resume", style="cyan")
+    table.add_column("Pages", justify="right")
+    table.add_column("Budget", justify="right")
+    table.add_column("Overfull", justify="right")
+    table.add_column("Status")
+    counts = [0] * 5
+    for order, name, check, budget, status in rows:
+        counts[order] += 1
+        has_pages = check is not None and check.pages is not None
+        table.add_row(
+            name,
+            str(check.pages) if has_pages else "[dim]-[/dim]",
+            str(budget) if budget is not None else "[dim]-[/dim]",
+            str(check.overfull_count) if check is not None else "[dim]-[/dim]",
+            status,
+        )
+    console.print(table)
+
+    summary = f"{len(rows)} resume(s): {counts[_OVER_BUDGET]} over budget"
+    summary += f", {counts[_OVERFULL]} with overfull boxes"
+    if counts[_NOT_BUILT]:
+        summary += f", {counts[_NOT_BUILT]} not built"
+    if counts[_UNCHECKED]:
+        summary += f", {counts[_UNCHECKED]} built without page checks"
+    style = "red" if counts[_OVER_BUDGET] else "green"
+    console.print(f"[{style}]{summary}[/{style}]")
@@ -0,0 +1,254 @@
+"""Search commands - Find text across all resume sources."""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import typer
+from rich.console import Console
+from rich.text import Text
+
+from rcv.core.cache import HashCache
+from rcv.core.config import Config
+from rcv.core.drift import hash_sources
+from rcv.core.resume import MetadataError, Resume, get_all_resumes
+from rcv.core.search import SearchIndex, terms
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def load_index(
+    resumes_dir: Path,
+    include_archived: bool,
+    jobs: Optional[int] = None,
+    resumes: Optional[List[Resume]] = None,
+) -> Tuple[SearchIndex, Dict[str, List[Resume]]]:
+    """Bring the search index up to date.
+
+    Returns the index and the selected resumes grouped by content hash.
+    Every resume is indexed so that toggling --all never forces a
+    reindex; archived ones are only filtered from the results. Callers
+    that already walked the project can pass its resumes; otherwise
+    resumes with corrupt metadata are reported and left out.
+    """
+    if resumes is None:
+        corrupt: List[MetadataError] = []
+        resumes = get_all_resumes(resumes_dir, corrupt)
+        print_metadata_errors(corrupt)
+    hashes = HashCache(resumes_dir)
+    source_hashes = hash_sources(resumes, hashes, jobs)
+    hashes.save()
+
+    sources: Dict[str, Resume] = {}
+    by_hash: Dict[str, List[Resume]] = {}
+    for resume in resumes:
+        digest = source_hashes.get(resume.path)
+        if digest is None:
+            continue
+        sources.setdefault(digest, resume)
+        if include_archived or not resume.metadata.archived:
+            by_hash.setdefault(digest, []).append(resume)
+
+    index = SearchIndex(resumes_dir)
+    index.update(sources)
+    index.save()
+    return index, by_hash
+
+
+def _with_context(numbers: List[int], total: int, context: int) -> List[int]:
+    shown = set()
+    for number in numbers:
+        shown.update(range(max(1, number - context), min(total, number + context) + 1))
+    return sorted(shown)
+
+
+def print_matches(
+    by_hash: Dict[str, List[Resume]],
+    matches: Dict[str, List[int]],
+    pattern: re.Pattern,
+    context: int,
+    names_only: bool,
+) -> int:
+    """Print matching lines grouped by resume name; returns resumes matched."""
+    found = sorted(
+        (resume.full_name, resume, digest)
+        for digest, numbers in matches.items()
+        if numbers
+        for resume in by_hash.get(digest, [])
+    )
+    for name, resume, digest in found:
+        if names_only:
+            console.print(name, highlight=False)
+            continue
+        console.print(f"[bold magenta]{name}[/bold magenta]")
+        try:
+            lines = resume.read_source().splitlines()
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Could not read source:[/yellow] {e}\n")
+            continue
+        hits = set(matches[digest])
+        previous = 0
+        for number in _with_context(matches[digest], len(lines), context):
+            if previous and number > previous + 1:
+                console.print("[dim]  --[/dim]")
+            previous = number
+            separator = ":" if number in hits else "-"
+            line = Text(f"{number:>5}{separator} ", style="dim")
+            body = Text(lines[number - 1])
+            if number in hits:
+                body.highlight_regex(pattern, style="bold red")
+            line.append_text(body)
+            console.print(line)
+        console.print()
+    return len(found)
+
+
+def grep(
+    pattern: str = typer.Argument(..., help="Regular expression to search for"),
+    ignore_case: bool = typer.Option(
+        False,
+        "--ignore-case",
+        "-i",
+        help="Match case-insensitively",
+    ),
+    fixed: bool = typer.Option(
+        False,
+        "--fixed-strings",
+        "-F",
+        help="Treat the pattern as a literal string",
+    ),
+    context: int = typer.Option(
+        0,
+        "--context",
+        "-C",
+        help="Number of context lines around matches",
+    ),
+    names_only: bool = typer.Option(
+        False,
+        "--files-with-matches",
+        "-l",
+        help="Only print the names of matching resumes",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
+) -> None:
+    """Search resume sources for a regular expression.
+
+    Only resume sources are searched (no PDFs or build files), and each
+    distinct source is scanned once however many resumes share it. Plain
+    word patterns still match inside words, but are narrowed with the
+    search index so that sources without a match are not read.
+
+    Examples:
+        rcv grep Kubernetes
+        rcv grep -i "acme (corp|inc)" -C 1
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    source = re.escape(pattern) if fixed else pattern
+    try:
+        regex = re.compile(source, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        console.print(f"[red]Invalid pattern:[/red] {e}")
+        raise typer.Exit(1)
+
+    index, by_hash = load_index(resumes_dir, all, jobs)
+
+    # A pattern that is literal text of words can be narrowed via the
+    # index; anything else scans every source. Sources the index could
+    # not read are scanned anyway rather than ruled out.
+    candidates = list(by_hash)
+    if re.fullmatch(r"[\w ]+", pattern):
+        hits = index.literal_candidates(pattern)
+        if hits is not None:
+            candidates = [d for d in candidates if d in hits or d not in index]
+
+    matches: Dict[str, List[int]] = {}
+    for digest in candidates:
+        try:
+            lines = by_hash[digest][0].read_source().splitlines()
+        except (OSError, ValueError):
+            names = ", ".join(resume.full_name for resume in by_hash[digest])
+            console.print(f"[yellow]Skipping unreadable source:[/yellow] {names}")
+            continue
+        numbers = [n for n, line in enumerate(lines, start=1) if regex.search(line)]
+        if numbers:
+            matches[digest] = numbers
+
+    if not print_matches(by_hash, matches, regex, context, names_only):
+        console.print(f"[dim]No matches for {pattern!r}[/dim]")
+        raise typer.Exit(1)
+
+
+def search(
+    query: List[str] = typer.Argument(..., help="Words to search for"),
+    any_term: bool = typer.Option(
+        False,
+        "--any",
+        help="Match resumes containing any of the words instead of all",
+    ),
+    context: int = typer.Option(
+        0,
+        "--context",
+        "-C",
+        help="Number of context lines around matches",
+    ),
+    names_only: bool = typer.Option(
+        False,
+        "--files-with-matches",
+        "-l",
+        help="Only print the names of matching resumes",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
+) -> None:
+    """Find resumes containing words, using the persistent search index.
+
+    Words match case-insensitively and whole; a resume matches when it
+    contains every word (or any, with --any). The index is refreshed
+    first, re-reading only sources whose content changed.
+
+    Examples:
+        rcv search kubernetes
+        rcv search kafka spark --any -l
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    words = [term for word in query for term in terms(word)]
+    if not words:
+        console.print("[red]No searchable words in query[/red]")
+        raise typer.Exit(1)
+
+    index, by_hash = load_index(resumes_dir, all, jobs)
+    matches = index.search(words, match_all=not any_term)
+    matches = {d: lines for d, lines in matches.items() if d in by_hash}
+
+    regex = re.compile(
+        r"\b(" + "|".join(re.escape(w) for w in words) + r")\b", re.IGNORECASE
+    )
+    if not print_matches(by_hash, matches, regex, context, names_only):
+        console.print(f"[dim]No resumes match {' '.join(query)!r}[/dim]")
+        raise typer.Exit(1)
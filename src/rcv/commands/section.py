@@ -0,0 +1,281 @@
+"""Section commands - Share resume sections through the project library."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from rcv.core.config import Config
+from rcv.core.library import (
+    LIBRARY_DIR,
+    LibraryError,
+    SectionEdit,
+    UnreadableSourceError,
+    apply_edit,
+    library_dir,
+    library_file,
+    normalize_section,
+    plan_extract,
+    plan_inline,
+    section_slug,
+    section_users,
+)
+from rcv.core.resume import MetadataError, Resume, find_resume, get_all_resumes
+from rcv.core.storage import atomic_write_text
+from rcv.core.template import is_templated
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+app = typer.Typer(
+    help="Share sections between resumes through assets/sections",
+    no_args_is_help=True,
+)
+
+# Resume names listed per section before summarizing the rest.
+SHOWN_USERS = 3
+
+
+def load_editable(resumes_dir: Path, name: str) -> Resume:
+    """Find a resume whose source can be edited, or exit."""
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
+    if resume is None:
+        print_metadata_errors(corrupt)
+        console.print(f"[red]Resume not found:[/red] {name}")
+        raise typer.Exit(1)
+    if not resume.has_source():
+        console.print(f"[red]Resume file not found:[/red] {resume.resume_file}")
+        raise typer.Exit(1)
+    if is_templated(resume):
+        console.print(
+            f"[red]{resume.full_name} is rendered from a template;[/red] "
+            "edit the template instead"
+        )
+        raise typer.Exit(1)
+    return resume
+
+
+def read_library_file(path: Path) -> str:
+    """A library section's text; bytes that are not UTF-8 are replaced."""
+    return path.read_bytes().decode("utf-8", errors="replace")
+
+
+@app.command()
+def extract(
+    name: str = typer.Argument(
+        ...,
+        help="Resume to take the section from",
+        shell_complete=complete_resume_name,
+    ),
+    title: str = typer.Argument(
+        ..., help='Section title, or a path such as "Experience/Acme"'
+    ),
+    as_name: Optional[str] = typer.Option(
+        None, "--as", help="Library name (default: derived from the title)"
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Also replace identical copies of the section in every other resume",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show what would change without writing",
+    ),
+) -> None:
+    """Move a section into the library and include it instead.
+
+    The section (its heading, content and subsections) is written to
+    assets/sections/<name>.tex (or .typ) and replaced in the resume by an
+    \\input (or #include) of that file. With --all, every other resume
+    holding the same section verbatim includes the library copy too.
+    If the library file exists, it must hold the same section.
+
+    Examples:
+        rcv section extract swe Experience
+        rcv section extract swe Education --all
+        rcv section extract swe/google "Experience/Acme" --as acme
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resume = load_editable(resumes_dir, name)
+    format = resume.metadata.format
+
+    slug = as_name or section_slug(title.split("/")[-1])
+    if section_slug(slug) != slug:
+        console.print(
+            f"[red]Invalid library name:[/red] {slug} "
+            "(use lowercase letters, digits and -)"
+        )
+        raise typer.Exit(1)
+    path = library_file(resumes_dir, slug, format)
+
+    try:
+        edit = plan_extract(resume, title, path)
+    except LibraryError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    if edit is None:
+        console.print(f"[red]No section '{title}' in {resume.full_name}[/red]")
+        raise typer.Exit(1)
+    wanted = normalize_section(edit.section)
+    exists = path.is_file()
+    if exists and normalize_section(read_library_file(path)) != wanted:
+        console.print(
+            f"[red]{LIBRARY_DIR / path.name} holds a different section;[/red] "
+            "choose another name with --as"
+        )
+        raise typer.Exit(1)
+
+    edits: List[SectionEdit] = [edit]
+    different = unreadable = 0
+    if all:
+        corrupt: List[MetadataError] = []
+        others = get_all_resumes(resumes_dir, corrupt)
+        print_metadata_errors(corrupt)
+        for other in others:
+            if (
+                other.path == resume.path
+                or other.metadata.format != format
+                or not other.has_source()
+                or is_templated(other)
+            ):
+                continue
+            try:
+                other_edit = plan_extract(other, title, path)
+            except UnreadableSourceError:
+                unreadable += 1
+                continue
+            except LibraryError:
+                other_edit = None
+            if other_edit is None:
+                continue
+            if normalize_section(other_edit.section) == wanted:
+                edits.append(other_edit)
+            else:
+                different += 1
+
+    prefix = "would " if dry_run else ""
+    if not dry_run:
+        if not exists:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, edit.section)
+        for change in edits:
+            apply_edit(change)
+
+    verb = "add" if not exists else "reuse"
+    console.print(f"[green]{prefix}{verb}[/green] {LIBRARY_DIR / path.name}")
+    for change in edits:
+        console.print(f"[green]{prefix}include in[/green] {change.resume.full_name}")
+    if different:
+        console.print(
+            f"[dim]{different} resume(s) have a different '{title}' "
+            "and keep their own copy[/dim]"
+        )
+    if unreadable:
+        console.print(
+            f"[yellow]Skipped {unreadable} resume(s) whose source is not "
+            "UTF-8 text[/yellow]"
+        )
+
+
+@app.command()
+def inline(
+    name: str = typer.Argument(
+        ...,
+        help="Resume that includes the section",
+        shell_complete=complete_resume_name,
+    ),
+    section: str = typer.Argument(..., help="Library name of the section"),
+) -> None:
+    """Replace a resume's include of a library section with its content.
+
+    Use this when one variant needs its own version of a shared section;
+    the library copy and the other resumes are left unchanged.
+
+    Examples:
+        rcv section inline swe/google experience
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resume = load_editable(resumes_dir, name)
+    path = library_file(resumes_dir, section, resume.metadata.format)
+    if not path.is_file():
+        console.print(
+            f"[red]Library section not found:[/red] {LIBRARY_DIR / path.name}"
+        )
+        raise typer.Exit(1)
+
+    try:
+        edit = plan_inline(resume, path)
+    except LibraryError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    if edit is None:
+        console.print(
+            f"[red]{resume.full_name} does not include {LIBRARY_DIR / path.name}[/red]"
+        )
+        raise typer.Exit(1)
+    apply_edit(edit)
+    console.print(
+        f"[green]Inlined[/green] {LIBRARY_DIR / path.name} into {resume.full_name}"
+    )
+
+
+@app.command(name="list")
+def list_sections() -> None:
+    """List library sections and the resumes that include them.
+
+    Examples:
+        rcv section list
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    files = sorted(
+        path
+        for path in library_dir(resumes_dir).glob("*")
+        if path.suffix in (".tex", ".typ")
+    )
+    if not files:
+        console.print(
+            "[dim]No library sections. Add one with "
+            "'rcv section extract <name> <title>'[/dim]"
+        )
+        return
+
+    corrupt: List[MetadataError] = []
+    unreadable: List[Resume] = []
+    users = section_users(
+        get_all_resumes(resumes_dir, corrupt), resumes_dir, unreadable
+    )
+    print_metadata_errors(corrupt)
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Section", style="cyan")
+    table.add_column("Lines", justify="right")
+    table.add_column("Used by", justify="right")
+    table.add_column("Resumes")
+    for path in files:
+        names = sorted(r.full_name for r in users.get(path.resolve(), []))
+        shown = ", ".join(names[:SHOWN_USERS])
+        if len(names) > SHOWN_USERS:
+            shown += f" [dim]+{len(names) - SHOWN_USERS} more[/dim]"
+        lines = len(read_library_file(path).splitlines())
+        table.add_row(
+            path.name,
+            str(lines),
+            str(len(names)) if names else "[yellow]unused[/yellow]",
+            shown,
+        )
+    console.print(table)
+    if unreadable:
+        console.print(
+            f"[yellow]Skipped {len(unreadable)} packed resume(s) that could "
+            "not be read[/yellow]"
+        )
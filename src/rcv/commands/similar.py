@@ -0,0 +1,181 @@
+"""Similar command - Find near-duplicate resumes with MinHash."""
+
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from rcv.core.cache import HashCache, JsonCache
+from rcv.core.config import Config
+from rcv.core.drift import hash_sources
+from rcv.core.resume import MetadataError, Resume, find_resume, get_all_resumes
+from rcv.core.similarity import (
+    Signature,
+    estimate_similarity,
+    minhash,
+    similar_clusters,
+    similar_pairs,
+)
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.parallel import process_map
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def load_signatures(
+    resumes: List[Resume], project_dir: Path, jobs: Optional[int] = None
+) -> Dict[str, Signature]:
+    """Get MinHash signatures keyed by resume name, cached by content hash."""
+    hashes = HashCache(project_dir)
+    cache = JsonCache.for_project(project_dir, "minhash")
+    source_hashes = hash_sources(resumes, hashes, jobs)
+
+    missing: Dict[str, Resume] = {}
+    for resume in resumes:
+        digest = source_hashes.get(resume.path)
+        if digest is not None and cache.get(digest) is None:
+            missing.setdefault(digest, resume)
+
+    digests: List[str] = []
+    texts: List[str] = []
+    for digest, resume in missing.items():
+        try:
+            texts.append(resume.read_source())
+        except (OSError, ValueError):
+            continue  # unreadable or not UTF-8, like the search index
+        digests.append(digest)
+    for digest, signature in zip(digests, process_map(minhash, texts, jobs)):
+        cache.set(digest, signature)
+
+    signatures: Dict[str, Signature] = {}
+    for resume in resumes:
+        digest = source_hashes.get(resume.path)
+        signature = cache.get(digest) if digest is not None else None
+        if signature is not None:
+            signatures[resume.full_name] = signature
+
+    hashes.save()
+    cache.save()
+    return signatures
+
+
+def similar(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Show the nearest neighbors of this resume instead of all pairs",
+        shell_complete=complete_resume_name,
+    ),
+    top: int = typer.Option(
+        10,
+        "--top",
+        "-k",
+        help="Number of pairs or neighbors to show",
+    ),
+    threshold: float = typer.Option(
+        0.5,
+        "--threshold",
+        "-t",
+        help="Minimum estimated similarity (0-1) for pairs and clusters",
+    ),
+    show_clusters: bool = typer.Option(
+        False,
+        "--clusters",
+        help="Group resumes into clusters of near-duplicates",
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
+) -> None:
+    """Find the most similar resumes across the project.
+
+    Uses MinHash signatures of word shingles (cached by content hash) and
+    locality-sensitive hashing, so only likely-similar pairs are compared.
+
+    Examples:
+        rcv similar
+        rcv similar --clusters -t 0.8
+        rcv similar swe/google -k 5
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    corrupt: List[MetadataError] = []
+    target: Optional[Resume] = None
+    if name is not None:
+        target = find_resume(resumes_dir, name, corrupt)
+        if target is None:
+            print_metadata_errors(corrupt)
+            console.print(f"[red]Resume not found:[/red] {name}")
+            raise typer.Exit(1)
+    resumes = [r for r in get_all_resumes(resumes_dir, corrupt) if r.has_source()]
+    print_metadata_errors(corrupt)
+    if not all:
+        target_path = target.path if target is not None else None
+        resumes = [
+            r for r in resumes if not r.metadata.archived or r.path == target_path
+        ]
+
+    signatures = load_signatures(resumes, resumes_dir, jobs)
+    if len(signatures) < 2:
+        console.print("[dim]Need at least two resumes to compare.[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+
+    if target is not None:
+        own = signatures.get(target.full_name)
+        if own is None:
+            console.print(f"[red]Cannot read resume source:[/red] {target.resume_file}")
+            raise typer.Exit(1)
+        neighbors = sorted(
+            (
+                (other, estimate_similarity(own, signature))
+                for other, signature in signatures.items()
+                if other != target.full_name
+            ),
+            key=lambda item: (-item[1], item[0]),
+        )[:top]
+        table.add_column("Resume")
+        table.add_column("Similarity", justify="right")
+        for other, score in neighbors:
+            table.add_row(other, f"{score:.0%}")
+        console.print(f"[bold]Nearest to {target.full_name}[/bold]")
+        console.print(table)
+        return
+
+    if show_clusters:
+        groups = similar_clusters(signatures, threshold)
+        if not groups:
+            console.print(f"[dim]No clusters at similarity >= {threshold:.0%}[/dim]")
+            return
+        table.add_column("#", justify="right")
+        table.add_column("Size", justify="right")
+        table.add_column("Resumes")
+        for index, members in enumerate(groups[:top], start=1):
+            table.add_row(str(index), str(len(members)), ", ".join(members))
+        console.print(table)
+        return
+
+    pairs = list(islice(similar_pairs(signatures, threshold), top))
+    if not pairs:
+        console.print(f"[dim]No pairs at similarity >= {threshold:.0%}[/dim]")
+        return
+    table.add_column("Resume A")
+    table.add_column("Resume B")
+    table.add_column("Similarity", justify="right")
+    for a, b, score in pairs:
+        table.add_row(a, b, f"{score:.0%}")
+    console.print(table)
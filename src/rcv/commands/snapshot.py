@@ -0,0 +1,275 @@
+"""Snapshot commands - Record and restore resume history."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from rcv.core.config import Config
+from rcv.core.objects import ObjectNotFoundError
+from rcv.core.resume import MetadataError, Resume, find_resume
+from rcv.core.snapshots import (
+    TRIGGER_RESTORE,
+    Snapshot,
+    SnapshotLog,
+    inputs_hash,
+    parse_snapshot_ref,
+)
+from rcv.core.storage import atomic_write_bytes, atomic_write_text
+from rcv.commands.build import resolve_output_file
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+
+def _find_resume_or_exit(resumes_dir: Path, name: str) -> Resume:
+    """Find a resume or exit with an error."""
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
+    if resume is None:
+        print_metadata_errors(corrupt)
+        console.print(f"[red]Resume not found:[/red] {name}")
+        raise typer.Exit(1)
+    return resume
+
+
+def _resolve_ref(resumes_dir: Path, ref: str) -> tuple[Resume, Snapshot]:
+    """Resolve "name@n" (or "name" for the latest) to a snapshot."""
+    try:
+        name, number = parse_snapshot_ref(ref)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    resume = _find_resume_or_exit(resumes_dir, name)
+    snapshot = SnapshotLog.for_resume(resume).get(number)
+    if snapshot is None:
+        label = f"#{number}" if number is not None else "snapshots"
+        console.print(f"[red]No {label} found for:[/red] {resume.full_name}")
+        raise typer.Exit(1)
+    return resume, snapshot
+
+
+def default_pdf_path(resume: Resume, config: Config) -> Optional[Path]:
+    """Get the configured default output PDF of a resume, if configured."""
+    if not config.output_dir or not config.output_pdf_name:
+        return None
+    return resolve_output_file(resume.full_name, resume.resume_file, config, None)
+
+
+def snapshot(
+    name: str = typer.Argument(
+        ...,
+        help="Name of the resume to snapshot",
+        shell_complete=complete_resume_name,
+    ),
+    message: str = typer.Option(
+        "",
+        "--message",
+        "-m",
+        help="Note stored with the snapshot",
+    ),
+    pdf: Optional[Path] = typer.Option(
+        None,
+        "--pdf",
+        help="PDF to store with the snapshot. Defaults to the resume's built output, if any.",
+    ),
+    no_pdf: bool = typer.Option(
+        False,
+        "--no-pdf",
+        help="Do not store a PDF with the snapshot",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Record a new snapshot even if nothing changed since the latest one",
+    ),
+) -> None:
+    """Record the current source (and built PDF) of a resume.
+
+    Snapshots are stored deduplicated and compressed under .rcv/. A
+    snapshot is also taken automatically after every successful build.
+
+    Examples:
+        rcv snapshot swe/google -m "sent to recruiter"
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resume = _find_resume_or_exit(resumes_dir, name)
+
+    if not resume.has_source():
+        console.print(f"[red]Resume file not found:[/red] {resume.resume_file}")
+        raise typer.Exit(1)
+
+    pdf_file = None
+    if not no_pdf:
+        pdf_file = pdf if pdf is not None else default_pdf_path(resume, config)
+        if pdf_file is not None and not pdf_file.exists():
+            if pdf is not None:
+                console.print(f"[red]PDF not found:[/red] {pdf}")
+                raise typer.Exit(1)
+            pdf_file = None
+
+    log = SnapshotLog.for_resume(resume)
+    try:
+        text = resume.read_source()
+        recorded, created = log.record(
+            text,
+            resume.metadata.format,
+            pdf_file=pdf_file,
+            message=message,
+            force=force,
+            inputs=inputs_hash(resume, text),
+        )
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Could not record snapshot:[/red] {e}")
+        raise typer.Exit(1)
+    if not created:
+        console.print(
+            f"[yellow]No changes since snapshot #{recorded.number}[/yellow] of {name}"
+        )
+        return
+
+    console.print(f"[green]Recorded snapshot #{recorded.number}[/green] of {name}")
+    if recorded.pdf is not None:
+        console.print("[dim]Included PDF[/dim]")
+
+
+def log(
+    name: str = typer.Argument(
+        ...,
+        help="Name of the resume",
+        shell_complete=complete_resume_name,
+    ),
+) -> None:
+    """Show the snapshot history of a resume.
+
+    Examples:
+        rcv log swe/google
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resume = _find_resume_or_exit(resumes_dir, name)
+
+    entries = SnapshotLog.for_resume(resume).entries()
+    if not entries:
+        console.print(f"[dim]No snapshots for {resume.full_name}[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("#", justify="right")
+    table.add_column("Date")
+    table.add_column("Trigger")
+    table.add_column("Source")
+    table.add_column("PDF")
+    table.add_column("Message")
+
+    for entry in reversed(entries):
+        table.add_row(
+            str(entry.number),
+            entry.created_at.strftime("%Y-%m-%d %H:%M"),
+            entry.trigger,
+            entry.source[:10],
+            "yes" if entry.pdf is not None else "[dim]-[/dim]",
+            entry.message or "[dim]-[/dim]",
+        )
+
+    console.print(table)
+
+
+def show(
+    ref: str = typer.Argument(
+        ...,
+        help="Snapshot reference: NAME@N, or NAME for the latest snapshot",
+        shell_complete=complete_resume_name,
+    ),
+    pdf: Optional[Path] = typer.Option(
+        None,
+        "--pdf",
+        help="Write the snapshot's PDF to this path instead of printing the source",
+    ),
+) -> None:
+    """Print the source of a snapshot, or extract its PDF.
+
+    Examples:
+        rcv show swe/google@3
+        rcv show swe/google@3 --pdf sent.pdf
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resume, entry = _resolve_ref(resumes_dir, ref)
+    log = SnapshotLog.for_resume(resume)
+
+    try:
+        if pdf is not None:
+            if entry.pdf is None:
+                console.print(f"[red]Snapshot #{entry.number} has no PDF[/red]")
+                raise typer.Exit(1)
+            atomic_write_bytes(pdf.expanduser(), log.store.get(entry.pdf))
+            console.print(f"[green]Wrote PDF:[/green] {pdf}")
+            return
+
+        typer.echo(log.store.get_text(entry.source), nl=False)
+    except ObjectNotFoundError as e:
+        console.print(f"[red]Snapshot object missing:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def restore(
+    ref: str = typer.Argument(
+        ...,
+        help="Snapshot reference: NAME@N, or NAME for the latest snapshot",
+        shell_complete=complete_resume_name,
+    ),
+) -> None:
+    """Restore a resume's source from a snapshot.
+
+    The current source is snapshotted first if it has unsaved changes, so
+    a restore can always be undone.
+
+    Examples:
+        rcv restore swe/google@3
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+    resume, entry = _resolve_ref(resumes_dir, ref)
+    log = SnapshotLog.for_resume(resume)
+
+    if entry.format != resume.metadata.format:
+        console.print(
+            "[red]Format mismatch:[/red] snapshot format differs from the resume format."
+        )
+        raise typer.Exit(1)
+
+    try:
+        text = log.store.get_text(entry.source)
+    except ObjectNotFoundError as e:
+        console.print(f"[red]Snapshot object missing:[/red] {e}")
+        raise typer.Exit(1)
+
+    if resume.has_source():
+        # Never overwrite a source that could not be saved first
+        try:
+            current_text = resume.read_source()
+            current, created = log.record(
+                current_text,
+                resume.metadata.format,
+                trigger=TRIGGER_RESTORE,
+                message=f"before restoring #{entry.number}",
+                inputs=inputs_hash(resume, current_text),
+            )
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Could not save the current source:[/red] {e}")
+            raise typer.Exit(1)
+        if created:
+            console.print(f"[dim]Saved current source as #{current.number}[/dim]")
+
+    resume_file = resume.ensure_source_file()
+    atomic_write_text(resume_file, text)
+    console.print(
+        f"[green]Restored[/green] {resume.full_name} [dim]from #{entry.number}[/dim]"
+    )
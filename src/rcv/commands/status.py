@@ -0,0 +1,123 @@
+"""Status command - Report how variants drifted from their parents."""
+
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from rcv.core.config import Config
+from rcv.core.drift import (
+    STATE_BEHIND,
+    STATE_DIVERGED,
+    STATE_EDITED,
+    STATE_MISSING,
+    STATE_UNCHANGED,
+    STATE_UNTRACKED,
+    LineCounts,
+    compute_drift,
+)
+from rcv.core.resume import MetadataError, find_resume, get_all_resumes
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+STATE_STYLES = {
+    STATE_UNCHANGED: "[dim]unchanged[/dim]",
+    STATE_EDITED: "[green]edited[/green]",
+    STATE_BEHIND: "[yellow]behind[/yellow]",
+    STATE_DIVERGED: "[red]diverged[/red]",
+    STATE_UNTRACKED: "[dim]untracked[/dim]",
+    STATE_MISSING: "[red]missing[/red]",
+}
+
+
+def format_counts(counts: Optional[LineCounts], unreadable: bool = False) -> str:
+    """Format (+added, -removed) line counts for a table cell."""
+    if counts is None:
+        return "[red]unreadable[/red]" if unreadable else "[dim]-[/dim]"
+    added, removed = counts
+    return f"[green]+{added}[/green] [red]-{removed}[/red]"
+
+
+def status(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Only report this resume's subtree",
+        shell_complete=complete_resume_name,
+    ),
+    all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Include archived resumes",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel workers (default: CPU count)",
+    ),
+) -> None:
+    """Show which variants diverged from or fell behind their parent.
+
+    Each variant is compared with the parent content recorded when it was
+    branched:
+
+    - edited: the variant changed since branching
+    - behind: the parent changed since branching
+    - diverged: both changed
+
+    Examples:
+        rcv status
+        rcv status swe
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    corrupt: List[MetadataError] = []
+    if name is not None:
+        root = find_resume(resumes_dir, name, corrupt)
+        if root is None:
+            print_metadata_errors(corrupt)
+            console.print(f"[red]Resume not found:[/red] {name}")
+            raise typer.Exit(1)
+        resumes = [root, *root.get_all_descendants(corrupt)]
+    else:
+        resumes = get_all_resumes(resumes_dir, corrupt)
+    print_metadata_errors(corrupt)
+
+    if not all:
+        resumes = [r for r in resumes if not r.metadata.archived]
+
+    reports = compute_drift(resumes, resumes_dir, jobs)
+    if not reports:
+        console.print("[dim]No variants found.[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Name")
+    table.add_column("State")
+    table.add_column("Local changes")
+    table.add_column("Parent changes")
+
+    counts: dict[str, int] = {}
+    for report in sorted(reports, key=lambda r: r.resume.full_name):
+        counts[report.state] = counts.get(report.state, 0) + 1
+        edited = report.state in (STATE_EDITED, STATE_DIVERGED)
+        behind = report.state in (STATE_BEHIND, STATE_DIVERGED)
+        table.add_row(
+            report.resume.full_name,
+            STATE_STYLES[report.state],
+            format_counts(report.local, report.unreadable and edited),
+            format_counts(report.behind, report.unreadable and behind),
+        )
+
+    console.print(table)
+    summary = ", ".join(f"{count} {state}" for state, count in sorted(counts.items()))
+    console.print(f"[dim]{summary}[/dim]")
+    if counts.get(STATE_UNTRACKED):
+        console.print(
+            "[dim]Untracked variants were branched before rcv recorded branch bases.[/dim]"
+        )
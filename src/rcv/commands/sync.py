@@ -0,0 +1,279 @@
+"""Sync command - Merge parent changes into descendant variants."""
+
+import difflib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import typer
+from rich.console import Console
+from rich.syntax import Syntax
+from rich.table import Table
+
+from rcv.core.config import Config
+from rcv.core.delta import diffstat
+from rcv.core.merge import MergeResult, merge3
+from rcv.core.objects import ObjectNotFoundError, ObjectStore, text_hash
+from rcv.core.resume import MetadataError, Resume, find_resume
+from rcv.core.snapshots import TRIGGER_SYNC, SnapshotLog, inputs_hash
+from rcv.core.storage import atomic_write_text
+from rcv.utils.completion import complete_resume_name
+from rcv.utils.parallel import process_map
+from rcv.utils.reporting import print_metadata_errors
+
+console = Console()
+
+RESULT_UP_TO_DATE = "up to date"
+RESULT_MERGED = "merged"
+RESULT_CONFLICT = "conflict"
+RESULT_UNTRACKED = "untracked"
+RESULT_NO_BASE = "base missing"
+RESULT_UNREADABLE = "unreadable"
+RESULT_PARENT_UNREADABLE = "parent unreadable"
+RESULT_PARENT_CONFLICT = "parent conflicted"
+
+RESULT_STYLES = {
+    RESULT_UP_TO_DATE: "[dim]up to date[/dim]",
+    RESULT_MERGED: "[green]merged[/green]",
+    RESULT_CONFLICT: "[red]conflict[/red]",
+    RESULT_UNTRACKED: "[yellow]untracked[/yellow]",
+    RESULT_NO_BASE: "[yellow]base missing[/yellow]",
+    RESULT_UNREADABLE: "[red]unreadable[/red]",
+    RESULT_PARENT_UNREADABLE: "[yellow]parent unreadable[/yellow]",
+    RESULT_PARENT_CONFLICT: "[yellow]parent conflicted[/yellow]",
+}
+
+
+@dataclass
+class SyncOutcome:
+    """Planned result of syncing one variant from its parent."""
+
+    resume: Resume
+    result: str
+    original: Optional[str] = None
+    merged: Optional[str] = None
+    parent_text: Optional[str] = None
+    conflicts: int = 0
+
+
+def _merge_job(args: Tuple[str, str, str]) -> MergeResult:
+    base, ours, theirs = args
+    return merge3(base, ours, theirs)
+
+
+def plan_sync(
+    root: Resume,
+    store: ObjectStore,
+    recursive: bool,
+    jobs: Optional[int] = None,
+    markers: bool = False,
+) -> List[SyncOutcome]:
+    """Compute merges for root's variants (and deeper levels if recursive).
+
+    Levels are processed top-down so a grandchild merges against its
+    parent's merged text; variants within a level merge in parallel.
+    A source that cannot be read fails only its own variant. Conflicted
+    variants keep their text unless markers will be written into them,
+    in which case their own variants are left for a later sync rather
+    than merged against the markers. Nothing is written.
+    """
+    texts: Dict[Path, Optional[str]] = {}
+    conflicted: Set[Path] = set()
+
+    def current_text(resume: Resume) -> Optional[str]:
+        if resume.path not in texts:
+            try:
+                texts[resume.path] = resume.read_source()
+            except (OSError, ValueError):
+                texts[resume.path] = None
+        return texts[resume.path]
+
+    outcomes: List[SyncOutcome] = []
+    level: List[Tuple[Resume, Resume]] = [(v, root) for v in root.get_variants()]
+    while level:
+        pending: List[Tuple[SyncOutcome, Tuple[str, str, str]]] = []
+        for variant, parent in level:
+            if not variant.has_source() or not parent.has_source():
+                continue
+            if parent.path in conflicted:
+                outcomes.append(SyncOutcome(variant, RESULT_PARENT_CONFLICT))
+                continue
+            parent_text = current_text(parent)
+            if parent_text is None:
+                outcomes.append(SyncOutcome(variant, RESULT_PARENT_UNREADABLE))
+                continue
+            base_hash = variant.metadata.base_hash
+            if base_hash is None:
+                outcomes.append(SyncOutcome(variant, RESULT_UNTRACKED))
+                continue
+            if text_hash(parent_text) == base_hash:
+                outcomes.append(SyncOutcome(variant, RESULT_UP_TO_DATE))
+                continue
+            try:
+                base_text = store.get_text(base_hash)
+            except ObjectNotFoundError:
+                outcomes.append(SyncOutcome(variant, RESULT_NO_BASE))
+                continue
+
+            ours = current_text(variant)
+            if ours is None:
+                outcomes.append(SyncOutcome(variant, RESULT_UNREADABLE))
+                continue
+            outcome = SyncOutcome(
+                variant, RESULT_MERGED, original=ours, parent_text=parent_text
+            )
+            outcomes.append(outcome)
+            pending.append((outcome, (base_text, ours, parent_text)))
+
+        results = process_map(_merge_job, [args for _, args in pending], jobs)
+        for (outcome, _), merged in zip(pending, results):
+            outcome.merged = merged.text
+            outcome.conflicts = merged.conflicts
+            if merged.clean:
+                texts[outcome.resume.path] = merged.text
+            else:
+                outcome.result = RESULT_CONFLICT
+                if markers:
+                    conflicted.add(outcome.resume.path)
+
+        if not recursive:
+            break
+        level = [(child, v) for v, _ in level for child in v.get_variants()]
+
+    return outcomes
+
+
+def apply_outcome(outcome: SyncOutcome, store: ObjectStore, markers: bool) -> bool:
+    """Write a planned merge to disk and advance the variant's branch base.
+
+    Returns True if the variant was updated.
+    """
+    if outcome.merged is None or outcome.parent_text is None:
+        return False
+    if outcome.result == RESULT_CONFLICT and not markers:
+        return False
+
+    resume = outcome.resume
+    if outcome.original is not None:
+        SnapshotLog.for_resume(resume).record(
+            outcome.original,
+            resume.metadata.format,
+            trigger=TRIGGER_SYNC,
+            message="before sync",
+            inputs=inputs_hash(resume, outcome.original),
+        )
+
+    resume_file = resume.ensure_source_file()
+    atomic_write_text(resume_file, outcome.merged)
+    base_hash = store.put_text(outcome.parent_text)
+    with resume.edit_metadata() as metadata:
+        metadata.base_hash = base_hash
+    return True
+
+
+def sync(
+    name: str = typer.Argument(
+        ...,
+        help="Resume whose changes should flow into its variants",
+        shell_complete=complete_resume_name,
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Propagate through all descendants, level by level",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Preview merge results without writing anything",
+    ),
+    show_diff: bool = typer.Option(
+        False,
+        "--diff",
+        help="Print the diff each merge would apply",
+    ),
+    markers: bool = typer.Option(
+        False,
+        "--markers",
+        help="Write conflicting merges with conflict markers instead of skipping them",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of parallel merge workers (default: CPU count)",
+    ),
+) -> None:
+    """Three-way merge a resume's changes into its variants.
+
+    For each variant, the changes between the parent content recorded at
+    branch time and the parent's current content are merged into the
+    variant. Conflicting or unreadable variants are reported and left
+    untouched (conflicts get markers with --markers, and then their own
+    variants wait for a later sync); the rest of the batch continues.
+
+    Examples:
+        rcv sync swe
+        rcv sync swe -r --dry-run
+    """
+    config = Config.load()
+    resumes_dir = config.get_resumes_dir()
+
+    corrupt: List[MetadataError] = []
+    root = find_resume(resumes_dir, name, corrupt)
+    if root is None:
+        print_metadata_errors(corrupt)
+        console.print(f"[red]Resume not found:[/red] {name}")
+        raise typer.Exit(1)
+
+    store = ObjectStore.for_project(resumes_dir)
+    outcomes = plan_sync(root, store, recursive, jobs, markers)
+    if not outcomes:
+        console.print(f"[dim]{name} has no variants to sync.[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Variant")
+    table.add_column("Result")
+    table.add_column("Lines")
+
+    written = 0
+    for outcome in outcomes:
+        lines = "[dim]-[/dim]"
+        if outcome.merged is not None and outcome.original is not None:
+            added, removed = diffstat(outcome.original, outcome.merged)
+            lines = f"[green]+{added}[/green] [red]-{removed}[/red]"
+        result = RESULT_STYLES[outcome.result]
+        if outcome.result == RESULT_CONFLICT:
+            result += f" ({outcome.conflicts})"
+        table.add_row(outcome.resume.full_name, result, lines)
+
+        if show_diff and outcome.merged is not None and outcome.original is not None:
+            diff_text = "".join(
+                difflib.unified_diff(
+                    outcome.original.splitlines(keepends=True),
+                    outcome.merged.splitlines(keepends=True),
+                    fromfile=outcome.resume.full_name,
+                    tofile=f"{outcome.resume.full_name} (synced)",
+                )
+            )
+            if diff_text:
+                console.print(Syntax(diff_text, "diff", theme="monokai"))
+
+        if not dry_run and apply_outcome(outcome, store, markers):
+            written += 1
+
+    console.print(table)
+
+    conflicts = sum(1 for o in outcomes if o.result == RESULT_CONFLICT)
+    if dry_run:
+        console.print("[dim]Dry run: no files were changed.[/dim]")
+    else:
+        console.print(f"[green]Updated {written} variant(s)[/green]")
+    if conflicts and not markers:
+        console.print(
+            f"[yellow]{conflicts} variant(s) had conflicts and were skipped.[/yellow] "
+            "[dim]Re-run with --markers to write conflict markers.[/dim]"
+        )
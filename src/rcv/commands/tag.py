@@ -1,11 +1,14 @@
 """Tag commands - Add and remove tags from resumes."""
 
+from typing import List
+
 import typer
 from rich.console import Console
 
 from rcv.core.config import Config
-from rcv.core.resume import find_resume
+from rcv.core.resume import MetadataError, find_resume
 from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
@@ -29,18 +32,22 @@ def tag(
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
-    resume = find_resume(resumes_dir, name)
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
     if resume is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {name}")
         raise typer.Exit(1)
 
-    if tag in resume.metadata.tags:
+    with resume.edit_metadata() as metadata:
+        exists = tag in metadata.tags
+        if not exists:
+            metadata.tags.append(tag)
+
+    if exists:
         console.print(f"[yellow]Tag already exists:[/yellow] {tag}")
         return
 
-    resume.metadata.tags.append(tag)
-    resume.save()
-
     console.print(f"[green]Added tag:[/green] {tag} to {name}")
 
 
@@ -61,16 +68,20 @@ def untag(
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
-    resume = find_resume(resumes_dir, name)
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
     if resume is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {name}")
         raise typer.Exit(1)
 
-    if tag not in resume.metadata.tags:
+    with resume.edit_metadata() as metadata:
+        missing = tag not in metadata.tags
+        if not missing:
+            metadata.tags.remove(tag)
+
+    if missing:
         console.print(f"[yellow]Tag not found:[/yellow] {tag}")
         return
 
-    resume.metadata.tags.remove(tag)
-    resume.save()
-
     console.print(f"[green]Removed tag:[/green] {tag} from {name}")
@@ -5,14 +5,20 @@ from rich.console import Console
 from rich.tree import Tree as RichTree
 
 from rcv.core.config import Config
-from rcv.core.resume import Resume, get_root_resumes
+from rcv.core.resume import MetadataError, Resume, get_root_resumes
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
 
-def build_tree(tree: RichTree, resume: Resume, show_archived: bool) -> None:
+def build_tree(
+    tree: RichTree,
+    resume: Resume,
+    show_archived: bool,
+    errors: list[MetadataError] | None = None,
+) -> None:
     """Recursively build tree from resume and its variants."""
-    for variant in resume.get_variants():
+    for variant in resume.get_variants(errors):
         if not show_archived and variant.metadata.archived:
             continue
 
@@ -24,7 +30,7 @@ def build_tree(tree: RichTree, resume: Resume, show_archived: bool) -> None:
             label += " [dim](archived)[/dim]"
 
         branch = tree.add(label)
-        build_tree(branch, variant, show_archived)
+        build_tree(branch, variant, show_archived, errors)
 
 
 def tree(
@@ -42,7 +48,8 @@ def tree(
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
-    root_resumes = get_root_resumes(resumes_dir)
+    errors: list[MetadataError] = []
+    root_resumes = get_root_resumes(resumes_dir, errors)
 
     if not root_resumes:
         console.print("[dim]No resumes found. Create one with 'rcv new <name>'[/dim]")
@@ -68,6 +75,8 @@ def tree(
             label += " [dim](archived)[/dim]"
 
         branch = tree_root.add(label)
-        build_tree(branch, resume, all)
+        build_tree(branch, resume, all, errors)
 
     console.print(tree_root)
+
+    print_metadata_errors(errors)
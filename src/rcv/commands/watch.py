@@ -1,43 +1,126 @@
 """Watch command - Auto-rebuild resume on file changes."""
 
+import asyncio
+import shutil
+import tempfile
 import time
+import webbrowser
 from pathlib import Path
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from rcv.core.cache import get_cache_dir
 from rcv.core.config import Config
-from rcv.core.resume import find_resume
+from rcv.core.engine import BuildEngine
+from rcv.core.pages import PAGE_CHECK_OFF, PageCheck
+from rcv.core.preview import DEFAULT_PREVIEW_PORT, PreviewServer, PreviewState
+from rcv.core.resume import MetadataError, find_resume
 from rcv.commands.build import (
-    build_latex,
-    build_typst,
+    BuildTarget,
+    check_output,
+    check_program,
+    compile_resume,
     ensure_output_settings,
+    page_budget_for,
+    profile_for,
+    report_page_check,
     resolve_output_file,
+    resolve_target,
+    run_commands,
 )
 from rcv.utils.completion import complete_resume_name
+from rcv.utils.reporting import print_metadata_errors
 
 console = Console()
 
+# Resolution of preview page images.
+PREVIEW_PPI = 144
+
+
+def render_pages(
+    target: BuildTarget, engine: BuildEngine, out_dir: Path
+) -> Optional[List[bytes]]:
+    """Render every page of a resume to PNG; None if rendering failed."""
+    backend = target.backend
+    if not check_program(backend, backend.executable(target.compiler)):
+        return None
+    source = target.resume.ensure_source_file()
+    plan = backend.plan_pages(source, out_dir, target.compiler, PREVIEW_PPI)
+    if plan is None:
+        return None
+    for old in out_dir.glob("*.png"):
+        old.unlink()
+    if not asyncio.run(
+        run_commands(backend, plan.commands, plan.cwd, engine, target.resume.full_name)
+    ):
+        return None
+    pages = []
+    while (page := out_dir / plan.pattern.format(n=len(pages) + 1)).is_file():
+        pages.append(page.read_bytes())
+    return pages
+
+
+def draft_output_file(resume_full_name: str, output_file: Path, config: Config) -> Path:
+    """Where watch writes builds whose profile differs from rcv build's.
+
+    They go to the project cache rather than the output root, which
+    rcv build treats as final and rcv publish mirrors as is.
+    """
+    return (
+        get_cache_dir(config.get_resumes_dir())
+        / "drafts"
+        / Path(*resume_full_name.split("/"))
+        / output_file.name
+    )
+
 
 class ResumeWatcher(FileSystemEventHandler):
-    """Handler for resume file changes."""
+    """Handler for resume file changes.
+
+    With a preview, the browser is told when a build starts and gets the
+    new output as soon as it succeeds. With a pages_dir, rebuilds render
+    PNG pages for the preview instead of the PDF. With a config, every
+    build gets the post-build page checks of `rcv build` (warnings only).
+    """
 
-    def __init__(self, resume_file: Path, output_file: Path, format: str, compiler: str):
-        self.resume_file = resume_file
-        self.output_file = output_file
-        self.format = format
-        self.compiler = compiler
+    def __init__(
+        self,
+        target: BuildTarget,
+        engine: BuildEngine,
+        preview: Optional[PreviewState] = None,
+        pages_dir: Optional[Path] = None,
+        config: Optional[Config] = None,
+    ):
+        self.resume_file = target.resume.resume_file
+        self.target = target
+        self.engine = engine
+        self.preview = preview
+        self.pages_dir = pages_dir
+        self.config = config
         self.last_build = 0
         self.debounce_seconds = 1.0
 
     def on_modified(self, event):
-        if event.is_directory:
-            return
+        if not event.is_directory:
+            self.file_changed(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.file_changed(event.src_path)
+
+    def on_moved(self, event):
+        # Editors that save atomically write a temp file and rename it over
+        # the resume, so the change arrives as a move onto our file.
+        if not event.is_directory:
+            self.file_changed(event.dest_path)
 
+    def file_changed(self, path: str) -> None:
         # Check if it's our resume file
-        if Path(event.src_path).name != self.resume_file.name:
+        if Path(path).name != self.resume_file.name:
             return
 
         # Debounce rapid changes
@@ -48,16 +131,55 @@ class ResumeWatcher(FileSystemEventHandler):
 
         console.print(f"\n[dim]File changed, rebuilding...[/dim]")
 
-        if self.format == "latex":
-            success = build_latex(self.resume_file, self.output_file, self.compiler)
-        else:
-            success = build_typst(self.resume_file, self.output_file, self.compiler)
-
-        if success:
+        if self.rebuild():
             console.print(f"[green]Rebuilt successfully[/green]")
         else:
             console.print(f"[red]Build failed[/red]")
 
+    def rebuild(self) -> bool:
+        """Build once and update the preview, if any."""
+        if self.preview is not None:
+            self.preview.start_build()
+        pages = None
+        warnings: List[str] = []
+        if self.pages_dir is not None:
+            pages = render_pages(self.target, self.engine, self.pages_dir)
+            ok = pages is not None
+        else:
+            result = compile_resume(self.target, self.engine)
+            ok, warnings = result.ok, result.warnings
+        if ok:
+            self.check_output(warnings, pages)
+        if self.preview is None:
+            return ok
+        if not ok:
+            self.preview.fail(
+                "Build failed (see the terminal); showing the last good output"
+            )
+        elif self.pages_dir is not None:
+            changed = self.preview.publish_pages(pages)
+            console.print(
+                f"[dim]Preview: {len(changed)} of {len(pages)} page(s) changed[/dim]"
+            )
+        else:
+            try:
+                self.preview.publish_pdf(self.target.output_file.read_bytes())
+            except OSError as e:
+                self.preview.fail(f"Cannot read the PDF: {e}")
+        return ok
+
+    def check_output(self, warnings: List[str], pages: Optional[List[bytes]]) -> None:
+        config = self.config
+        if config is None or config.page_check == PAGE_CHECK_OFF:
+            return
+        if pages is not None:
+            budget = page_budget_for(self.target.resume, config)
+            check = PageCheck(len(pages), budget)
+        else:
+            check = check_output(self.target, config, warnings)
+        if check is not None:
+            report_page_check(self.target.resume.full_name, check, config.page_check)
+
 
 def watch(
     name: str = typer.Argument(
@@ -71,65 +193,129 @@ def watch(
         "-o",
         help="Output directory for the PDF. Defaults to project output_dir layout from .rcv.toml.",
     ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        "-p",
+        help="Build profile for rebuilds (default: watch_profile, usually draft)",
+    ),
+    serve: bool = typer.Option(
+        False,
+        "--serve",
+        help="Serve a live-reloading preview in the browser",
+    ),
+    port: int = typer.Option(
+        DEFAULT_PREVIEW_PORT, "--port", help="Port for the preview server"
+    ),
+    host: str = typer.Option(
+        "127.0.0.1", "--host", help="Address for the preview server"
+    ),
+    png: bool = typer.Option(
+        False,
+        "--png",
+        help="Preview PNG pages instead of the PDF (backends that render "
+        "pages, e.g. typst); no PDF is written while watching",
+    ),
+    open_browser: bool = typer.Option(
+        False, "--open", help="Open the preview in a web browser"
+    ),
 ) -> None:
     """Watch a resume for changes and auto-rebuild.
 
     This starts a file watcher that automatically rebuilds the PDF
-    whenever the resume file is modified.
+    whenever the resume file is modified. Rebuilds use the fast draft
+    profile unless --profile or watch_profile says otherwise; unless
+    --output is given, such builds go to the project cache so the PDF
+    that rcv build and rcv publish use is never a draft.
+
+    With --serve, a local web page shows the latest good output and
+    reloads as soon as a rebuild finishes.
 
     Press Ctrl+C to stop watching.
 
     Examples:
         rcv watch swe
         rcv watch swe/google -o ~/Documents/
+        rcv watch swe -p final
+        rcv watch swe --serve --open
+        rcv watch designer --serve --png
     """
     config = Config.load()
     resumes_dir = config.get_resumes_dir()
 
     # Find the resume
-    resume = find_resume(resumes_dir, name)
+    corrupt: List[MetadataError] = []
+    resume = find_resume(resumes_dir, name, corrupt)
     if resume is None:
+        print_metadata_errors(corrupt)
         console.print(f"[red]Resume not found:[/red] {name}")
         raise typer.Exit(1)
 
-    resume_file = resume.resume_file
-    if not resume_file.exists():
-        console.print(f"[red]Resume file not found:[/red] {resume_file}")
+    if not resume.has_source():
+        console.print(f"[red]Resume file not found:[/red] {resume.resume_file}")
         raise typer.Exit(1)
+    resume_file = resume.ensure_source_file()
 
     ensure_output_settings(config)
     output_file = resolve_output_file(resume.full_name, resume_file, config, output)
+
+    try:
+        watch_profile = profile_for(resume, config, profile or config.watch_profile)
+        draft = watch_profile.settings() != profile_for(resume, config).settings()
+        if draft and output is None:
+            output_file = draft_output_file(resume.full_name, output_file, config)
+        target = resolve_target(resume, config, output_file, watch_profile.name)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
     output_file.parent.mkdir(parents=True, exist_ok=True)
+    if png and not serve:
+        console.print("[red]--png is a preview option; use it with --serve[/red]")
+        raise typer.Exit(1)
+    if png and not target.backend.page_images:
+        console.print(
+            f"[red]The {target.backend.name} backend cannot render PNG pages[/red]"
+        )
+        raise typer.Exit(1)
 
-    # Determine compiler
-    if resume.metadata.format == "latex":
-        compiler = config.latex_compiler
-    else:
-        compiler = config.typst_compiler
+    preview = None
+    server = None
+    pages_dir = None
+    if serve:
+        preview = PreviewState(resume.full_name)
+        try:
+            server = PreviewServer(preview, (host, port))
+        except OSError as e:
+            console.print(f"[red]Cannot start the preview server:[/red] {e}")
+            raise typer.Exit(1)
+        server.start()
+        if png:
+            pages_dir = Path(tempfile.mkdtemp(prefix="rcv-preview-"))
 
     # Do initial build
     console.print(f"[bold]Watching:[/bold] {resume_file}")
     console.print(f"[dim]Press Ctrl+C to stop[/dim]\n")
-    console.print(f"[dim]Output PDF:[/dim] {output_file}\n")
+    if pages_dir is None:
+        console.print(f"[dim]Output PDF:[/dim] {output_file}")
+    console.print(
+        f"[dim]Profile:[/dim] {target.profile.name}  "
+        f"[dim]Backend:[/dim] {target.backend.name}"
+    )
+    if server is not None:
+        console.print(f"[bold]Preview:[/bold] {server.url}")
+        if open_browser:
+            webbrowser.open(server.url)
+    console.print()
 
+    engine = BuildEngine.from_config(config)
+    event_handler = ResumeWatcher(target, engine, preview, pages_dir, config)
     console.print("[dim]Initial build...[/dim]")
-    if resume.metadata.format == "latex":
-        success = build_latex(resume_file, output_file, compiler)
-    else:
-        success = build_typst(resume_file, output_file, compiler)
-
-    if success:
+    if event_handler.rebuild():
         console.print("[green]Initial build successful[/green]")
     else:
         console.print("[yellow]Initial build failed, watching for changes...[/yellow]")
 
     # Set up watcher
-    event_handler = ResumeWatcher(
-        resume_file=resume_file,
-        output_file=output_file,
-        format=resume.metadata.format,
-        compiler=compiler,
-    )
 
     observer = Observer()
     observer.schedule(event_handler, str(resume.path), recursive=False)
@@ -143,3 +329,7 @@ def watch(
         console.print("\n[dim]Stopped watching.[/dim]")
 
     observer.join()
+    if server is not None:
+        server.stop()
+    if pages_dir is not None:
+        shutil.rmtree(pages_dir, ignore_errors=True)
@@ -0,0 +1,120 @@
+"""Worker command - Serve builds to other machines."""
+
+import asyncio
+import os
+import secrets
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from rcv.core.config import Config
+from rcv.core.engine import BuildEngine
+from rcv.core.worker import (
+    DEFAULT_COMPILERS,
+    DEFAULT_PORT,
+    TOKEN_ENV,
+    BuildJob,
+    BuildResult,
+    BuildServer,
+    format_address,
+    parse_address,
+)
+
+console = Console()
+
+
+def worker(
+    address: str = typer.Argument(
+        f"127.0.0.1:{DEFAULT_PORT}",
+        help="Address to listen on: HOST:PORT, unix:PATH or a socket path",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of concurrent compiles (default: build_jobs or CPU count)",
+    ),
+    timeout: Optional[float] = typer.Option(
+        None,
+        "--timeout",
+        help="Kill a compiler run after this many seconds (0 disables)",
+    ),
+    compilers: Optional[List[str]] = typer.Option(
+        None,
+        "--compiler",
+        help="Compiler jobs may use (repeatable; default: pdflatex, xelatex, "
+        "lualatex, latexmk, tectonic, typst)",
+    ),
+    token: Optional[str] = typer.Option(
+        None,
+        "--token",
+        envvar=TOKEN_ENV,
+        help="Shared secret clients must send (default: a random one, printed)",
+    ),
+) -> None:
+    """Start a build worker that compiles jobs sent by rcv build --workers.
+
+    A job carries the source, its dependency files and the compiler to
+    use; the worker compiles it in a scratch directory and returns the
+    PDF or the compiler diagnostics. Limits come from the .rcv.toml found
+    from the current directory, if any. Listens on localhost by default.
+    Clients must send the token; without --token a random one is made
+    and printed.
+
+    Press Ctrl+C to stop.
+
+    Examples:
+        rcv worker
+        rcv worker 0.0.0.0:7878 -j 8 --token s3cret
+        rcv worker unix:/tmp/rcv-worker.sock
+    """
+    try:
+        listen = parse_address(address)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    engine = BuildEngine.from_config(Config.load(), jobs)
+    if timeout is not None:
+        engine.limits.timeout = timeout or None
+
+    def on_job(job: BuildJob, result: BuildResult) -> None:
+        if result.ok:
+            console.print(f"[green]Built[/green] {job.name} ({result.duration:.1f}s)")
+        else:
+            console.print(f"[red]Failed[/red] {job.name}: {result.diagnostics}")
+
+    if not token:
+        token = secrets.token_urlsafe(16)
+        console.print(f"[bold]Token:[/bold] {token}", highlight=False)
+        console.print(f"[dim]Set {TOKEN_ENV}={token} for rcv build --workers[/dim]")
+
+    server = BuildServer(
+        engine, tuple(compilers or DEFAULT_COMPILERS), token=token, on_job=on_job
+    )
+
+    async def serve() -> None:
+        if isinstance(listen, str) and Path(listen).is_socket():
+            os.unlink(listen)  # left behind by a worker that was killed
+        running = await server.start(listen)
+        console.print(
+            f"[bold]Worker listening on {format_address(listen)}[/bold] "
+            f"[dim]({engine.jobs} job(s), compilers: {', '.join(server.compilers)})"
+            f"[/dim]"
+        )
+        console.print("[dim]Press Ctrl+C to stop[/dim]")
+        async with running:
+            await running.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        console.print("\n[dim]Worker stopped.[/dim]")
+    except OSError as e:
+        console.print(f"[red]Cannot listen on {address}:[/red] {e}")
+        raise typer.Exit(1)
+    finally:
+        if isinstance(listen, str) and Path(listen).is_socket():
+            os.unlink(listen)
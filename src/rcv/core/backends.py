@@ -0,0 +1,347 @@
+"""Build backends: the tools that turn a resume source into a PDF.
+
+A backend plans the commands for a build, discovers the local files the
+build reads and extracts errors from the tool's output. latex, latexmk,
+tectonic and typst are built in. Other packages add backends through the
+`rcv.backends` entry-point group; each entry point names a Backend
+subclass or instance:
+
+    [project.entry-points."rcv.backends"]
+    mytool = "rcv_mytool:MyToolBackend"
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rcv.core.deps import find_dependencies
+from rcv.core.engine import ProcessResult
+from rcv.core.pages import overfull_warnings
+from rcv.core.profiles import BuildProfile
+from rcv.core.resume import VARIANTS_DIR
+
+
+ENTRY_POINT_GROUP = "rcv.backends"
+
+# Draft-mode graphics: placeholder boxes instead of embedded images.
+_GRAPHICX_DRAFT = "\\PassOptionsToPackage{draft}{graphicx}"
+
+
+@dataclass
+class BuildPlan:
+    """Commands that build a source, run in order from cwd.
+
+    The last command leaves the PDF at pdf; artifacts are intermediate
+    files to remove afterwards.
+    """
+
+    commands: List[List[str]]
+    cwd: Path
+    pdf: Path
+    artifacts: List[Path] = field(default_factory=list)
+
+
+@dataclass
+class PagesPlan:
+    """Commands that render a source to one PNG per page, run from cwd.
+
+    Page n is written to out_dir / pattern.format(n=n).
+    """
+
+    commands: List[List[str]]
+    cwd: Path
+    pattern: str = "page-{n}.png"
+
+
+class Backend(ABC):
+    """Base class for build backends; subclasses must implement plan().
+
+    Capabilities are class attributes: the source formats a backend
+    builds, whether it is incremental (keeps state between builds, so rcv
+    gives it a persistent work directory instead of cleaning up after
+    it), which build profile settings it honors and whether it can render
+    pages as images for previews.
+    """
+
+    name: str = ""
+    description: str = ""
+    formats: Tuple[str, ...] = ()
+    incremental: bool = False
+    profile_settings: Tuple[str, ...] = ()
+    page_images: bool = False
+    install_hint: str = ""
+
+    def executable(self, compiler: str) -> str:
+        """The program a build runs, given the project's compiler setting."""
+        return compiler
+
+    def programs(self, compiler: str) -> Tuple[str, ...]:
+        """Every program a build may start; build workers allowlist these."""
+        return (self.executable(compiler),)
+
+    @abstractmethod
+    def plan(
+        self, source: Path, work_dir: Path, compiler: str, profile: BuildProfile
+    ) -> BuildPlan:
+        """Plan the commands that build source into work_dir."""
+
+    def plan_pages(
+        self, source: Path, out_dir: Path, compiler: str, ppi: int
+    ) -> Optional[PagesPlan]:
+        """Plan rendering each page to a PNG; None without page_images."""
+        return None
+
+    def dependencies(self, source: Path, format: str) -> List[Path]:
+        """Local files the build reads besides the source."""
+        return find_dependencies(source, format)
+
+    def diagnostics(self, result: ProcessResult) -> List[str]:
+        """Error lines from a failed command."""
+        return [line for line in result.stderr.splitlines() if line.strip()]
+
+    def warnings(self, result: ProcessResult, plan: BuildPlan) -> List[str]:
+        """Layout warnings (overfull boxes) from the last command of a build."""
+        return overfull_warnings(result.stdout + result.stderr)
+
+
+def _latex_artifacts(directories: List[Path], stem: str) -> List[Path]:
+    return [d / f"{stem}{ext}" for d in directories for ext in (".aux", ".log", ".out")]
+
+
+class LatexBackend(Backend):
+    """Run the LaTeX compiler once per profile pass."""
+
+    name = "latex"
+    description = "pdflatex/xelatex/lualatex, one run per pass"
+    formats = ("latex",)
+    profile_settings = ("passes", "draftmode", "images")
+    install_hint = "Install LaTeX or configure a different compiler in .rcv.toml"
+
+    def plan(
+        self, source: Path, work_dir: Path, compiler: str, profile: BuildProfile
+    ) -> BuildPlan:
+        # Compile from the source directory with just the filename.
+        # This avoids TeX parsing issues with absolute paths containing '~'
+        # (common in iCloud paths like com~apple~CloudDocs).
+        return BuildPlan(
+            commands=profile.latex_runs(compiler, str(work_dir), source.name),
+            cwd=source.parent,
+            pdf=work_dir / f"{source.stem}.pdf",
+            artifacts=_latex_artifacts([work_dir, source.parent], source.stem),
+        )
+
+    def diagnostics(self, result: ProcessResult) -> List[str]:
+        return [
+            line
+            for line in result.stdout.split("\n")
+            if line.startswith("!") or "Error" in line
+        ]
+
+
+class LatexmkBackend(LatexBackend):
+    """Let latexmk decide which runs are needed from its own dependency data."""
+
+    name = "latexmk"
+    description = "latexmk with the configured LaTeX compiler; reruns only as needed"
+    incremental = True
+    profile_settings = ("images",)
+    install_hint = "latexmk ships with TeX Live and MiKTeX"
+
+    _ENGINE_FLAGS = {"pdflatex": "-pdf", "xelatex": "-xelatex", "lualatex": "-lualatex"}
+
+    def executable(self, compiler: str) -> str:
+        return "latexmk"
+
+    def programs(self, compiler: str) -> Tuple[str, ...]:
+        # latexmk starts the compiler itself, through a shell for custom ones
+        return ("latexmk", compiler)
+
+    def plan(
+        self, source: Path, work_dir: Path, compiler: str, profile: BuildProfile
+    ) -> BuildPlan:
+        # -norc: a latexmkrc is Perl that latexmk would execute; rcv passes
+        # every setting a build needs on the command line.
+        argv = ["latexmk", "-norc"]
+        if compiler in self._ENGINE_FLAGS:
+            argv.append(self._ENGINE_FLAGS[compiler])
+        else:
+            argv += ["-pdf", f"-pdflatex={compiler} %O %S"]
+        argv += [
+            "-interaction=nonstopmode",
+            "-halt-on-error",
+            f"-output-directory={work_dir}",
+        ]
+        if not profile.images:
+            argv.append(f"-usepretex={_GRAPHICX_DRAFT}")
+        argv.append(source.name)
+        # No artifacts: the .fdb_latexmk and .aux files in the work
+        # directory are what makes the next build incremental.
+        return BuildPlan(
+            commands=[argv], cwd=source.parent, pdf=work_dir / f"{source.stem}.pdf"
+        )
+
+    def warnings(self, result: ProcessResult, plan: BuildPlan) -> List[str]:
+        # latexmk prints nothing when the PDF was up to date, but the log
+        # of the last LaTeX run stays in the work directory.
+        try:
+            log = plan.pdf.with_suffix(".log").read_text(errors="replace")
+        except OSError:
+            return super().warnings(result, plan)
+        return overfull_warnings(log)
+
+
+class TectonicBackend(Backend):
+    """Tectonic reruns itself as needed and caches its TeX bundle."""
+
+    name = "tectonic"
+    description = "Self-contained XeTeX engine with a cached package bundle"
+    formats = ("latex",)
+    install_hint = "Install Tectonic: https://tectonic-typesetting.github.io/"
+
+    def executable(self, compiler: str) -> str:
+        return "tectonic"
+
+    def plan(
+        self, source: Path, work_dir: Path, compiler: str, profile: BuildProfile
+    ) -> BuildPlan:
+        return BuildPlan(
+            commands=[["tectonic", "--outdir", str(work_dir), source.name]],
+            cwd=source.parent,
+            pdf=work_dir / f"{source.stem}.pdf",
+        )
+
+    def diagnostics(self, result: ProcessResult) -> List[str]:
+        return [
+            line
+            for line in (result.stdout + result.stderr).splitlines()
+            if line.startswith(("error", "!"))
+        ]
+
+
+def _typst_root(source: Path) -> Path:
+    """The project directory containing a resume source.
+
+    typst refuses to read files outside its root, which defaults to the
+    source's directory; shared files such as assets/sections/*.typ live
+    higher up.
+    """
+    path = source.parent
+    while path.parent.name == VARIANTS_DIR:
+        path = path.parent.parent
+    return path.parent
+
+
+class TypstBackend(Backend):
+    """Compile with the typst CLI."""
+
+    name = "typst"
+    description = "typst compile"
+    formats = ("typst",)
+    page_images = True
+    install_hint = "Install Typst: https://typst.app/"
+
+    def plan(
+        self, source: Path, work_dir: Path, compiler: str, profile: BuildProfile
+    ) -> BuildPlan:
+        pdf = work_dir / f"{source.stem}.pdf"
+        return BuildPlan(
+            commands=[
+                [
+                    compiler,
+                    "compile",
+                    "--root",
+                    str(_typst_root(source)),
+                    str(source),
+                    str(pdf),
+                ]
+            ],
+            cwd=source.parent,
+            pdf=pdf,
+        )
+
+    def plan_pages(
+        self, source: Path, out_dir: Path, compiler: str, ppi: int
+    ) -> PagesPlan:
+        # typst expands {p} to the page number.
+        output = out_dir / "page-{p}.png"
+        return PagesPlan(
+            commands=[
+                [
+                    compiler,
+                    "compile",
+                    "--root",
+                    str(_typst_root(source)),
+                    "--ppi",
+                    str(ppi),
+                    str(source),
+                    str(output),
+                ]
+            ],
+            cwd=source.parent,
+        )
+
+    def diagnostics(self, result: ProcessResult) -> List[str]:
+        return [result.stderr] if result.stderr else []
+
+
+BUILTIN_BACKENDS: Dict[str, Backend] = {
+    backend.name: backend
+    for backend in (LatexBackend(), LatexmkBackend(), TectonicBackend(), TypstBackend())
+}
+
+_plugins: Optional[Dict[str, Backend]] = None
+_plugin_errors: Dict[str, str] = {}
+
+
+def _load_plugins() -> Dict[str, Backend]:
+    """Load backends registered by installed packages (once per process).
+
+    A plugin that fails to load is remembered and reported only when that
+    backend is asked for, so a broken package never breaks other builds.
+    """
+    global _plugins
+    if _plugins is not None:
+        return _plugins
+    _plugins = {}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        name = entry_point.name
+        if name in BUILTIN_BACKENDS:
+            continue  # built-in names cannot be taken over
+        try:
+            loaded = entry_point.load()
+            backend = loaded() if isinstance(loaded, type) else loaded
+        except Exception as e:
+            _plugin_errors[name] = f"cannot load {entry_point.value}: {e}"
+            continue
+        if not isinstance(backend, Backend):
+            _plugin_errors[name] = f"{entry_point.value} is not an rcv Backend"
+            continue
+        backend.name = name
+        _plugins[name] = backend
+    return _plugins
+
+
+def available_backends() -> Dict[str, Backend]:
+    """All usable backends by name, built-ins first."""
+    return {**BUILTIN_BACKENDS, **_load_plugins()}
+
+
+def get_backend(name: str, format: Optional[str] = None) -> Backend:
+    """Look up a backend, checking that it builds the given format.
+
+    Raises ValueError for an unknown backend, one that failed to load,
+    or one that cannot build the format.
+    """
+    backends = available_backends()
+    backend = backends.get(name)
+    if backend is None:
+        if name in _plugin_errors:
+            raise ValueError(f"build backend '{name}' {_plugin_errors[name]}")
+        raise ValueError(
+            f"unknown build backend '{name}' (available: {', '.join(backends)})"
+        )
+    if format is not None and format not in backend.formats:
+        raise ValueError(f"build backend '{name}' cannot build {format} resumes")
+    return backend
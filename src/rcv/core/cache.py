@@ -0,0 +1,132 @@
+"""Persistent JSON caches stored under the project's .rcv/cache directory."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from rcv.core.objects import content_hash, get_state_dir
+from rcv.core.storage import atomic_write_text
+
+
+CACHE_DIR = "cache"
+
+
+def get_cache_dir(project_dir: Path) -> Path:
+    """Get the directory holding rcv's derived, rebuildable caches."""
+    return get_state_dir(project_dir) / CACHE_DIR
+
+
+class JsonCache:
+    """A thread-safe key/value cache persisted as one JSON file.
+
+    Caches only hold derived data, so a missing or corrupt file simply
+    starts empty. Call save() once after a batch of updates; nothing is
+    written if no entry changed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data: Dict[str, Any] = {}
+        try:
+            loaded = json.loads(path.read_text())
+            if isinstance(loaded, dict):
+                self._data = loaded
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def for_project(cls, project_dir: Path, name: str) -> "JsonCache":
+        """Open the named cache of a project."""
+        return cls(get_cache_dir(project_dir) / f"{name}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value."""
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Set a cached value."""
+        with self._lock:
+            if self._data.get(key) != value:
+                self._data[key] = value
+                self._dirty = True
+
+    def edit(self, key: str, default: Any) -> Any:
+        """Get a value for in-place modification, inserting default if absent.
+
+        The cache is marked changed, so large values such as index postings
+        can be updated without copying them.
+        """
+        with self._lock:
+            self._dirty = True
+            return self._data.setdefault(key, default)
+
+    def discard(self, key: str) -> None:
+        """Remove a cached value if present."""
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._dirty = True
+
+    def keys(self) -> list[str]:
+        """Get all cached keys."""
+        with self._lock:
+            return list(self._data)
+
+    def save(self) -> None:
+        """Persist the cache if it changed (best effort)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(self._data, separators=(",", ":"))
+            self._dirty = False
+        try:
+            atomic_write_text(self.path, payload)
+        except OSError:
+            pass
+
+
+class HashCache:
+    """Content hashes of project files, keyed by path and validated by stat.
+
+    A file is only re-read when its size or mtime changed, which makes
+    repeated scans of an unchanged tree cost one stat() per file.
+    """
+
+    # Files modified this recently are not cached: a second write within
+    # the filesystem's timestamp granularity would go unnoticed.
+    RACY_SECONDS = 2.0
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self._cache = JsonCache.for_project(project_dir, "hashes")
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.project_dir.resolve()).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def hash_file(self, path: Path) -> str:
+        """Get the SHA-256 object id of a file's content."""
+        stat = path.stat()
+        key = self._key(path)
+        cached = self._cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == stat.st_size
+            and cached[1] == stat.st_mtime_ns
+        ):
+            return cached[2]
+
+        digest = content_hash(path.read_bytes())
+        if time.time() - stat.st_mtime > self.RACY_SECONDS:
+            self._cache.set(key, [stat.st_size, stat.st_mtime_ns, digest])
+        return digest
+
+    def save(self) -> None:
+        """Persist newly computed hashes."""
+        self._cache.save()
@@ -1,8 +1,14 @@
 """Configuration management for RCV."""
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+from rcv.core.mirror import NO_MIRROR_ENV, is_mirror, mirror_dir_for
+from rcv.core.pages import PAGE_CHECK_WARN
+from rcv.core.profiles import DRAFT, FINAL, BuildProfile, resolve_profile
+from rcv.core.storage import atomic_write_text, file_lock
 
 try:
     import tomllib  # Python 3.11+
@@ -19,15 +25,30 @@ def _toml_quote(value: str) -> str:
     return f'"{escaped}"'
 
 
+def _toml_value(value: Any) -> str:
+    """Format a scalar TOML value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return _toml_quote(str(value))
+
+
 def _parse_simple_toml(content: str) -> dict[str, Any]:
-    """Parse flat key=value TOML used by the local RCV config.
+    """Parse the key=value TOML (with [table] headers) used by the RCV config.
 
     This lightweight fallback is only used when tomllib is unavailable.
     """
     data: dict[str, Any] = {}
+    table = data
 
     for raw_line in content.splitlines():
         line = raw_line.split("#", 1)[0].strip()
+        if line.startswith("[") and line.endswith("]"):
+            table = data
+            for part in line[1:-1].split("."):
+                table = table.setdefault(part.strip().strip('"'), {})
+            continue
         if not line or "=" not in line:
             continue
 
@@ -38,22 +59,38 @@ def _parse_simple_toml(content: str) -> dict[str, Any]:
         if value.startswith('"') and value.endswith('"') and len(value) >= 2:
             parsed_value = value[1:-1]
             parsed_value = parsed_value.replace('\\"', '"').replace("\\\\", "\\")
-            data[key] = parsed_value
+            table[key] = parsed_value
             continue
 
         if value.startswith("'") and value.endswith("'") and len(value) >= 2:
-            data[key] = value[1:-1]
+            table[key] = value[1:-1]
             continue
 
         if value.lower() in {"true", "false"}:
-            data[key] = value.lower() == "true"
+            table[key] = value.lower() == "true"
             continue
 
-        data[key] = value
+        table[key] = value
 
     return data
 
 
+def _optional_number(data: dict[str, Any], key: str) -> Optional[float]:
+    """Read a numeric setting (the fallback parser yields strings)."""
+    value = data.get(key)
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _optional_int(data: dict[str, Any], key: str) -> Optional[int]:
+    value = _optional_number(data, key)
+    return int(value) if value is not None else None
+
+
 def _read_toml_file(config_file: Path) -> dict[str, Any]:
     """Read and parse TOML configuration data."""
     if tomllib is not None:
@@ -74,8 +111,22 @@ class Config:
     default_format: str = "latex"  # latex or typst
     latex_compiler: str = "pdflatex"  # pdflatex, xelatex, lualatex
     typst_compiler: str = "typst"
+    latex_backend: str = "latex"  # build backend for LaTeX resumes
+    typst_backend: str = "typst"  # build backend for Typst resumes
     output_dir: Optional[str] = None
     output_pdf_name: Optional[str] = None
+    snapshot_on_build: bool = True
+    build_timeout: Optional[float] = None  # seconds; 0 disables
+    build_cpu_limit: Optional[int] = None  # CPU seconds per compiler run
+    build_memory_limit: Optional[int] = None  # MB per compiler run
+    build_jobs: Optional[int] = None  # concurrent builds (default: CPU count)
+    mirror: bool = False  # work on a local copy of the project
+    default_profile: str = FINAL  # build profile for rcv build
+    watch_profile: str = DRAFT  # build profile for rcv watch
+    profiles: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    max_pages: Optional[int] = None  # page budget per resume
+    page_check: str = PAGE_CHECK_WARN  # off, warn or fail past the page budget
+    origin_dir: Optional[Path] = None  # synced location when using a mirror
 
     @classmethod
     def _find_project_dir(cls, start_dir: Optional[Path] = None) -> Optional[Path]:
@@ -90,20 +141,15 @@ class Config:
         return None
 
     @classmethod
-    def load(cls, start_dir: Optional[Path] = None) -> "Config":
-        """Load config from the nearest project .rcv.toml, if available."""
-        project_dir = cls._find_project_dir(start_dir)
-        if project_dir is None:
-            return cls()
-
-        config_file = project_dir / CONFIG_FILE_NAME
-        data = _read_toml_file(config_file)
-
+    def _from_data(cls, project_dir: Path, data: dict[str, Any]) -> "Config":
+        """Build a Config from parsed .rcv.toml data."""
         return cls(
             project_dir=project_dir,
             default_format=str(data.get("default_format", "latex")),
             latex_compiler=str(data.get("latex_compiler", "pdflatex")),
             typst_compiler=str(data.get("typst_compiler", "typst")),
+            latex_backend=str(data.get("latex_backend", "latex")),
+            typst_backend=str(data.get("typst_backend", "typst")),
             output_dir=(
                 str(data["output_dir"]) if data.get("output_dir") is not None else None
             ),
@@ -112,8 +158,54 @@ class Config:
                 if data.get("output_pdf_name") is not None
                 else None
             ),
+            snapshot_on_build=bool(data.get("snapshot_on_build", True)),
+            build_timeout=_optional_number(data, "build_timeout"),
+            build_cpu_limit=_optional_int(data, "build_cpu_limit"),
+            build_memory_limit=_optional_int(data, "build_memory_limit"),
+            build_jobs=_optional_int(data, "build_jobs"),
+            mirror=bool(data.get("mirror", False)),
+            default_profile=str(data.get("default_profile", FINAL)),
+            watch_profile=str(data.get("watch_profile", DRAFT)),
+            profiles={
+                str(name): dict(table)
+                for name, table in data.get("profiles", {}).items()
+                if isinstance(table, dict)
+            },
+            max_pages=_optional_int(data, "max_pages"),
+            page_check=str(data.get("page_check", PAGE_CHECK_WARN)),
         )
 
+    @classmethod
+    def load(cls, start_dir: Optional[Path] = None) -> "Config":
+        """Load config from the nearest project .rcv.toml, if available."""
+        project_dir = cls._find_project_dir(start_dir)
+        if project_dir is None:
+            return cls()
+
+        config_file = project_dir / CONFIG_FILE_NAME
+        data = _read_toml_file(config_file)
+        return cls._from_data(project_dir, data)._use_mirror()
+
+    def _use_mirror(self) -> "Config":
+        """Switch to the project's local mirror if mirror mode is on.
+
+        Not done for a project that is itself a mirror, before the first
+        `rcv mirror pull`, or when RCV_NO_MIRROR is set.
+        """
+        if (
+            not self.mirror
+            or self.project_dir is None
+            or os.environ.get(NO_MIRROR_ENV)
+            or is_mirror(self.project_dir)
+        ):
+            return self
+        local = mirror_dir_for(self.project_dir)
+        if not is_mirror(local):
+            return self
+        config = self.load_from_project_dir(local)
+        config.origin_dir = self.project_dir
+        return config
+
     @classmethod
     def load_from_project_dir(cls, project_dir: Path) -> "Config":
         """Load config specifically from a project root path."""
@@ -123,20 +215,7 @@ class Config:
             return cls(project_dir=resolved)
 
         data = _read_toml_file(config_file)
-        return cls(
-            project_dir=resolved,
-            default_format=str(data.get("default_format", "latex")),
-            latex_compiler=str(data.get("latex_compiler", "pdflatex")),
-            typst_compiler=str(data.get("typst_compiler", "typst")),
-            output_dir=(
-                str(data["output_dir"]) if data.get("output_dir") is not None else None
-            ),
-            output_pdf_name=(
-                str(data["output_pdf_name"])
-                if data.get("output_pdf_name") is not None
-                else None
-            ),
-        )
+        return cls._from_data(resolved, data)
 
     def save(self) -> None:
         """Save config to the project-local .rcv.toml file."""
@@ -150,11 +229,49 @@ class Config:
             f"latex_compiler = {_toml_quote(self.latex_compiler)}\n"
             f"typst_compiler = {_toml_quote(self.typst_compiler)}\n"
         )
+        for key, default in (("latex_backend", "latex"), ("typst_backend", "typst")):
+            value = getattr(self, key)
+            if value != default:
+                toml_content += f"{key} = {_toml_quote(value)}\n"
+        if not self.snapshot_on_build:
+            toml_content += "snapshot_on_build = false\n"
         if self.output_dir is not None:
             toml_content += f"output_dir = {_toml_quote(self.output_dir)}\n"
         if self.output_pdf_name is not None:
             toml_content += f"output_pdf_name = {_toml_quote(self.output_pdf_name)}\n"
-        config_file.write_text(toml_content)
+        if self.build_timeout is not None:
+            toml_content += f"build_timeout = {self.build_timeout:g}\n"
+        for key in ("build_cpu_limit", "build_memory_limit", "build_jobs"):
+            value = getattr(self, key)
+            if value is not None:
+                toml_content += f"{key} = {value}\n"
+        if self.mirror:
+            toml_content += "mirror = true\n"
+        if self.default_profile != FINAL:
+            toml_content += f"default_profile = {_toml_quote(self.default_profile)}\n"
+        if self.watch_profile != DRAFT:
+            toml_content += f"watch_profile = {_toml_quote(self.watch_profile)}\n"
+        if self.max_pages is not None:
+            toml_content += f"max_pages = {self.max_pages}\n"
+        if self.page_check != PAGE_CHECK_WARN:
+            toml_content += f"page_check = {_toml_quote(self.page_check)}\n"
+        for name, table in sorted(self.profiles.items()):
+            toml_content += f"\n[profiles.{name}]\n"
+            for key, value in table.items():
+                toml_content += f"{key} = {_toml_value(value)}\n"
+        with file_lock(project_dir):
+            atomic_write_text(config_file, toml_content)
+
+    def get_profile(self, name: Optional[str] = None) -> BuildProfile:
+        """Get a build profile by name (default: default_profile).
+
+        Raises ValueError for an unknown profile or invalid settings.
+        """
+        return resolve_profile(name or self.default_profile, self.profiles)
+
+    def get_backend_name(self, format: str) -> str:
+        """Get the project's build backend for a resume format."""
+        return self.typst_backend if format == "typst" else self.latex_backend
 
     def get_resumes_dir(self) -> Path:
         """Get the resumes directory for this project."""
@@ -0,0 +1,63 @@
+"""Line-based deltas between two versions of a resume source."""
+
+import difflib
+import json
+from typing import Any, List, Tuple
+
+
+DELTA_VERSION = 1
+
+
+def make_delta(base: str, target: str) -> bytes:
+    """Encode target as copy/insert operations against base.
+
+    The result is a small JSON document: copy ops reference line ranges
+    of base, insert ops carry the literal new text.
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+
+    ops: List[List[Any]] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["c", i1, i2])
+        elif j2 > j1:
+            ops.append(["i", "".join(target_lines[j1:j2])])
+
+    return json.dumps({"v": DELTA_VERSION, "ops": ops}, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    """Rebuild the target text from base and a delta made by make_delta."""
+    data = json.loads(delta.decode("utf-8"))
+    if data.get("v") != DELTA_VERSION:
+        raise ValueError(f"Unsupported delta version: {data.get('v')}")
+
+    base_lines = base.splitlines(keepends=True)
+    parts: List[str] = []
+    for op in data["ops"]:
+        if op[0] == "c":
+            parts.extend(base_lines[op[1] : op[2]])
+        elif op[0] == "i":
+            parts.append(op[1])
+        else:
+            raise ValueError(f"Unknown delta op: {op[0]}")
+    return "".join(parts)
+
+
+def diffstat(a: str, b: str) -> Tuple[int, int]:
+    """Count lines added and removed going from a to b."""
+    matcher = difflib.SequenceMatcher(
+        None, a.splitlines(), b.splitlines(), autojunk=False
+    )
+    added = 0
+    removed = 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ("replace", "delete"):
+            removed += i2 - i1
+        if tag in ("replace", "insert"):
+            added += j2 - j1
+    return added, removed
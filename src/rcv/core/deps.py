@@ -0,0 +1,183 @@
+"""Discovery of the local files a resume source pulls in at build time."""
+
+import os
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Set
+
+
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*")
+_LATEX_INPUT_RE = re.compile(r"\\(input|include)\s*\{([^}]+)\}")
+_LATEX_GRAPHICS_RE = re.compile(r"\\includegraphics\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}")
+_LATEX_PACKAGE_RE = re.compile(
+    r"\\(usepackage|documentclass)\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}"
+)
+_TYPST_COMMENT_RE = re.compile(r"(?<!:)//.*")
+_TYPST_REF_RE = re.compile(
+    r"#?\b(import|include|image|read|json|yaml|toml|csv)\s*\(?\s*\"([^\"]+)\""
+)
+
+GRAPHICS_EXTENSIONS = (".pdf", ".png", ".jpg", ".jpeg", ".eps")
+
+
+class Reference(NamedTuple):
+    """A file named in a source, as written, with its 1-based line number.
+
+    kind is the LaTeX command (input, include, includegraphics, usepackage,
+    documentclass) or the typst function (import, include, image, read...).
+    """
+
+    kind: str
+    target: str
+    line: int
+
+
+def _line_of(text: str, offset: int) -> int:
+    return text.count("\n", 0, offset) + 1
+
+
+def _latex_references(text: str) -> List[Reference]:
+    # Comments are blanked within their line, so offsets keep line numbers.
+    text = _LATEX_COMMENT_RE.sub("", text)
+    refs = []
+    for match in _LATEX_INPUT_RE.finditer(text):
+        line = _line_of(text, match.start())
+        refs.append(Reference(match[1], match[2].strip(), line))
+    for match in _LATEX_GRAPHICS_RE.finditer(text):
+        line = _line_of(text, match.start())
+        refs.append(Reference("includegraphics", match[1].strip(), line))
+    for match in _LATEX_PACKAGE_RE.finditer(text):
+        line = _line_of(text, match.start())
+        for name in match[2].split(","):
+            refs.append(Reference(match[1], name.strip(), line))
+    return refs
+
+
+def _typst_references(text: str) -> List[Reference]:
+    text = _TYPST_COMMENT_RE.sub("", text)
+    return [
+        Reference(match[1], match[2], _line_of(text, match.start()))
+        for match in _TYPST_REF_RE.finditer(text)
+    ]
+
+
+def find_references(text: str, format: str) -> List[Reference]:
+    """List the files a source names, whether or not they exist."""
+    if format == "typst":
+        return _typst_references(text)
+    return _latex_references(text)
+
+
+def _first_existing(candidates: Sequence[Path]) -> Optional[Path]:
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def resolve_reference(ref: Reference, base: Path, format: str) -> Optional[Path]:
+    """Find the local file a reference names, or None if there is none.
+
+    LaTeX references resolve against the main source's directory, typst
+    ones against the including file's directory. Typst package imports
+    and system LaTeX packages/classes are never local and give None.
+    """
+    if format == "typst":
+        if ref.target.startswith("@"):  # packages live outside the project
+            return None
+        return _first_existing([base / ref.target.lstrip("/")])
+    path = base / ref.target
+    if ref.kind == "includegraphics":
+        return _first_existing(
+            [path, *(path.with_name(path.name + e) for e in GRAPHICS_EXTENSIONS)]
+        )
+    if ref.kind in ("usepackage", "documentclass"):
+        suffix = ".cls" if ref.kind == "documentclass" else ".sty"
+        # Only project-local packages/classes; system ones are not found.
+        return _first_existing([base / f"{ref.target}{suffix}"])
+    return _first_existing([path, path.with_name(path.name + ".tex")])
+
+
+def _rebased(ref: Reference, old_base: Path, new_base: Path, format: str) -> str:
+    if ref.target.startswith("/") or ref.target.startswith("@"):
+        return ref.target
+    path = resolve_reference(ref, old_base, format)
+    if path is None or path.is_relative_to(old_base.resolve()):
+        return ref.target
+    target = Path(os.path.relpath(path, new_base.resolve())).as_posix()
+    if not ref.target.endswith(path.suffix):  # written without its extension
+        target = target[: -len(path.suffix)]
+    return target
+
+
+def rebase_references(text: str, format: str, old_base: Path, new_base: Path) -> str:
+    """Rewrite a source moving from old_base to new_base.
+
+    Relative references to existing files outside old_base (shared
+    preambles, the section library) are rewritten to resolve from
+    new_base; files inside old_base move along with the source and keep
+    their paths. Comments are left alone.
+    """
+    if format == "typst":
+        comment_re, patterns = _TYPST_COMMENT_RE, [(_TYPST_REF_RE, 1, 2)]
+    else:
+        comment_re = _LATEX_COMMENT_RE
+        patterns = [(_LATEX_INPUT_RE, 1, 2), (_LATEX_GRAPHICS_RE, None, 1)]
+
+    def rebase(match: "re.Match[str]", kind_group: Optional[int], group: int) -> str:
+        kind = match[kind_group] if kind_group is not None else "includegraphics"
+        target = match[group].strip()
+        rebased = _rebased(Reference(kind, target, 0), old_base, new_base, format)
+        if rebased == target:
+            return match[0]
+        start, end = match.span(group)
+        offset = match.start()
+        return match[0][: start - offset] + rebased + match[0][end - offset :]
+
+    lines = []
+    for line in text.splitlines(keepends=True):
+        comment = comment_re.search(line)
+        split = comment.start() if comment else len(line)
+        code = line[:split]
+        for pattern, kind_group, group in patterns:
+            code = pattern.sub(lambda m: rebase(m, kind_group, group), code)
+        lines.append(code + line[split:])
+    return "".join(lines)
+
+
+def find_dependencies(
+    source: Path, format: str, text: Optional[str] = None
+) -> List[Path]:
+    """Find the local files a source includes, recursively.
+
+    LaTeX \\input, \\include, \\includegraphics and project-local
+    \\usepackage/\\documentclass files are followed (relative to the
+    source directory, which is where rcv runs the compiler); typst
+    #import, #include, image() and data-loading calls are followed
+    relative to the including file. Missing files are ignored: the
+    compiler reports them. text, when given, stands in for the source's
+    content (e.g. for a packed resume).
+    """
+    source = source.resolve()
+    seen: Set[Path] = {source}
+    pending = [source]
+    deps: List[Path] = []
+    while pending:
+        current = pending.pop()
+        if current.suffix not in (".tex", ".typ", ".sty", ".cls"):
+            continue
+        if current == source and text is not None:
+            content = text
+        else:
+            try:
+                content = current.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+        base = current.parent if format == "typst" else source.parent
+        for ref in find_references(content, format):
+            path = resolve_reference(ref, base, format)
+            if path is not None and path not in seen:
+                seen.add(path)
+                deps.append(path)
+                pending.append(path)
+    return sorted(deps)
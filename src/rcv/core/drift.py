@@ -0,0 +1,258 @@
+"""Drift of variants relative to the parent content they were branched from."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rcv.core.cache import HashCache, JsonCache
+from rcv.core.delta import diffstat
+from rcv.core.objects import ObjectNotFoundError, ObjectStore
+from rcv.core.resume import Resume
+from rcv.utils.parallel import process_map
+
+
+STATE_UNCHANGED = "unchanged"
+STATE_EDITED = "edited"
+STATE_BEHIND = "behind"
+STATE_DIVERGED = "diverged"
+STATE_UNTRACKED = "untracked"
+STATE_MISSING = "missing"
+
+LineCounts = Tuple[int, int]
+
+
+@dataclass
+class DriftReport:
+    """How a variant relates to its branch base and its current parent."""
+
+    resume: Resume
+    state: str
+    local: Optional[LineCounts] = None  # base -> variant (+added, -removed)
+    behind: Optional[LineCounts] = None  # base -> current parent
+    unreadable: bool = False  # a source needed for the counts is not text
+
+
+class DiffstatCache:
+    """Diffstats between two object ids, cached across runs."""
+
+    def __init__(self, project_dir: Path):
+        self._cache = JsonCache.for_project(project_dir, "diffstat")
+
+    def get(self, a: str, b: str) -> Optional[LineCounts]:
+        value = self._cache.get(f"{a}:{b}")
+        return (value[0], value[1]) if value is not None else None
+
+    def set(self, a: str, b: str, counts: LineCounts) -> None:
+        self._cache.set(f"{a}:{b}", list(counts))
+
+    def save(self) -> None:
+        self._cache.save()
+
+
+def _diffstat_pair(texts: Tuple[str, str]) -> LineCounts:
+    return diffstat(texts[0], texts[1])
+
+
+def compute_diffstats(
+    pairs: Dict[Tuple[str, str], Tuple[str, str]],
+    jobs: Optional[int] = None,
+) -> Dict[Tuple[str, str], LineCounts]:
+    """Diffstat many (hash a, hash b) -> (text a, text b) pairs.
+
+    Large batches are spread over worker processes since line diffing is
+    CPU-bound pure Python.
+    """
+    keys = list(pairs)
+    results = process_map(_diffstat_pair, [pairs[key] for key in keys], jobs)
+    return dict(zip(keys, results))
+
+
+def hash_sources(
+    resumes: Iterable[Resume], hashes: HashCache, jobs: Optional[int] = None
+) -> Dict[Path, Optional[str]]:
+    """Hash resume sources in parallel, mapping resume path to object id."""
+
+    def _hash(resume: Resume) -> Tuple[Path, Optional[str]]:
+        try:
+            return resume.path, resume.source_hash(hashes)
+        except FileNotFoundError:
+            return resume.path, None
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return dict(pool.map(_hash, resumes))
+
+
+@dataclass
+class ParentDiff:
+    """Line changes from a variant's current parent to the variant."""
+
+    resume: Resume
+    parent: Optional[Resume]
+    counts: Optional[LineCounts] = None  # parent -> variant (+added, -removed)
+    identical: bool = False
+    unreadable: bool = False  # either source could not be read as text
+
+    @property
+    def missing(self) -> bool:
+        return self.counts is None and not self.identical and not self.unreadable
+
+
+def _resolve_parents(
+    variants: List[Resume], resumes: List[Resume]
+) -> Dict[Path, Resume]:
+    by_path = {r.path: r for r in resumes}
+    parents: Dict[Path, Resume] = {}
+    for variant in variants:
+        parent = by_path.get(variant.parent_path) or variant.get_parent()
+        if parent is not None:
+            parents[variant.path] = parent
+    return parents
+
+
+def compute_parent_diffs(
+    resumes: List[Resume], project_dir: Path, jobs: Optional[int] = None
+) -> List[ParentDiff]:
+    """Diffstat every variant in resumes against its current parent.
+
+    Pairs with identical content hashes are skipped outright, and counts
+    for previously seen (parent, variant) hash pairs come from the
+    diffstat cache; only new pairs are read and diffed, in parallel.
+    """
+    hashes = HashCache(project_dir)
+    stats = DiffstatCache(project_dir)
+
+    variants = [r for r in resumes if r.parent_path is not None]
+    parents = _resolve_parents(variants, resumes)
+    to_hash = {r.path: r for r in [*variants, *parents.values()]}
+    source_hashes = hash_sources(to_hash.values(), hashes, jobs)
+
+    results: List[ParentDiff] = []
+    wanted: List[Tuple[ParentDiff, str, str]] = []
+    pending: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for variant in variants:
+        parent = parents.get(variant.path)
+        result = ParentDiff(variant, parent)
+        results.append(result)
+        current = source_hashes.get(variant.path)
+        parent_hash = source_hashes.get(parent.path) if parent is not None else None
+        if current is None or parent_hash is None:
+            continue
+        if current == parent_hash:
+            result.identical = True
+            continue
+        wanted.append((result, parent_hash, current))
+        if stats.get(parent_hash, current) is not None:
+            continue
+        if (parent_hash, current) in pending:
+            continue
+        try:
+            texts = (parent.read_source(), variant.read_source())
+        except (OSError, ValueError):
+            result.unreadable = True
+            continue
+        pending[(parent_hash, current)] = texts
+
+    for (a, b), counts in compute_diffstats(pending, jobs).items():
+        stats.set(a, b, counts)
+    for result, a, b in wanted:
+        result.counts = stats.get(a, b)
+        if result.counts is not None:
+            result.unreadable = False
+
+    hashes.save()
+    stats.save()
+    return results
+
+
+def compute_drift(
+    resumes: List[Resume], project_dir: Path, jobs: Optional[int] = None
+) -> List[DriftReport]:
+    """Classify every variant in resumes against its branch base and parent.
+
+    Source hashes come from the stat-validated hash cache and line counts
+    from the diffstat cache, so re-running on an unchanged tree reads no
+    file contents.
+    """
+    hashes = HashCache(project_dir)
+    store = ObjectStore.for_project(project_dir)
+    stats = DiffstatCache(project_dir)
+
+    variants = [r for r in resumes if r.parent_path is not None]
+    parents = _resolve_parents(variants, resumes)
+
+    to_hash = {r.path: r for r in [*variants, *parents.values()]}
+    source_hashes = hash_sources(to_hash.values(), hashes, jobs)
+
+    reports: List[DriftReport] = []
+    wanted: List[Tuple[DriftReport, str, str, str]] = []
+    for variant in variants:
+        current = source_hashes.get(variant.path)
+        parent = parents.get(variant.path)
+        parent_hash = source_hashes.get(parent.path) if parent is not None else None
+        base = variant.metadata.base_hash
+
+        if current is None or parent_hash is None:
+            reports.append(DriftReport(variant, STATE_MISSING))
+            continue
+        if base is None:
+            reports.append(DriftReport(variant, STATE_UNTRACKED))
+            continue
+
+        edited = current != base
+        behind = parent_hash != base
+        if edited and behind:
+            state = STATE_DIVERGED
+        elif edited:
+            state = STATE_EDITED
+        elif behind:
+            state = STATE_BEHIND
+        else:
+            state = STATE_UNCHANGED
+
+        report = DriftReport(variant, state)
+        reports.append(report)
+        if edited:
+            wanted.append((report, "local", base, current))
+        if behind:
+            wanted.append((report, "behind", base, parent_hash))
+
+    # Resolve line counts from the cache, diffing only unseen pairs.
+    texts: Dict[str, Optional[str]] = {}
+    unreadable: Set[str] = set()
+
+    def _text(oid: str, resume: Resume) -> Optional[str]:
+        if oid not in texts:
+            try:
+                texts[oid] = store.get_text(oid)
+            except ObjectNotFoundError:
+                try:
+                    source = resume.read_source()
+                    texts[oid] = source if resume.source_hash(hashes) == oid else None
+                except (OSError, ValueError):
+                    texts[oid] = None
+                    unreadable.add(oid)
+        return texts[oid]
+
+    pending: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for report, kind, a, b in wanted:
+        if stats.get(a, b) is not None or (a, b) in pending:
+            continue
+        owner = report.resume if kind == "local" else parents[report.resume.path]
+        text_a = _text(a, report.resume)
+        text_b = _text(b, owner)
+        if text_a is not None and text_b is not None:
+            pending[(a, b)] = (text_a, text_b)
+
+    for (a, b), counts in compute_diffstats(pending, jobs).items():
+        stats.set(a, b, counts)
+
+    for report, kind, a, b in wanted:
+        counts = stats.get(a, b)
+        setattr(report, kind, counts)
+        if counts is None and (a in unreadable or b in unreadable):
+            report.unreadable = True
+
+    hashes.save()
+    stats.save()
+    return reports
@@ -0,0 +1,231 @@
+"""Supervised execution of compiler subprocesses for builds."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, List, Optional, Sequence
+
+from rcv.core.config import Config
+
+try:
+    import resource
+except ModuleNotFoundError:  # pragma: no cover - Windows
+    resource = None
+
+
+# Used when .rcv.toml sets no build_timeout; 0 disables the timeout.
+DEFAULT_TIMEOUT = 300.0
+
+KILL_TIMEOUT = "timeout"
+KILL_CPU = "cpu limit"
+KILL_MEMORY = "memory limit"
+KILL_CANCELLED = "cancelled"
+
+_MEMORY_MARKERS = ("out of memory", "can't allocate", "cannot allocate", "memoryerror")
+
+
+@dataclass
+class JobLimits:
+    """Per-job resource limits; None means unlimited."""
+
+    timeout: Optional[float] = DEFAULT_TIMEOUT  # wall-clock seconds
+    cpu_seconds: Optional[int] = None
+    memory_mb: Optional[int] = None
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of one supervised subprocess."""
+
+    argv: List[str]
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    duration: float
+    killed: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.killed is None and self.returncode == 0
+
+
+@dataclass
+class KilledJob:
+    """A job whose process was killed by the engine or a resource limit."""
+
+    job: str
+    reason: str
+    duration: float
+    command: str
+
+
+def _resource_limiter(limits: JobLimits) -> Optional[Callable[[], None]]:
+    """Build a preexec function applying CPU and memory rlimits (POSIX)."""
+    if resource is None or (limits.cpu_seconds is None and limits.memory_mb is None):
+        return None
+
+    def apply() -> None:
+        if limits.cpu_seconds is not None:
+            # Soft limit sends SIGXCPU; the hard limit follows with SIGKILL.
+            seconds = max(1, int(limits.cpu_seconds))
+            resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 5))
+        if limits.memory_mb is not None:
+            size = int(limits.memory_mb) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (size, size))
+
+    return apply
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a process and everything it spawned."""
+    if process.returncode is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:  # pragma: no cover - Windows
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _limit_reason(result: ProcessResult, limits: JobLimits) -> Optional[str]:
+    """Attribute a failed exit to a resource limit, if one was likely hit."""
+    code = result.returncode
+    if code is None or code == 0:
+        return None
+    if limits.cpu_seconds is not None and code in (
+        -getattr(signal, "SIGXCPU", 24),
+        -signal.SIGKILL,
+    ):
+        return KILL_CPU
+    if limits.memory_mb is not None:
+        output = f"{result.stdout}\n{result.stderr}".lower()
+        if code in (-signal.SIGSEGV, -signal.SIGABRT) or any(
+            marker in output for marker in _MEMORY_MARKERS
+        ):
+            return KILL_MEMORY
+    return None
+
+
+class BuildEngine:
+    """Run compiler subprocesses with timeouts, rlimits and a global job cap.
+
+    Every subprocess runs in its own session with stdin closed, so a
+    compiler waiting for interactive input fails instead of hanging. A job
+    that exceeds its wall-clock timeout, or whose coroutine is cancelled
+    (e.g. by Ctrl+C), has its whole process group killed. Killed jobs are
+    collected in `killed` for reporting.
+    """
+
+    def __init__(self, jobs: Optional[int] = None, limits: Optional[JobLimits] = None):
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.limits = limits or JobLimits()
+        self.killed: List[KilledJob] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_config(cls, config: Config, jobs: Optional[int] = None) -> "BuildEngine":
+        """Create an engine with the project's configured limits."""
+        timeout = config.build_timeout
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        return cls(
+            jobs=jobs or config.build_jobs,
+            limits=JobLimits(
+                timeout=timeout or None,
+                cpu_seconds=config.build_cpu_limit,
+                memory_mb=config.build_memory_limit,
+            ),
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the engine's concurrent job slots."""
+        # Created lazily: a semaphore belongs to the loop it is first used in.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.jobs)
+        async with self._semaphore:
+            yield
+
+    async def run(
+        self, job: str, argv: Sequence[str], cwd: Optional[Path] = None
+    ) -> ProcessResult:
+        """Run one subprocess of a job under the engine's limits."""
+        limits = self.limits
+        started = time.monotonic()
+        spawn = asyncio.ensure_future(
+            asyncio.create_subprocess_exec(
+                *argv,
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=os.name == "posix",
+                preexec_fn=_resource_limiter(limits),
+            )
+        )
+        try:
+            process = await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            # Cancelled while the child was starting: it may already be
+            # running, so let the start finish, then kill and reap it.
+            try:
+                process = await spawn
+            except Exception:
+                raise asyncio.CancelledError() from None
+            _kill(process)
+            self._record(job, KILL_CANCELLED, started, argv)
+            await process.wait()
+            raise
+        timeout = limits.timeout if limits.timeout else None
+        killed: Optional[str] = None
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            killed = KILL_TIMEOUT
+            _kill(process)
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            _kill(process)
+            self._record(job, KILL_CANCELLED, started, argv)
+            # Reap the child before the loop closes.
+            await process.wait()
+            raise
+
+        result = ProcessResult(
+            argv=list(argv),
+            returncode=process.returncode,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+            duration=time.monotonic() - started,
+            killed=killed,
+        )
+        result.killed = result.killed or _limit_reason(result, limits)
+        if result.killed is not None:
+            self._record(job, result.killed, started, argv)
+        return result
+
+    def run_sync(
+        self, job: str, argv: Sequence[str], cwd: Optional[Path] = None
+    ) -> ProcessResult:
+        """Run one subprocess outside of an event loop."""
+        return asyncio.run(self.run(job, argv, cwd))
+
+    def _record(
+        self, job: str, reason: str, started: float, argv: Sequence[str]
+    ) -> None:
+        self.killed.append(
+            KilledJob(
+                job=job,
+                reason=reason,
+                duration=time.monotonic() - started,
+                command=" ".join(str(arg) for arg in argv),
+            )
+        )
+
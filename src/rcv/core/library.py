@@ -0,0 +1,237 @@
+"""Project-level library of resume sections shared by include.
+
+A section that many variants carry verbatim (an experience or education
+entry) lives once in assets/sections/<name>.tex (or .typ), and each
+resume includes it. Builds already hash a resume's includes, so editing
+a library section marks exactly the resumes that include it as stale.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rcv.core.deps import find_dependencies, find_references, resolve_reference
+from rcv.core.objects import ObjectNotFoundError
+from rcv.core.resume import Resume
+from rcv.core.sections import Section, parse_sections
+from rcv.core.storage import atomic_write_text
+
+
+LIBRARY_DIR = Path("assets") / "sections"
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_LATEX_END_DOCUMENT_RE = re.compile(r"^\s*\\end\{document\}")
+_INCLUDE_COMMANDS = ("\\input", "\\include", "#include")
+
+
+class LibraryError(ValueError):
+    """Raised when a section cannot be moved into or out of the library."""
+
+
+class UnreadableSourceError(LibraryError):
+    """Raised when a resume source cannot be read as UTF-8 text."""
+
+
+def _read_source(resume: Resume) -> str:
+    try:
+        return resume.read_source()
+    except (OSError, ValueError, ObjectNotFoundError) as e:
+        raise UnreadableSourceError(
+            f"Cannot read the source of {resume.full_name}: {e}"
+        ) from e
+
+
+def library_dir(project_dir: Path) -> Path:
+    """Get the directory holding the project's shared sections."""
+    return project_dir / LIBRARY_DIR
+
+
+def section_slug(title: str) -> str:
+    """A library name for a section title ("Work Experience" -> work-experience)."""
+    return _SLUG_RE.sub("-", title.casefold()).strip("-") or "section"
+
+
+def library_file(project_dir: Path, name: str, format: str) -> Path:
+    ext = ".tex" if format == "latex" else ".typ"
+    return library_dir(project_dir) / f"{name}{ext}"
+
+
+def include_line(path: Path, resume_dir: Path, format: str) -> str:
+    """The line that includes a library file from a resume directory."""
+    target = Path(os.path.relpath(path, resume_dir)).as_posix()
+    if format == "typst":
+        return f'#include "{target}"\n'
+    return f"\\input{{{target}}}\n"
+
+
+def normalize_section(text: str) -> str:
+    """Section text for comparison: trailing whitespace does not count."""
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+def _matches(section: Section, title: str) -> bool:
+    wanted = title.casefold()
+    return (
+        section.title.casefold() == wanted
+        or "/".join(section.path).casefold() == wanted
+    )
+
+
+def _ends_section(line: str, format: str) -> bool:
+    """Whether a line after a heading ends the section's content.
+
+    Sections that were moved to the library earlier are included right
+    after the one before them, so their include lines end it too.
+    """
+    if format == "latex" and _LATEX_END_DOCUMENT_RE.match(line):
+        return True
+    return line.lstrip().startswith(_INCLUDE_COMMANDS) and (
+        f"{LIBRARY_DIR.as_posix()}/" in line
+    )
+
+
+def find_section(text: str, format: str, title: str) -> Optional[Tuple[int, int]]:
+    """Find a section by title (or path like "Experience/Acme") in a source.
+
+    Returns the [start, end) line range of its heading, content and
+    subsections, without the blank lines that follow it, LaTeX's
+    \\end{document} or library includes. Raises LibraryError if the title
+    is ambiguous.
+    """
+    sections = parse_sections(text, format)
+    starts = []
+    line = 0
+    for section in sections:
+        starts.append(line)
+        line += section.text.count("\n") + (0 if section.text.endswith("\n") else 1)
+    found = [i for i, section in enumerate(sections) if _matches(section, title)]
+    if not found:
+        return None
+    if len(found) > 1:
+        raise LibraryError(f"More than one section is titled '{title}'")
+
+    index = found[0]
+    target = sections[index]
+    end = index + 1
+    while (
+        end < len(sections)
+        and sections[end].path[: len(target.path)] == target.path
+        and sections[end].level > target.level
+    ):
+        end += 1
+
+    lines = text.splitlines(keepends=True)
+    stop = starts[end] if end < len(sections) else len(lines)
+    start = starts[index]
+    for i in range(start + 1, stop):
+        if _ends_section(lines[i], format):
+            stop = i
+            break
+    while stop > start + 1 and not lines[stop - 1].strip():
+        stop -= 1
+    return start, stop
+
+
+@dataclass
+class SectionEdit:
+    """A resume source with one section swapped for an include (or back)."""
+
+    resume: Resume
+    text: str  # the new source
+    section: str  # the section text that moved
+
+
+def apply_edit(edit: SectionEdit) -> None:
+    """Write an edited source, unpacking the resume first if needed."""
+    edit.resume.ensure_source_file()
+    atomic_write_text(edit.resume.resume_file, edit.text)
+
+
+def plan_extract(resume: Resume, title: str, path: Path) -> Optional[SectionEdit]:
+    """Replace a resume's section with an include of the library file path.
+
+    None if the resume has no such section. Raises UnreadableSourceError
+    if the source is not UTF-8 text.
+    """
+    format = resume.metadata.format
+    source = _read_source(resume)
+    span = find_section(source, format, title)
+    if span is None:
+        return None
+    lines = source.splitlines(keepends=True)
+    start, stop = span
+    section = "".join(lines[start:stop])
+    if not section.endswith("\n"):
+        section += "\n"
+    include = include_line(path, resume.path, format)
+    text = "".join(lines[:start]) + include + "".join(lines[stop:])
+    return SectionEdit(resume, text, section)
+
+
+def plan_inline(resume: Resume, path: Path) -> Optional[SectionEdit]:
+    """Replace a resume's include of a library file with the file's content.
+
+    None if the resume does not include the file. Raises LibraryError if
+    the include shares its line with other text, or UnreadableSourceError
+    if the source is not UTF-8 text.
+    """
+    format = resume.metadata.format
+    source = _read_source(resume)
+    path = path.resolve()
+    lines = source.splitlines(keepends=True)
+    for ref in find_references(source, format):
+        if resolve_reference(ref, resume.path, format) != path:
+            continue
+        line = lines[ref.line - 1]
+        alone = line.strip().startswith(_INCLUDE_COMMANDS)
+        if not alone or len(find_references(line, format)) != 1:
+            raise LibraryError(
+                f"{resume.full_name}:{ref.line}: the include of {path.name} "
+                "is not on a line of its own"
+            )
+        try:
+            section = path.read_text(encoding="utf-8")
+        except (OSError, ValueError) as e:
+            raise LibraryError(f"Cannot read {path.name}: {e}") from e
+        if not section.endswith("\n"):
+            section += "\n"
+        text = "".join(lines[: ref.line - 1]) + section + "".join(lines[ref.line :])
+        return SectionEdit(resume, text, section)
+    return None
+
+
+def section_users(
+    resumes: List[Resume],
+    project_dir: Path,
+    unreadable: Optional[List[Resume]] = None,
+) -> Dict[Path, List[Resume]]:
+    """Map each library file to the resumes that include it.
+
+    Follows the same includes as the build, so a library section included
+    from another included file counts too. Packed sources are only
+    scanned for their direct includes; those that cannot be read are
+    skipped, and collected in unreadable if a list is given.
+    """
+    root = library_dir(project_dir).resolve()
+    users: Dict[Path, List[Resume]] = {}
+    for resume in resumes:
+        format = resume.metadata.format
+        if resume.is_packed:
+            try:
+                source = _read_source(resume)
+            except UnreadableSourceError:
+                if unreadable is not None:
+                    unreadable.append(resume)
+                continue
+            deps = [
+                resolve_reference(ref, resume.path, format)
+                for ref in find_references(source, format)
+            ]
+        else:
+            deps = find_dependencies(resume.resume_file, format)
+        for dep in deps:
+            if dep is not None and dep.parent == root:
+                users.setdefault(dep, []).append(resume)
+    return users
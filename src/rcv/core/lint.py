@@ -0,0 +1,415 @@
+"""Static checks of resume sources, far cheaper than compiling them.
+
+`rcv check` and batch builds run these to catch broken sources before
+spending compiler passes on them. The text checks of a file (braces,
+environments, package imports) are cached by content hash; checks that
+depend on other files (inputs, images, imports) are redone every run,
+which costs a stat() per reference.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from rcv.core.cache import HashCache, JsonCache
+from rcv.core.deps import Reference, find_references, resolve_reference
+from rcv.core.resume import Resume
+from rcv.utils.parallel import process_map
+
+
+LINT_CACHE = "lint"
+# Bump when the text checks change, so cached results are recomputed.
+LINT_VERSION = 2
+
+# Included files that are checked themselves, not just for existence.
+_SOURCE_SUFFIXES = (".tex", ".typ")
+
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*")
+_VERBATIM_RE = re.compile(
+    r"\\begin\{(verbatim\*?|lstlisting|minted|comment)\}.*?\\end\{\1\}", re.S
+)
+_VERB_RE = re.compile(r"\\verb\*?([^a-zA-Z\s*])(.*?)\1")
+# hyperref reads URLs verbatim, so % and # in them are not special.
+_URL_RE = re.compile(r"(\\(?:url|nolinkurl|href)\s*\{)([^{}\n]*)(?=\})")
+_DEFINITION_RE = re.compile(
+    r"\\(?:(?:re)?newcommand|providecommand|DeclareRobustCommand"
+    r"|(?P<env>(?:re)?newenvironment))\*?|\\[gex]?def(?![a-zA-Z@])"
+)
+_CONTROL_SEQUENCE_RE = re.compile(r"\\(?:[a-zA-Z@]+|.)")
+_ENV_RE = re.compile(r"\\(begin|end)\s*\{([^}]*)\}")
+_GRAPHICSPATH_RE = re.compile(r"\\graphicspath\s*\{\s*((?:\{[^}]*\}\s*)+)\}")
+_LATEX_HINT_RE = re.compile(r"\\(?:documentclass|begin\s*\{document\})")
+_TYPST_HINT_RE = re.compile(r"^#(?:set|show|let|import)\b", re.M)
+_TYPST_PACKAGE_RE = re.compile(r"@[a-z0-9-]+/[a-zA-Z0-9_-]+:\d+\.\d+\.\d+")
+
+Problem = Tuple[Optional[int], str]
+
+
+@dataclass
+class LintIssue:
+    """A problem found in a file of a resume."""
+
+    file: str  # relative to the resume directory
+    line: Optional[int]
+    message: str
+
+    def __str__(self) -> str:
+        where = self.file if self.line is None else f"{self.file}:{self.line}"
+        return f"{where}: {self.message}"
+
+
+@dataclass
+class LintReport:
+    """The result of checking one resume."""
+
+    resume: Resume
+    issues: List[LintIssue] = field(default_factory=list)
+    files: int = 0  # source files checked
+    cached: int = 0  # of which the text checks came from the cache
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+def _blank(match: "re.Match[str]") -> str:
+    """Replace a match by spaces, keeping its newlines (and line numbers)."""
+    return re.sub(r"[^\n]", " ", match[0])
+
+
+def _group_end(text: str, start: int) -> int:
+    """Index just past the brace group opening at text[start]."""
+    depth = 0
+    i = start
+    while i < len(text):
+        char = text[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(text)
+
+
+def _mask_definitions(text: str) -> str:
+    """Blank the bodies of macro and environment definitions.
+
+    Resume templates often define one macro that opens a list and
+    another that closes it, so environments only have to balance
+    outside of definitions.
+    """
+    spans: List[Tuple[int, int]] = []
+    pos = 0
+    for match in _DEFINITION_RE.finditer(text):
+        if match.start() < pos:
+            continue  # inside a definition already masked
+        i = match.end()
+        while i < len(text) and text[i].isspace():
+            i += 1
+        # Skip the defined name: {\name}, \name or {envname}.
+        if text.startswith("{", i):
+            i = _group_end(text, i)
+        else:
+            name = _CONTROL_SEQUENCE_RE.match(text, i)
+            if name is not None:
+                i = name.end()
+        # Skip argument specs ([1][default], #1#2) up to the body.
+        body = text.find("{", i)
+        if body < 0:
+            break
+        pos = body
+        for _ in range(2 if match["env"] else 1):
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+            if not text.startswith("{", pos):
+                break
+            end = _group_end(text, pos)
+            spans.append((pos + 1, end - 1))
+            pos = end
+
+    parts = []
+    last = 0
+    for start, end in spans:
+        parts.append(text[last:start])
+        parts.append(re.sub(r"[^\n]", " ", text[start:end]))
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _brace_problems(text: str) -> List[Problem]:
+    problems: List[Problem] = []
+    opened: List[int] = []
+    line = 1
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "\\":
+            if text.startswith("\n", i + 1):
+                line += 1
+            i += 2
+            continue
+        if char == "\n":
+            line += 1
+        elif char == "{":
+            opened.append(line)
+        elif char == "}":
+            if opened:
+                opened.pop()
+            else:
+                problems.append((line, "unmatched '}'"))
+        i += 1
+    problems.extend((at, "'{' is never closed") for at in opened)
+    return problems
+
+
+def _environment_problems(text: str) -> List[Problem]:
+    problems: List[Problem] = []
+    stack: List[Tuple[str, int]] = []
+    line, offset = 1, 0
+    for match in _ENV_RE.finditer(_mask_definitions(text)):
+        line += text.count("\n", offset, match.start())
+        offset = match.start()
+        name = match[2].strip()
+        if match[1] == "begin":
+            stack.append((name, line))
+        elif not stack:
+            problems.append((line, f"\\end{{{name}}} without a matching \\begin"))
+        elif stack[-1][0] != name:
+            opened, at = stack[-1]
+            problems.append(
+                (line, f"\\end{{{name}}} closes \\begin{{{opened}}} from line {at}")
+            )
+            if any(entry[0] == name for entry in stack):
+                while stack.pop()[0] != name:
+                    pass
+        else:
+            stack.pop()
+    problems.extend((at, f"\\begin{{{name}}} is never ended") for name, at in stack)
+    return problems
+
+
+def _blank_url(match: "re.Match[str]") -> str:
+    return match[1] + " " * len(match[2])
+
+
+def _latex_problems(text: str) -> List[Problem]:
+    text = _LATEX_COMMENT_RE.sub("", _URL_RE.sub(_blank_url, text))
+    text = _VERB_RE.sub(_blank, _VERBATIM_RE.sub(_blank, text))
+    problems = _brace_problems(text) + _environment_problems(text)
+    if "\\" not in text and _TYPST_HINT_RE.search(text):
+        problems.append((None, "looks like a Typst source, not LaTeX"))
+    return problems
+
+
+def _typst_problems(text: str, refs: List[Reference]) -> List[Problem]:
+    problems: List[Problem] = []
+    for ref in refs:
+        if ref.target.startswith("@") and not _TYPST_PACKAGE_RE.fullmatch(ref.target):
+            problems.append(
+                (
+                    ref.line,
+                    f'malformed package import "{ref.target}" '
+                    f"(expected @namespace/name:version)",
+                )
+            )
+    if _LATEX_HINT_RE.search(text):
+        problems.append((None, "looks like a LaTeX source, not Typst"))
+    return problems
+
+
+def scan_source(item: Tuple[str, str]) -> dict:
+    """Run the text checks on a (text, format) pair.
+
+    Returns a JSON-able dict of problems, references and (LaTeX)
+    \\graphicspath directories, as stored in the lint cache.
+    """
+    text, format = item
+    refs = find_references(text, format)
+    graphics_dirs: List[str] = []
+    if format == "typst":
+        problems = _typst_problems(text, refs)
+    else:
+        problems = _latex_problems(text)
+        for match in _GRAPHICSPATH_RE.finditer(_LATEX_COMMENT_RE.sub("", text)):
+            graphics_dirs.extend(re.findall(r"\{([^}]*)\}", match[1]))
+    return {
+        "problems": [list(problem) for problem in problems],
+        "refs": [list(ref) for ref in refs],
+        "graphicspath": graphics_dirs,
+    }
+
+
+@lru_cache(maxsize=None)
+def _in_tex_tree(name: str) -> bool:
+    """Whether the TeX installation has a file; True if that cannot be told."""
+    kpsewhich = shutil.which("kpsewhich")
+    if kpsewhich is None:
+        return True
+    try:
+        result = subprocess.run(
+            [kpsewhich, name], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return True
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+
+def _source_issue(resume: Resume) -> LintIssue:
+    """Explain why a resume's source file is missing."""
+    format = resume.metadata.format
+    other = "resume.typ" if format == "latex" else "resume.tex"
+    if (resume.path / other).is_file():
+        return LintIssue(
+            ".meta.json", None, f'format is "{format}" but the source is {other}'
+        )
+    return LintIssue(resume.resume_file.name, None, "source file not found")
+
+
+class _Walk:
+    """Follows one resume's includes, collecting its issues."""
+
+    def __init__(self, report: LintReport):
+        self.report = report
+        self.resume = report.resume
+        self.format = report.resume.metadata.format
+        self.seen: Set[Path] = {report.resume.resume_file.resolve()}
+        self.graphics: List[Tuple[str, Reference]] = []
+        self.graphics_dirs: List[str] = []
+
+    def display(self, path: Path) -> str:
+        return os.path.relpath(path.resolve(), self.resume.path.resolve())
+
+    def issue(self, file: str, line: Optional[int], message: str) -> None:
+        self.report.issues.append(LintIssue(file, line, message))
+
+    def missing(self, ref: Reference) -> bool:
+        """Whether an unresolved reference is an error."""
+        if self.format == "typst":
+            return not ref.target.startswith("@")
+        if "\\" in ref.target or "#" in ref.target:
+            return False  # built by a macro; only the compiler can tell
+        if "/" in ref.target:
+            return True
+        # A bare name may be a file of the TeX installation (glyphtounicode).
+        name = ref.target if Path(ref.target).suffix else f"{ref.target}.tex"
+        return not _in_tex_tree(name)
+
+    def apply(self, path: Path, scan: dict, cached: bool) -> List[Path]:
+        """Record a file's scan results; returns included sources to check."""
+        self.report.files += 1
+        self.report.cached += cached
+        rel = self.display(path)
+        for line, message in scan["problems"]:
+            self.issue(rel, line, message)
+        self.graphics_dirs.extend(scan["graphicspath"])
+
+        # LaTeX resolves against the main source's directory, which is
+        # where rcv runs the compiler; typst against the including file.
+        base = path.parent if self.format == "typst" else self.resume.path
+        included = []
+        for kind, target, line in scan["refs"]:
+            ref = Reference(kind, target, line)
+            if self.format == "latex":
+                if kind in ("usepackage", "documentclass"):
+                    continue
+                if kind == "includegraphics":
+                    self.graphics.append((rel, ref))
+                    continue
+            found = resolve_reference(ref, base, self.format)
+            if found is None:
+                if self.missing(ref):
+                    self.issue(rel, line, self.not_found(ref))
+            elif found.suffix in _SOURCE_SUFFIXES and found not in self.seen:
+                self.seen.add(found)
+                included.append(found)
+        return included
+
+    def not_found(self, ref: Reference) -> str:
+        if self.format == "typst":
+            return f'{ref.kind} "{ref.target}": file not found'
+        return f"\\{ref.kind}{{{ref.target}}}: file not found"
+
+    def check_graphics(self) -> None:
+        """Check images once every file's \\graphicspath is known."""
+        bases = [self.resume.path] + [
+            self.resume.path / directory for directory in self.graphics_dirs
+        ]
+        for rel, ref in self.graphics:
+            if not any(resolve_reference(ref, base, "latex") for base in bases):
+                self.issue(rel, ref.line, self.not_found(ref))
+
+
+def lint_resumes(
+    resumes: List[Resume], project_dir: Path, jobs: Optional[int] = None
+) -> List[LintReport]:
+    """Check resume sources and the files they include, in parallel.
+
+    Files are processed in rounds (main sources, then what they include,
+    and so on). Each round scans the files not in the lint cache across
+    all resumes at once, spread over worker processes; a file shared by
+    several resumes is scanned once.
+    """
+    hashes = HashCache(project_dir)
+    cache = JsonCache.for_project(project_dir, LINT_CACHE)
+
+    reports: List[LintReport] = []
+    walks: List[_Walk] = []
+    todo: List[Tuple[_Walk, Path]] = []
+    for resume in resumes:
+        report = LintReport(resume)
+        reports.append(report)
+        if not resume.has_source():
+            report.issues.append(_source_issue(resume))
+            continue
+        walk = _Walk(report)
+        walks.append(walk)
+        todo.append((walk, resume.resume_file))
+
+    while todo:
+        keyed: List[Tuple[_Walk, Path, str, bool]] = []
+        pending: Dict[str, Tuple[str, str]] = {}
+        for walk, path in todo:
+            packed = path == walk.resume.resume_file and walk.resume.is_packed
+            try:
+                digest = walk.resume.source_hash() if packed else hashes.hash_file(path)
+                key = f"{LINT_VERSION}:{walk.format}:{digest}"
+                cached = cache.get(key) is not None
+                if not cached and key not in pending:
+                    if packed:
+                        text = walk.resume.read_source()
+                    else:
+                        text = path.read_bytes().decode("utf-8")
+                    pending[key] = (text, walk.format)
+            except (OSError, ValueError) as e:
+                walk.issue(walk.display(path), None, f"cannot read: {e}")
+                continue
+            keyed.append((walk, path, key, cached))
+
+        scans = process_map(scan_source, list(pending.values()), jobs)
+        for key, scan in zip(pending, scans):
+            cache.set(key, scan)
+
+        todo = []
+        for walk, path, key, cached in keyed:
+            for included in walk.apply(path, cache.get(key), cached):
+                todo.append((walk, included))
+
+    for walk in walks:
+        walk.check_graphics()
+    for report in reports:
+        report.issues.sort(key=lambda issue: (issue.file, issue.line or 0))
+
+    hashes.save()
+    cache.save()
+    return reports
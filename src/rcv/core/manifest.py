@@ -0,0 +1,323 @@
+"""Build manifest recording which inputs produced each output PDF."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from rcv.core.backends import Backend, get_backend
+from rcv.core.cache import HashCache
+from rcv.core.pages import PageCheck
+from rcv.core.resume import Resume
+from rcv.core.storage import atomic_write_text, file_lock
+
+
+MANIFEST_FILE = ".rcv-manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class BuildInputs:
+    """Everything that determines the PDF a resume builds to."""
+
+    format: str
+    compiler: str
+    source_hash: str
+    dependencies: Dict[Path, str]
+    source_dir: Path
+    profile: str = ""  # BuildProfile.fingerprint()
+    backend: str = ""  # empty for the format's built-in backend
+
+    @property
+    def input_hash(self) -> str:
+        """Hash of the effective build input.
+
+        Dependencies are keyed by their path relative to the source
+        directory, i.e. as the source refers to them, so two byte-identical
+        sources only share a hash when their includes resolve to identical
+        files too.
+        """
+        h = hashlib.sha256()
+        for part in (self.format, self.compiler, self.source_hash):
+            h.update(part.encode("utf-8") + b"\0")
+        if self.profile:
+            h.update(f"profile\0{self.profile}\0".encode("utf-8"))
+        if self.backend:
+            h.update(f"backend\0{self.backend}\0".encode("utf-8"))
+        for path, digest in sorted(
+            (os.path.relpath(p, self.source_dir), d)
+            for p, d in self.dependencies.items()
+        ):
+            h.update(f"{path}\0{digest}\0".encode("utf-8"))
+        return h.hexdigest()
+
+
+def backend_id(backend: Backend, format: str) -> str:
+    """How a backend is recorded: empty for the format's built-in one.
+
+    Keeps manifests written before backends were selectable valid.
+    """
+    return "" if backend.name == format else backend.name
+
+
+def collect_inputs(
+    resume: Resume,
+    compiler: str,
+    hashes: HashCache,
+    profile: str = "",
+    backend: Optional[Backend] = None,
+) -> BuildInputs:
+    """Hash a resume's source and the dependencies its backend discovers.
+
+    Raises OSError if the source or a dependency cannot be read.
+    """
+    format = resume.metadata.format
+    backend = backend or get_backend(format)
+    dependencies = {
+        dep: hashes.hash_file(dep)
+        for dep in backend.dependencies(resume.resume_file, format)
+    }
+    return BuildInputs(
+        format=resume.metadata.format,
+        compiler=compiler,
+        source_hash=resume.source_hash(hashes),
+        dependencies=dependencies,
+        source_dir=resume.resume_file.parent.resolve(),
+        profile=profile,
+        backend=backend_id(backend, format),
+    )
+
+
+@dataclass
+class ManifestEntry:
+    """The inputs and output of one resume's last successful build.
+
+    Paths are stored relative to the project (dependencies) or the output
+    root (output) when possible, so the tree can be moved.
+    """
+
+    source_hash: str
+    compiler: str
+    output: str
+    output_hash: str
+    dependencies: Dict[str, str] = field(default_factory=dict)
+    input_hash: Optional[str] = None
+    profile: str = ""
+    backend: str = ""
+    built_at: datetime = field(default_factory=datetime.now)
+    # Post-build checks; pages is None when they did not run
+    pages: Optional[int] = None
+    overfull: List[str] = field(default_factory=list)
+    overfull_count: int = 0
+
+    def to_dict(self) -> dict:
+        data = {
+            "source_hash": self.source_hash,
+            "dependencies": self.dependencies,
+            "compiler": self.compiler,
+            "output": self.output,
+            "output_hash": self.output_hash,
+            "built_at": self.built_at.isoformat(),
+        }
+        if self.input_hash is not None:
+            data["input_hash"] = self.input_hash
+        if self.profile:
+            data["profile"] = self.profile
+        if self.backend:
+            data["backend"] = self.backend
+        if self.pages is not None:
+            data["pages"] = self.pages
+        if self.overfull_count:
+            data["overfull"] = self.overfull
+            data["overfull_count"] = self.overfull_count
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ManifestEntry":
+        return cls(
+            source_hash=data["source_hash"],
+            dependencies=dict(data.get("dependencies", {})),
+            compiler=data["compiler"],
+            output=data["output"],
+            output_hash=data["output_hash"],
+            input_hash=data.get("input_hash"),
+            profile=data.get("profile", ""),
+            backend=data.get("backend", ""),
+            built_at=datetime.fromisoformat(data["built_at"]),
+            pages=data.get("pages"),
+            overfull=list(data.get("overfull", [])),
+            overfull_count=int(data.get("overfull_count", 0)),
+        )
+
+    @property
+    def page_check(self) -> Optional[PageCheck]:
+        """The recorded post-build check results, if the checks ran."""
+        if self.pages is None and not self.overfull_count:
+            return None
+        return PageCheck(self.pages, None, self.overfull, self.overfull_count)
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return str(path.resolve())
+
+
+def _absolute(stored: str, root: Path) -> Path:
+    path = Path(stored)
+    return path if path.is_absolute() else root / path
+
+
+class BuildManifest:
+    """Manifest of builds in an output root, keyed by resume full name.
+
+    The file lives in the output root itself so it describes exactly the
+    PDFs found there. Changes are merged into the on-disk manifest under
+    a lock, so concurrent builds do not drop each other's entries.
+    """
+
+    def __init__(self, output_root: Path, project_dir: Path):
+        self.output_root = output_root
+        self.project_dir = project_dir
+        self.entries: Dict[str, ManifestEntry] = self._read()
+        self._changed: Dict[str, Optional[ManifestEntry]] = {}
+
+    @property
+    def path(self) -> Path:
+        return self.output_root / MANIFEST_FILE
+
+    def _read(self) -> Dict[str, ManifestEntry]:
+        try:
+            data = json.loads(self.path.read_text())
+            return {
+                name: ManifestEntry.from_dict(entry)
+                for name, entry in data.get("resumes", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def get(self, name: str) -> Optional[ManifestEntry]:
+        return self.entries.get(name)
+
+    def record(
+        self,
+        name: str,
+        inputs: BuildInputs,
+        output_file: Path,
+        output_hash: str,
+        check: Optional[PageCheck] = None,
+    ) -> ManifestEntry:
+        """Record a successful build and its post-build check results."""
+        entry = ManifestEntry(
+            source_hash=inputs.source_hash,
+            dependencies={
+                _relative(path, self.project_dir): digest
+                for path, digest in sorted(inputs.dependencies.items())
+            },
+            compiler=inputs.compiler,
+            output=_relative(output_file, self.output_root),
+            output_hash=output_hash,
+            input_hash=inputs.input_hash,
+            profile=inputs.profile,
+            backend=inputs.backend,
+        )
+        if check is not None:
+            entry.pages = check.pages
+            entry.overfull = check.overfull
+            entry.overfull_count = check.overfull_count or 0
+        self.entries[name] = entry
+        self._changed[name] = entry
+        return entry
+
+    def find_build(
+        self, input_hash: str, hashes: HashCache
+    ) -> Optional[ManifestEntry]:
+        """Find a build from the same input whose output is still intact."""
+        for entry in self.entries.values():
+            if entry.input_hash != input_hash:
+                continue
+            try:
+                if hashes.hash_file(self.output_path(entry)) == entry.output_hash:
+                    return entry
+            except OSError:
+                continue
+        return None
+
+    def find_output(self, input_hash: str, hashes: HashCache) -> Optional[Path]:
+        """Find an intact output previously built from the same input."""
+        entry = self.find_build(input_hash, hashes)
+        return self.output_path(entry) if entry is not None else None
+
+    def remove(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self._changed[name] = None
+
+    def output_path(self, entry: ManifestEntry) -> Path:
+        return _absolute(entry.output, self.output_root)
+
+    def dependency_paths(self, entry: ManifestEntry) -> List[Path]:
+        return [_absolute(dep, self.project_dir) for dep in entry.dependencies]
+
+    def is_stale(
+        self,
+        name: str,
+        source_hash: Optional[str],
+        compiler: str,
+        output_file: Path,
+        hashes: HashCache,
+        profile: str = "",
+        backend: str = "",
+    ) -> bool:
+        """Check whether a resume's output no longer matches its inputs.
+
+        An entry is fresh only if the source, every recorded dependency,
+        the compiler, the build profile and backend and the output file
+        itself are all unchanged.
+        """
+        entry = self.entries.get(name)
+        if entry is None or source_hash is None:
+            return True
+        if entry.source_hash != source_hash or entry.compiler != compiler:
+            return True
+        if entry.profile != profile or entry.backend != backend:
+            return True
+        if self.output_path(entry).resolve() != output_file.resolve():
+            return True
+        try:
+            if hashes.hash_file(output_file) != entry.output_hash:
+                return True
+            for dep, digest in entry.dependencies.items():
+                if hashes.hash_file(_absolute(dep, self.project_dir)) != digest:
+                    return True
+        except OSError:
+            return True
+        return False
+
+    def orphans(self, live: Iterable[str]) -> List[str]:
+        """Names of manifest entries whose resume no longer exists."""
+        live_names = set(live)
+        return sorted(name for name in self.entries if name not in live_names)
+
+    def save(self) -> None:
+        """Merge recorded changes into the manifest file."""
+        if not self._changed:
+            return
+        self.output_root.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.output_root):
+            entries = self._read()
+            for name, entry in self._changed.items():
+                if entry is None:
+                    entries.pop(name, None)
+                else:
+                    entries[name] = entry
+            payload = {
+                "version": MANIFEST_VERSION,
+                "resumes": {name: entries[name].to_dict() for name in sorted(entries)},
+            }
+            atomic_write_text(self.path, json.dumps(payload, indent=2) + "\n")
+        self.entries = entries
+        self._changed = {}
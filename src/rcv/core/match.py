@@ -0,0 +1,170 @@
+"""Term vectors and TF-IDF scoring of resumes against a job description."""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rcv.core.cache import JsonCache
+from rcv.core.resume import Resume
+from rcv.utils.parallel import process_map
+
+
+TermCounts = Dict[str, int]
+
+# Commands whose first argument is not resume prose (packages, URLs, layout)
+_LATEX_DROP_ARG = (
+    "documentclass|usepackage|begin|end|label|ref|input|include|includegraphics"
+    "|href|url|hspace|vspace|setlength|setlist|newcommand|renewcommand|color"
+    "|fontsize|titleformat|titlespacing|geometry"
+)
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*")
+_LATEX_DROP_RE = re.compile(
+    r"\\(?:%s)\*?(?:\[[^\]]*\])?\{[^}]*\}(?:\[[^\]]*\])?" % _LATEX_DROP_ARG
+)
+_LATEX_LINEBREAK_RE = re.compile(r"\\\\(?:\[[^\]]*\])?")
+_LATEX_COMMAND_RE = re.compile(r"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])?")
+_TYPST_SKIP_LINE_RE = re.compile(r"^\s*#(set|show|let|import|include)\b.*$", re.M)
+_TYPST_ARGS_RE = re.compile(r"\([^()]*\)")
+_TYPST_FUNC_RE = re.compile(r"#[a-zA-Z][\w.-]*")
+_TYPST_COMMENT_RE = re.compile(r"(?<!:)//.*")
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be been but by can etc for from has have in into is it
+    its of on or our over such that the their this to was we were which will
+    with within you your who what when where how all any also more most other
+    than then there these they through up us using via per about across able
+    """.split()
+)
+
+
+def strip_markup(text: str, format: str) -> str:
+    """Reduce a LaTeX or typst source to (approximately) its prose."""
+    if format == "typst":
+        text = _TYPST_COMMENT_RE.sub(" ", text)
+        text = _TYPST_SKIP_LINE_RE.sub(" ", text)
+        text = _TYPST_ARGS_RE.sub(" ", text)
+        text = _TYPST_FUNC_RE.sub(" ", text)
+        return re.sub(r"[*_=\[\]\\]", " ", text)
+    text = _LATEX_COMMENT_RE.sub(" ", text)
+    text = _LATEX_DROP_RE.sub(" ", text)
+    text = _LATEX_LINEBREAK_RE.sub(" ", text)
+    text = _LATEX_COMMAND_RE.sub(" ", text)
+    return re.sub(r"[{}\\$&~^_]", " ", text)
+
+
+def tokenize(text: str) -> TermCounts:
+    """Count the keywords of plain text (lowercased, stopwords removed)."""
+    words = _WORD_RE.findall(text.lower())
+    return dict(Counter(w for w in words if len(w) > 1 and w not in STOPWORDS))
+
+
+def source_terms(args: Tuple[str, str]) -> TermCounts:
+    """Term counts of a resume source given as (text, format)."""
+    text, format = args
+    return tokenize(strip_markup(text, format))
+
+
+class TermVectorCache:
+    """Term counts per source content hash, cached across runs."""
+
+    def __init__(self, project_dir: Path):
+        self._cache = JsonCache.for_project(project_dir, "terms")
+
+    def load(
+        self,
+        sources: Dict[str, Resume],
+        jobs: Optional[int] = None,
+        unreadable: Optional[List[str]] = None,
+    ) -> Dict[str, TermCounts]:
+        """Get term counts for content hash -> resume holding that content.
+
+        Only sources whose hash is not cached are read and tokenized, in
+        parallel. Sources that cannot be read as UTF-8 text are left out,
+        and their hashes collected in unreadable if a list is given.
+        """
+        missing: List[str] = []
+        texts: List[Tuple[str, str]] = []
+        for digest, resume in sources.items():
+            if self._cache.get(digest) is not None:
+                continue
+            try:
+                texts.append((resume.read_source(), resume.metadata.format))
+            except (OSError, ValueError):
+                if unreadable is not None:
+                    unreadable.append(digest)
+                continue
+            missing.append(digest)
+        for digest, counts in zip(missing, process_map(source_terms, texts, jobs)):
+            self._cache.set(digest, counts)
+        counts_by_hash = {d: self._cache.get(d) for d in sources}
+        return {d: counts for d, counts in counts_by_hash.items() if counts is not None}
+
+    def save(self) -> None:
+        self._cache.save()
+
+
+@dataclass
+class MatchScore:
+    """Similarity of one document to the query."""
+
+    key: str
+    score: float
+    overlap: List[str]
+    missing: List[str]
+
+
+def _weight(count: int) -> float:
+    return 1.0 + math.log(count)
+
+
+def rank(
+    query: TermCounts,
+    documents: Dict[str, TermCounts],
+    limit: Optional[int] = None,
+    keywords: int = 8,
+) -> List[MatchScore]:
+    """Score documents against a query by TF-IDF cosine similarity.
+
+    IDF is computed over the given documents, and each document vector is
+    visited once. Overlapping and missing keywords (the query's
+    highest-weighted terms present in or absent from a document) are only
+    worked out for the top `limit` results.
+    """
+    total = len(documents)
+    df: Counter = Counter()
+    for counts in documents.values():
+        df.update(counts.keys())
+
+    def idf(term: str) -> float:
+        return math.log((1 + total) / (1 + df[term])) + 1.0
+
+    query_weights = {t: _weight(c) * idf(t) for t, c in query.items()}
+    query_norm = math.sqrt(sum(w * w for w in query_weights.values())) or 1.0
+
+    scores: List[MatchScore] = []
+    for key, counts in documents.items():
+        dot = 0.0
+        norm = 0.0
+        for term, count in counts.items():
+            weight = _weight(count) * idf(term)
+            norm += weight * weight
+            if term in query_weights:
+                dot += weight * query_weights[term]
+        score = dot / (query_norm * math.sqrt(norm)) if norm else 0.0
+        scores.append(MatchScore(key, score, [], []))
+
+    scores.sort(key=lambda s: (-s.score, s.key))
+    if limit is not None:
+        scores = scores[:limit]
+
+    ranked_terms = sorted(query_weights, key=lambda t: (-query_weights[t], t))
+    for match in scores:
+        counts = documents[match.key]
+        match.overlap = [t for t in ranked_terms if t in counts][:keywords]
+        match.missing = [t for t in ranked_terms if t not in counts][:keywords]
+    return scores
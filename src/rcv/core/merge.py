@@ -0,0 +1,117 @@
+"""Line-based three-way merge of resume sources."""
+
+import difflib
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+
+CONFLICT_START = "<<<<<<< {label}\n"
+CONFLICT_SEP = "=======\n"
+CONFLICT_END = ">>>>>>> {label}\n"
+
+# (base start, base end, a start, a end, b start, b end)
+SyncRegion = Tuple[int, int, int, int, int, int]
+
+
+@dataclass
+class MergeResult:
+    """Outcome of a three-way merge."""
+
+    text: str
+    conflicts: int
+
+    @property
+    def clean(self) -> bool:
+        return self.conflicts == 0
+
+
+def _intersect(
+    ra: Tuple[int, int], rb: Tuple[int, int]
+) -> Optional[Tuple[int, int]]:
+    start = max(ra[0], rb[0])
+    end = min(ra[1], rb[1])
+    return (start, end) if start < end else None
+
+
+def _sync_regions(
+    base: Sequence[str], a: Sequence[str], b: Sequence[str]
+) -> List[SyncRegion]:
+    """Find base ranges left unchanged by both a and b."""
+    a_blocks = difflib.SequenceMatcher(None, base, a, autojunk=False).get_matching_blocks()
+    b_blocks = difflib.SequenceMatcher(None, base, b, autojunk=False).get_matching_blocks()
+
+    regions: List[SyncRegion] = []
+    ia = ib = 0
+    while ia < len(a_blocks) and ib < len(b_blocks):
+        a_base, a_match, a_len = a_blocks[ia]
+        b_base, b_match, b_len = b_blocks[ib]
+        overlap = _intersect((a_base, a_base + a_len), (b_base, b_base + b_len))
+        if overlap is not None:
+            start, end = overlap
+            a_start = a_match + (start - a_base)
+            b_start = b_match + (start - b_base)
+            length = end - start
+            regions.append(
+                (start, end, a_start, a_start + length, b_start, b_start + length)
+            )
+        if a_base + a_len < b_base + b_len:
+            ia += 1
+        else:
+            ib += 1
+
+    regions.append((len(base), len(base), len(a), len(a), len(b), len(b)))
+    return regions
+
+
+def merge3(
+    base: str,
+    ours: str,
+    theirs: str,
+    ours_label: str = "variant",
+    theirs_label: str = "parent",
+) -> MergeResult:
+    """Merge the changes base->theirs into ours.
+
+    Regions changed on only one side take that side; identical changes
+    are taken once; overlapping different changes become conflict blocks
+    delimited by git-style markers.
+    """
+    base_lines = base.splitlines(keepends=True)
+    a = ours.splitlines(keepends=True)
+    b = theirs.splitlines(keepends=True)
+
+    out: List[str] = []
+    conflicts = 0
+    iz = ia = ib = 0
+    for z_start, z_end, a_start, a_end, b_start, b_end in _sync_regions(
+        base_lines, a, b
+    ):
+        base_chunk = base_lines[iz:z_start]
+        a_chunk = a[ia:a_start]
+        b_chunk = b[ib:b_start]
+
+        if a_chunk == b_chunk:
+            out.extend(a_chunk)
+        elif a_chunk == base_chunk:
+            out.extend(b_chunk)
+        elif b_chunk == base_chunk:
+            out.extend(a_chunk)
+        else:
+            conflicts += 1
+            out.append(CONFLICT_START.format(label=ours_label))
+            out.extend(_terminated(a_chunk))
+            out.append(CONFLICT_SEP)
+            out.extend(_terminated(b_chunk))
+            out.append(CONFLICT_END.format(label=theirs_label))
+
+        out.extend(base_lines[z_start:z_end])
+        iz, ia, ib = z_end, a_end, b_end
+
+    return MergeResult(text="".join(out), conflicts=conflicts)
+
+
+def _terminated(lines: List[str]) -> List[str]:
+    """Ensure a chunk ends with a newline so markers start on their own line."""
+    if lines and not lines[-1].endswith("\n"):
+        return [*lines[:-1], lines[-1] + "\n"]
+    return lines
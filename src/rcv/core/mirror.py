@@ -0,0 +1,348 @@
+"""Local working copies of projects that live on slow, synced filesystems.
+
+A mirror is a full copy of the project in a local cache directory. rcv
+reads and writes the mirror; changes travel to and from the synced
+location (the origin) in batches. The mirror records, per file, the
+content hash and the origin and local stat at the last transfer. A side
+counts as changed when its stat differs from that record. A file changed
+on both sides since then is a conflict unless the contents are equal.
+Conflicts are never overwritten silently.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rcv.core.objects import content_hash
+from rcv.core.publish import DEFAULT_COPY_JOBS, copy_atomic
+from rcv.core.storage import atomic_write_text, file_lock
+
+
+MIRROR_STATE_FILE = ".rcv-mirror.json"
+MIRROR_PENDING_FILE = ".rcv-mirror.pending"
+MIRROR_CHECKED_FILE = ".rcv-mirror.checked"
+MIRROR_DIR_ENV = "RCV_MIRROR_DIR"
+NO_MIRROR_ENV = "RCV_NO_MIRROR"
+MIRROR_STATE_VERSION = 1
+
+# Never transferred: per-machine caches, mirror bookkeeping, temp files.
+_EXCLUDED_FILES = {
+    MIRROR_STATE_FILE,
+    MIRROR_PENDING_FILE,
+    MIRROR_CHECKED_FILE,
+    ".DS_Store",
+}
+
+Stat = Tuple[int, int]  # (size, mtime_ns)
+
+
+def mirrors_root() -> Path:
+    if os.environ.get(MIRROR_DIR_ENV):
+        return Path(os.environ[MIRROR_DIR_ENV]).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rcv" / "mirrors"
+
+
+def mirror_dir_for(origin: Path) -> Path:
+    """Local directory holding the mirror of a project."""
+    origin = origin.resolve()
+    digest = hashlib.sha256(str(origin).encode("utf-8")).hexdigest()[:16]
+    return mirrors_root() / f"{origin.name}-{digest}"
+
+
+def is_mirror(directory: Path) -> bool:
+    return (directory / MIRROR_STATE_FILE).is_file()
+
+
+def _excluded(relpath: str) -> bool:
+    parts = relpath.split("/")
+    if parts[-1] in _EXCLUDED_FILES or parts[-1].endswith(".tmp"):
+        return True
+    # Only .rcv/cache is per-machine; a resume folder may be called "cache".
+    return parts[0] == ".git" or parts[:2] == [".rcv", "cache"]
+
+
+def _generated(relpath: str) -> bool:
+    """rcv's own state and build outputs, as opposed to files people edit."""
+    return relpath.split("/")[0] == ".rcv" or relpath.endswith(".pdf")
+
+
+def scan(root: Path, edits_only: bool = False) -> Dict[str, Stat]:
+    """Stat every transferable file under root, keyed by relative path.
+
+    With edits_only, rcv's state directory and PDFs are skipped, which
+    keeps the scan to the files someone may have edited by hand.
+    """
+
+    def skipped(relpath: str) -> bool:
+        return _excluded(relpath) or (edits_only and _generated(relpath))
+
+    found: Dict[str, Stat] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        base = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if base == "." else f"{base}/"
+        dirnames[:] = [d for d in dirnames if not skipped(f"{prefix}{d}/")]
+        for name in filenames:
+            relpath = f"{prefix}{name}"
+            if skipped(relpath):
+                continue
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            found[relpath] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+
+def _hash(path: Path) -> Optional[str]:
+    try:
+        return content_hash(path.read_bytes())
+    except OSError:
+        return None
+
+
+def _stat(path: Path) -> Stat:
+    stat = path.stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+@dataclass
+class FileRecord:
+    """Both sides of a file as of its last transfer."""
+
+    hash: str
+    origin: Stat
+    local: Stat
+
+    def to_dict(self) -> dict:
+        return {
+            "hash": self.hash,
+            "origin": list(self.origin),
+            "local": list(self.local),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileRecord":
+        return cls(
+            hash=data["hash"], origin=tuple(data["origin"]), local=tuple(data["local"])
+        )
+
+
+@dataclass
+class SyncResult:
+    """Files moved by a pull or push, and files left alone as conflicts."""
+
+    copied: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class MirrorStatus:
+    local_changes: List[str]
+    origin_changes: List[str]
+    conflicts: List[str]
+
+
+class Mirror:
+    """A project's local working copy and its transfer state."""
+
+    def __init__(self, origin: Path, local: Optional[Path] = None):
+        self.origin = origin.resolve()
+        self.local = local or mirror_dir_for(self.origin)
+        self.files: Dict[str, FileRecord] = {}
+        self.conflicts: List[str] = []
+        self.pulled_at: Optional[datetime] = None
+        self.pushed_at: Optional[datetime] = None
+        self._load()
+
+    @classmethod
+    def for_local(cls, local: Path) -> "Mirror":
+        """Open the mirror stored at a local directory."""
+        data = json.loads((local / MIRROR_STATE_FILE).read_text())
+        return cls(Path(data["origin"]), local)
+
+    @property
+    def state_file(self) -> Path:
+        return self.local / MIRROR_STATE_FILE
+
+    @property
+    def exists(self) -> bool:
+        return self.state_file.is_file()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return
+        self.files = {
+            rel: FileRecord.from_dict(record)
+            for rel, record in data.get("files", {}).items()
+        }
+        self.conflicts = list(data.get("conflicts", []))
+        for key in ("pulled_at", "pushed_at"):
+            if data.get(key):
+                setattr(self, key, datetime.fromisoformat(data[key]))
+
+    def _save(self) -> None:
+        data = {
+            "version": MIRROR_STATE_VERSION,
+            "origin": str(self.origin),
+            "files": {rel: self.files[rel].to_dict() for rel in sorted(self.files)},
+            "conflicts": sorted(set(self.conflicts)),
+            "pulled_at": self.pulled_at.isoformat() if self.pulled_at else None,
+            "pushed_at": self.pushed_at.isoformat() if self.pushed_at else None,
+        }
+        atomic_write_text(self.state_file, json.dumps(data, indent=2) + "\n")
+
+    def _changed(
+        self, current: Dict[str, Stat], side: str, edits_only: bool = False
+    ) -> Dict[str, Optional[Stat]]:
+        """Files whose stat on one side differs from the last transfer."""
+        changed: Dict[str, Optional[Stat]] = {}
+        recorded_files = set(self.files)
+        if edits_only:
+            recorded_files = {rel for rel in recorded_files if not _generated(rel)}
+        for relpath in set(current) | recorded_files:
+            record = self.files.get(relpath)
+            recorded = getattr(record, side) if record is not None else None
+            if current.get(relpath) != recorded:
+                changed[relpath] = current.get(relpath)
+        return changed
+
+    def local_changes(self) -> List[str]:
+        """Relative paths changed in the mirror since the last transfer."""
+        return sorted(self._changed(scan(self.local), "local"))
+
+    def origin_changed(self, edits_only: bool = False) -> bool:
+        """Whether anything changed in the origin since the last transfer.
+
+        With edits_only, only files people edit are looked at (see scan).
+        """
+        current = scan(self.origin, edits_only)
+        return bool(self._changed(current, "origin", edits_only))
+
+    def origin_check_due(self, interval: float) -> bool:
+        """Whether the origin was last checked more than interval seconds ago.
+
+        Marks it checked now if so. The mark is a local file, so this never
+        touches the synced filesystem.
+        """
+        marker = self.local / MIRROR_CHECKED_FILE
+        try:
+            if time.time() - marker.stat().st_mtime < interval:
+                return False
+        except OSError:
+            pass
+        try:
+            marker.touch()
+        except OSError:
+            pass
+        return True
+
+    def status(self) -> MirrorStatus:
+        return MirrorStatus(
+            local_changes=self.local_changes(),
+            origin_changes=sorted(self._changed(scan(self.origin), "origin")),
+            conflicts=sorted(set(self.conflicts)),
+        )
+
+    def pull(self, force: bool = False, jobs: Optional[int] = None) -> SyncResult:
+        """Bring origin changes into the mirror."""
+        return self._transfer("origin", force, jobs)
+
+    def push(self, force: bool = False, jobs: Optional[int] = None) -> SyncResult:
+        """Write mirror changes back to the origin."""
+        return self._transfer("local", force, jobs)
+
+    def _transfer(self, source: str, force: bool, jobs: Optional[int]) -> SyncResult:
+        target = "local" if source == "origin" else "origin"
+        roots = {"origin": self.origin, "local": self.local}
+        result = SyncResult()
+        self.local.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.local):
+            self._load()
+            source_changes = self._changed(scan(roots[source]), source)
+            target_changes = self._changed(scan(roots[target]), target)
+
+            copies: List[str] = []
+            for relpath in sorted(source_changes):
+                src_stat = source_changes[relpath]
+                if relpath in target_changes and not force:
+                    # Both sides changed: only fine if they now agree.
+                    src_hash = _hash(roots[source] / relpath)
+                    if (
+                        src_stat is not None
+                        and src_hash is not None
+                        and src_hash == _hash(roots[target] / relpath)
+                    ):
+                        self._record(relpath, src_hash)
+                        self._resolved(relpath)
+                    elif src_stat is None and target_changes[relpath] is None:
+                        self.files.pop(relpath, None)
+                        self._resolved(relpath)
+                    else:
+                        self.conflicts.append(relpath)
+                        result.conflicts.append(relpath)
+                    continue
+                if src_stat is None:
+                    try:
+                        (roots[target] / relpath).unlink(missing_ok=True)
+                    except OSError as e:
+                        result.failed.append((relpath, str(e)))
+                        continue
+                    self.files.pop(relpath, None)
+                    self._resolved(relpath)
+                    result.deleted.append(relpath)
+                else:
+                    copies.append(relpath)
+
+            def copy(relpath: str) -> Tuple[str, Optional[str]]:
+                try:
+                    # Stat before copying: a write during the copy must
+                    # still show up as a change next time.
+                    stats = {source: _stat(roots[source] / relpath)}
+                    copy_atomic(roots[source] / relpath, roots[target] / relpath)
+                    stats[target] = _stat(roots[target] / relpath)
+                    digest = _hash(roots[target] / relpath)
+                except OSError as e:
+                    return relpath, str(e)
+                if digest is None:
+                    return relpath, "file vanished after copying"
+                self.files[relpath] = FileRecord(
+                    digest, stats["origin"], stats["local"]
+                )
+                return relpath, None
+
+            with ThreadPoolExecutor(max_workers=jobs or DEFAULT_COPY_JOBS) as pool:
+                for relpath, error in pool.map(copy, copies):
+                    if error is None:
+                        self._resolved(relpath)
+                        result.copied.append(relpath)
+                    else:
+                        result.failed.append((relpath, error))
+
+            now = datetime.now()
+            if source == "origin":
+                self.pulled_at = now
+            else:
+                self.pushed_at = now
+            self._save()
+        return result
+
+    def _record(self, relpath: str, digest: str) -> None:
+        self.files[relpath] = FileRecord(
+            hash=digest,
+            origin=_stat(self.origin / relpath),
+            local=_stat(self.local / relpath),
+        )
+
+    def _resolved(self, relpath: str) -> None:
+        self.conflicts = [c for c in self.conflicts if c != relpath]
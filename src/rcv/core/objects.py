@@ -0,0 +1,114 @@
+"""Content-addressed object store kept under the project's .rcv directory."""
+
+import hashlib
+import os
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+from rcv.core.storage import atomic_write_bytes
+
+
+STATE_DIR = ".rcv"
+OBJECTS_DIR = "objects"
+
+
+class ObjectNotFoundError(KeyError):
+    """Raised when an object id is not present in the store."""
+
+
+def content_hash(data: bytes) -> str:
+    """Return the object id (SHA-256 hex digest) for raw content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """Return the object id of UTF-8 encoded text."""
+    return content_hash(text.encode("utf-8"))
+
+
+def get_state_dir(project_dir: Path) -> Path:
+    """Get the project-local directory holding rcv's internal state."""
+    return project_dir / STATE_DIR
+
+
+class ObjectStore:
+    """Deduplicating, zlib-compressed blob store keyed by SHA-256.
+
+    Objects live at .rcv/objects/<2 hex chars>/<remaining hex chars>.
+    Writing the same content twice is a cheap existence check.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> "ObjectStore":
+        """Open the object store of an rcv project."""
+        return cls(get_state_dir(project_dir) / OBJECTS_DIR)
+
+    def _path(self, oid: str) -> Path:
+        return self.root / oid[:2] / oid[2:]
+
+    def has(self, oid: str) -> bool:
+        """Check whether an object exists."""
+        return self._path(oid).exists()
+
+    def put(self, data: bytes) -> str:
+        """Store data and return its object id."""
+        oid = content_hash(data)
+        path = self._path(oid)
+        if path.exists():
+            # Refresh the mtime so garbage collection treats it as recent.
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        else:
+            atomic_write_bytes(path, zlib.compress(data, 9))
+        return oid
+
+    def put_text(self, text: str) -> str:
+        """Store UTF-8 text and return its object id."""
+        return self.put(text.encode("utf-8"))
+
+    def get(self, oid: str) -> bytes:
+        """Read an object, raising ObjectNotFoundError if it is missing."""
+        try:
+            compressed = self._path(oid).read_bytes()
+        except FileNotFoundError:
+            raise ObjectNotFoundError(oid) from None
+        return zlib.decompress(compressed)
+
+    def get_text(self, oid: str) -> str:
+        """Read an object as UTF-8 text."""
+        return self.get(oid).decode("utf-8")
+
+    def stat(self, oid: str) -> os.stat_result:
+        """Stat the stored (compressed) object file."""
+        return self._path(oid).stat()
+
+    def size_on_disk(self, oid: str) -> int:
+        """Get the compressed size of an object in bytes."""
+        return self.stat(oid).st_size
+
+    def iter_oids(self) -> Iterator[str]:
+        """Iterate over all stored object ids."""
+        if not self.root.exists():
+            return
+        for bucket in self.root.iterdir():
+            if not bucket.is_dir() or len(bucket.name) != 2:
+                continue
+            for item in bucket.iterdir():
+                if item.name.startswith("."):
+                    continue
+                yield bucket.name + item.name
+
+    def delete(self, oid: str) -> None:
+        """Remove an object if present."""
+        path = self._path(oid)
+        path.unlink(missing_ok=True)
+        try:
+            path.parent.rmdir()
+        except OSError:
+            pass
@@ -0,0 +1,157 @@
+"""Delta-packed storage of variant sources in the project object store."""
+
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Set, Tuple
+
+from rcv.core.delta import apply_delta, make_delta
+from rcv.core.objects import ObjectStore, text_hash
+from rcv.core.resume import Resume
+
+
+class PackError(Exception):
+    """Raised when a resume cannot be packed."""
+
+
+@dataclass
+class PackResult:
+    """Outcome of packing a single resume."""
+
+    resume: Resume
+    original_size: int
+    stored_size: int
+
+    @property
+    def saved(self) -> int:
+        """Bytes saved on disk (ignoring the shared, deduplicated base)."""
+        return self.original_size - self.stored_size
+
+
+def is_cold(resume: Resume, days: float) -> bool:
+    """Whether the resume source has not been modified for the given days."""
+    try:
+        mtime = resume.resume_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return time.time() - mtime >= days * 86400
+
+
+def _store_delta(store: ObjectStore, base: str, text: str) -> Tuple[str, str, int]:
+    """Store base and a delta for text, returning (base oid, delta oid, size)."""
+    delta = make_delta(base, text)
+    if apply_delta(base, delta) != text:
+        raise PackError("Delta round-trip verification failed")
+    base_oid = store.put_text(base)
+    delta_oid = store.put(delta)
+    return base_oid, delta_oid, store.size_on_disk(delta_oid)
+
+
+def pack_resume(resume: Resume, store: ObjectStore) -> PackResult:
+    """Replace a variant's source file with a delta against its parent."""
+    if resume.is_packed:
+        raise PackError(f"Already packed: {resume.full_name}")
+
+    parent = resume.get_parent()
+    if parent is None:
+        raise PackError(f"Only variants can be packed: {resume.full_name}")
+
+    source_file = resume.resume_file
+    if not source_file.exists():
+        raise PackError(f"Resume file not found: {source_file}")
+
+    try:
+        text = source_file.read_bytes().decode("utf-8")
+        base = parent.read_source()
+    except (OSError, UnicodeDecodeError) as e:
+        raise PackError(str(e)) from e
+
+    base_oid, delta_oid, stored_size = _store_delta(store, base, text)
+    stat = source_file.stat()
+
+    try:
+        with resume.edit_metadata() as metadata:
+            metadata.packed = {
+                "base": base_oid,
+                "delta": delta_oid,
+                "hash": text_hash(text),
+                "mtime": stat.st_mtime,
+            }
+    except OSError as e:
+        raise PackError(str(e)) from e
+
+    # Only drop the source once the metadata pointing at the pack is saved
+    try:
+        source_file.unlink()
+    except OSError as e:
+        with resume.edit_metadata() as metadata:
+            metadata.packed = None
+        raise PackError(str(e)) from e
+
+    return PackResult(
+        resume=resume, original_size=stat.st_size, stored_size=stored_size
+    )
+
+
+def repack_resume(resume: Resume, store: ObjectStore) -> bool:
+    """Re-delta a packed resume against its parent's current source.
+
+    Returns True if the pack entry changed. Rebasing onto the current
+    parent lets siblings share one base object and lets old bases be
+    garbage-collected.
+    """
+    packed = resume.metadata.packed
+    parent = resume.get_parent()
+    if packed is None or parent is None:
+        return False
+
+    text = resume.read_source()
+    base = parent.read_source()
+    if text_hash(base) == packed["base"]:
+        return False
+
+    base_oid, delta_oid, _ = _store_delta(store, base, text)
+    with resume.edit_metadata() as metadata:
+        if metadata.packed is None:
+            return False
+        metadata.packed = {**metadata.packed, "base": base_oid, "delta": delta_oid}
+    return True
+
+
+def referenced_objects(resumes: Iterable[Resume]) -> Set[str]:
+    """Collect object ids referenced by resume metadata.
+
+    That is the base and delta of packed resumes plus the recorded branch
+    base of every variant.
+    """
+    live: Set[str] = set()
+    for resume in resumes:
+        packed = resume.metadata.packed
+        if packed is not None:
+            live.add(packed["base"])
+            live.add(packed["delta"])
+        if resume.metadata.base_hash is not None:
+            live.add(resume.metadata.base_hash)
+    return live
+
+
+def collect_garbage(
+    store: ObjectStore, live: Set[str], grace_seconds: float = 3600
+) -> Tuple[int, int]:
+    """Delete unreferenced objects, returning (count, bytes freed).
+
+    Objects younger than grace_seconds are kept so that a concurrent
+    command that has stored objects but not yet recorded them survives.
+    """
+    cutoff = time.time() - grace_seconds
+    removed: List[str] = []
+    freed = 0
+    for oid in list(store.iter_oids()):
+        if oid in live:
+            continue
+        stat = store.stat(oid)
+        if stat.st_mtime > cutoff:
+            continue
+        removed.append(oid)
+        freed += stat.st_size
+        store.delete(oid)
+    return len(removed), freed
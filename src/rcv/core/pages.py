@@ -0,0 +1,120 @@
+"""Post-build checks of a PDF's page count and layout warnings."""
+
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+PAGE_CHECK_OFF = "off"
+PAGE_CHECK_WARN = "warn"
+PAGE_CHECK_FAIL = "fail"
+PAGE_CHECK_MODES = (PAGE_CHECK_OFF, PAGE_CHECK_WARN, PAGE_CHECK_FAIL)
+
+# Layout warnings kept per build; the count is kept in full.
+MAX_RECORDED_WARNINGS = 20
+
+_OVERFULL_RE = re.compile(r"(Overfull \\[hv]box .*?)\s*$", re.M)
+_PAGES_NODE_RE = re.compile(rb"/Type\s*/Pages(?![A-Za-z])")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_DICT_TOKEN_RE = re.compile(rb"<<|>>")
+_STREAM_RE = re.compile(rb"stream\r?\n")
+# How far back from a node to look for the start of its dictionary.
+_DICT_WINDOW = 4096
+
+
+def overfull_warnings(log: str) -> List[str]:
+    """Overfull box warnings (content wider or taller than its box) in a log.
+
+    Matches pdfTeX/XeTeX/LuaTeX output and Tectonic's `warning:` lines.
+    """
+    return _OVERFULL_RE.findall(log)
+
+
+def _dict_count(data: bytes, pos: int) -> Optional[int]:
+    """The /Count of the dictionary enclosing pos, if any."""
+    lo = max(0, pos - _DICT_WINDOW)
+    depth = 0
+    start = None
+    for token in reversed(list(_DICT_TOKEN_RE.finditer(data, lo, pos))):
+        if token[0] == b">>":
+            depth += 1
+        elif depth:
+            depth -= 1
+        else:
+            start = token.start()
+            break
+    if start is None:
+        return None
+    depth = 0
+    end = len(data)
+    for token in _DICT_TOKEN_RE.finditer(data, start):
+        depth += 1 if token[0] == b"<<" else -1
+        if depth == 0:
+            end = token.end()
+            break
+    match = _COUNT_RE.search(data, start, end)
+    return int(match[1]) if match else None
+
+
+def _page_tree_counts(data: bytes) -> List[int]:
+    counts = []
+    for match in _PAGES_NODE_RE.finditer(data):
+        count = _dict_count(data, match.start())
+        if count is not None:
+            counts.append(count)
+    return counts
+
+
+def _object_streams(data: bytes) -> List[bytes]:
+    """Inflate the object streams (/Type /ObjStm) of a PDF."""
+    streams = []
+    for match in _STREAM_RE.finditer(data):
+        header = data[max(0, match.start() - 512) : match.start()]
+        if b"/ObjStm" not in header[header.rfind(b"<<") :]:
+            continue
+        end = data.find(b"endstream", match.end())
+        if end < 0:
+            break
+        try:
+            streams.append(zlib.decompress(data[match.end() : end]))
+        except zlib.error:
+            continue
+    return streams
+
+
+def count_pages(data: bytes) -> Optional[int]:
+    """Count a PDF's pages from its page tree, without a PDF library.
+
+    The root /Pages node's /Count is the total, and no node counts more,
+    so the largest /Count of any /Pages node is the page count. Nodes
+    inside compressed object streams (pdfTeX's default) are found by
+    inflating those streams. None if the PDF has no readable page tree.
+    """
+    counts = _page_tree_counts(data)
+    for stream in _object_streams(data):
+        counts.extend(_page_tree_counts(stream))
+    return max(counts) if counts else None
+
+
+@dataclass
+class PageCheck:
+    """Page count and layout warnings of a built PDF against its budget."""
+
+    pages: Optional[int]
+    budget: Optional[int] = None
+    overfull: List[str] = field(default_factory=list)
+    overfull_count: Optional[int] = None  # when more than were kept
+
+    def __post_init__(self) -> None:
+        if self.overfull_count is None:
+            self.overfull_count = len(self.overfull)
+        self.overfull = self.overfull[:MAX_RECORDED_WARNINGS]
+
+    @property
+    def over_budget(self) -> bool:
+        return (
+            self.pages is not None
+            and self.budget is not None
+            and self.pages > self.budget
+        )
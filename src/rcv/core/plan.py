@@ -0,0 +1,295 @@
+"""Declarative plans that create many resumes and variants at once.
+
+A plan file lists `[[new]]` base resumes and `[[branch]]` variants.
+The whole plan is checked against the project before anything is
+created, and entries whose resume already exists are left in place, so
+applying the same plan twice only fills in what is missing.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rcv.core.resume import (
+    VARIANTS_DIR,
+    Resume,
+    ResumeMetadata,
+    find_seed_file,
+    seed_format,
+)
+
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:  # pragma: no cover - fallback for Python 3.10
+    tomllib = None
+
+
+PLAN_NEW = "new"
+PLAN_BRANCH = "branch"
+
+FORMATS = ("latex", "typst")
+
+_KEYS = {
+    PLAN_NEW: {"name", "format", "from", "tags", "notes"},
+    PLAN_BRANCH: {"source", "name", "from", "tags", "notes", "assets", "link_assets"},
+}
+_REQUIRED = {
+    PLAN_NEW: ("name",),
+    PLAN_BRANCH: ("source", "name"),
+}
+
+
+class PlanError(ValueError):
+    """Raised when a plan file cannot be read or does not fit the project."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+@dataclass
+class PlanEntry:
+    """One resume a plan asks for, resolved against the project."""
+
+    kind: str  # PLAN_NEW or PLAN_BRANCH
+    label: str  # "branch #2", for messages
+    name: str  # the new resume's own name
+    full_name: str
+    path: Path
+    format: str
+    source: Optional[str] = None  # full name of the resume to branch from
+    seed: Optional[Path] = None
+    tags: List[str] = field(default_factory=list)
+    notes: Optional[str] = None
+    assets: bool = True
+    link_assets: bool = False
+    existing: Optional[Resume] = None  # set when the resume already exists
+
+    def metadata(self) -> ResumeMetadata:
+        """Metadata for the resume this entry creates."""
+        return ResumeMetadata(
+            format=self.format, tags=list(self.tags), notes=self.notes or ""
+        )
+
+    def pending_changes(self, metadata: ResumeMetadata) -> List[str]:
+        """What applying this entry would change on existing metadata."""
+        changes = []
+        if any(tag not in metadata.tags for tag in self.tags):
+            changes.append("tags")
+        if self.notes is not None and self.notes != metadata.notes:
+            changes.append("notes")
+        return changes
+
+    def update(self, metadata: ResumeMetadata) -> None:
+        """Add missing tags and set notes on existing metadata."""
+        for tag in self.tags:
+            if tag not in metadata.tags:
+                metadata.tags.append(tag)
+        if self.notes is not None:
+            metadata.notes = self.notes
+
+
+def read_plan(path: Path) -> Dict[str, Any]:
+    """Parse a TOML or JSON plan file into a table."""
+    is_json = path.suffix == ".json"
+    if not is_json and tomllib is None:
+        raise PlanError([f"{path}: TOML plans need Python 3.11+; use JSON"])
+    try:
+        text = path.read_text(encoding="utf-8")
+        data = json.loads(text) if is_json else tomllib.loads(text)
+    except (OSError, ValueError) as e:
+        raise PlanError([f"{path}: cannot read plan: {e}"]) from e
+    if not isinstance(data, dict):
+        raise PlanError([f"{path}: expected a table of entries"])
+    return data
+
+
+def _valid_name(name: str) -> bool:
+    return (
+        bool(name.strip())
+        and name == name.strip()
+        and "/" not in name
+        and "\\" not in name
+        and not name.startswith(".")
+        and name != VARIANTS_DIR
+    )
+
+
+def _check_fields(
+    kind: str, label: str, raw: Any, errors: List[str]
+) -> Optional[Dict[str, Any]]:
+    """Type-check one entry's fields; None if it cannot be used at all."""
+    if not isinstance(raw, dict):
+        errors.append(f"{label}: expected a table")
+        return None
+    before = len(errors)
+    for key in sorted(set(raw) - _KEYS[kind]):
+        errors.append(f"{label}: unknown key '{key}'")
+    for key in _REQUIRED[kind]:
+        if key not in raw:
+            errors.append(f"{label}: missing '{key}'")
+    for key in ("source", "name", "format", "from", "notes"):
+        if key in raw and not isinstance(raw[key], str):
+            errors.append(f"{label}: '{key}' must be a string")
+    for key in ("assets", "link_assets"):
+        if key in raw and not isinstance(raw[key], bool):
+            errors.append(f"{label}: '{key}' must be true or false")
+    tags = raw.get("tags", [])
+    if not isinstance(tags, list) or not all(isinstance(t, str) for t in tags):
+        errors.append(f"{label}: 'tags' must be a list of strings")
+    name = raw.get("name")
+    if isinstance(name, str) and not _valid_name(name):
+        errors.append(f"{label}: invalid name '{name}'")
+    format = raw.get("format")
+    if isinstance(format, str) and format not in FORMATS:
+        errors.append(f"{label}: format must be 'latex' or 'typst'")
+    return raw if len(errors) == before else None
+
+
+def _resolve_source(name: str, known: Dict[str, Tuple[Path, str]]) -> Optional[str]:
+    """The full name a branch source refers to, like `find_resume` does."""
+    name = name.strip().rstrip("/")
+    if name in known:
+        return name
+    if "/" not in name:
+        for full_name in sorted(known):
+            if full_name.rsplit("/", 1)[-1] == name:
+                return full_name
+    return None
+
+
+def resolve_plan(
+    data: Dict[str, Any],
+    plan_dir: Path,
+    resumes_dir: Path,
+    resumes: List[Resume],
+    default_format: str,
+) -> List[PlanEntry]:
+    """Check a whole plan against the project and order its entries.
+
+    resumes are the project's existing resumes. New base resumes come
+    first, then each variant after the resume it branches from, so a plan
+    may branch from resumes it creates itself. Relative seed paths are
+    tried against the plan's directory, then the project root. Raises
+    PlanError listing every problem found.
+    """
+    errors: List[str] = []
+    for key in sorted(set(data) - set(_KEYS)):
+        errors.append(f"unknown section '{key}' (expected [[new]] or [[branch]])")
+    sections = {}
+    for kind in (PLAN_NEW, PLAN_BRANCH):
+        raw = data.get(kind, [])
+        if not isinstance(raw, list):
+            errors.append(f"'{kind}' must be a list of tables ([[{kind}]])")
+            raw = []
+        sections[kind] = [
+            (f"{kind} #{i}", _check_fields(kind, f"{kind} #{i}", entry, errors))
+            for i, entry in enumerate(raw, 1)
+        ]
+
+    existing = {resume.full_name: resume for resume in resumes}
+    # Full name -> (path, format) of every resume, existing or planned
+    known = {
+        resume.full_name: (resume.path, resume.metadata.format) for resume in resumes
+    }
+    claimed: Dict[str, str] = {}
+    entries: List[PlanEntry] = []
+
+    def seed_for(label: str, raw: Dict[str, Any]) -> Optional[Path]:
+        if raw.get("from") is None:
+            return None
+        seed = find_seed_file(raw["from"], [plan_dir, resumes_dir])
+        if seed is None:
+            errors.append(f"{label}: seed file not found: {raw['from']}")
+        return seed
+
+    def add(entry: PlanEntry) -> None:
+        if entry.full_name in claimed:
+            errors.append(
+                f"{entry.label}: {entry.full_name} is also created by "
+                f"{claimed[entry.full_name]}"
+            )
+            return
+        claimed[entry.full_name] = entry.label
+        entry.existing = existing.get(entry.full_name)
+        if entry.existing is not None:
+            if entry.existing.metadata.format != entry.format:
+                errors.append(
+                    f"{entry.label}: {entry.full_name} exists as a "
+                    f"{entry.existing.metadata.format} resume"
+                )
+                return
+        elif entry.path.exists():
+            errors.append(
+                f"{entry.label}: {entry.path} exists but is not a resume "
+                "(move it away to create the resume)"
+            )
+            return
+        known[entry.full_name] = (entry.path, entry.format)
+        entries.append(entry)
+
+    for label, raw in sections[PLAN_NEW]:
+        if raw is None:
+            continue
+        seed = seed_for(label, raw)
+        format = raw.get("format")
+        if seed is not None:
+            if format is not None and format != seed_format(seed):
+                errors.append(f"{label}: format must match the seed file's")
+                continue
+            format = seed_format(seed)
+        add(
+            PlanEntry(
+                kind=PLAN_NEW,
+                label=label,
+                name=raw["name"],
+                full_name=raw["name"],
+                path=resumes_dir / raw["name"],
+                format=format or default_format,
+                seed=seed,
+                tags=raw.get("tags", []),
+                notes=raw.get("notes"),
+            )
+        )
+
+    # Branches may build on each other in any order; place each once its
+    # source is known, until a pass makes no progress.
+    pending = [(label, raw) for label, raw in sections[PLAN_BRANCH] if raw is not None]
+    while pending:
+        waiting = []
+        for label, raw in pending:
+            source = _resolve_source(raw["source"], known)
+            if source is None:
+                waiting.append((label, raw))
+                continue
+            source_path, format = known[source]
+            seed = seed_for(label, raw)
+            if seed is not None and seed_format(seed) != format:
+                errors.append(f"{label}: seed file format must match {source}'s")
+                continue
+            add(
+                PlanEntry(
+                    kind=PLAN_BRANCH,
+                    label=label,
+                    name=raw["name"],
+                    full_name=f"{source}/{raw['name']}",
+                    path=source_path / VARIANTS_DIR / raw["name"],
+                    format=format,
+                    source=source,
+                    seed=seed,
+                    tags=raw.get("tags", []),
+                    notes=raw.get("notes"),
+                    assets=raw.get("assets", True),
+                    link_assets=raw.get("link_assets", False),
+                )
+            )
+        if len(waiting) == len(pending):
+            for label, raw in waiting:
+                errors.append(f"{label}: source resume not found: {raw['source']}")
+            break
+        pending = waiting
+
+    if errors:
+        raise PlanError(errors)
+    return entries
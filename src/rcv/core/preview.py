@@ -0,0 +1,263 @@
+"""Live preview server for `rcv watch --serve`.
+
+The server shows the last good build output: a PDF, or one PNG per page
+for backends that render pages. Browsers subscribe to /events
+(server-sent events) and get the build state whenever it changes; a
+failed or running build keeps the previous output on screen. Pages are
+identified by content hash, so after a rebuild the browser only fetches
+the pages that changed.
+"""
+
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+from rcv.core.objects import content_hash
+
+
+DEFAULT_PREVIEW_PORT = 8765
+# Seconds between keep-alive comments on an idle event stream.
+KEEPALIVE_SECONDS = 15.0
+
+
+class PreviewState:
+    """The output shown by the preview, shared between builder and server."""
+
+    def __init__(self, title: str):
+        self.title = title
+        self.version = 0
+        self.pdf: Optional[bytes] = None
+        self.pages: List[bytes] = []
+        self.building = False
+        self.error: Optional[str] = None
+        self.updated_at: Optional[float] = None
+        self._hashes: List[str] = []
+        self._cond = threading.Condition()
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._cond.notify_all()
+
+    def start_build(self) -> None:
+        with self._cond:
+            self.building = True
+            self._changed()
+
+    def fail(self, message: str) -> None:
+        """End a build that failed; the previous output stays."""
+        with self._cond:
+            self.building = False
+            self.error = message
+            self._changed()
+
+    def publish_pdf(self, data: bytes) -> None:
+        with self._cond:
+            self.pdf, self.pages = data, []
+            self._hashes = [content_hash(data)]
+            self._published()
+
+    def publish_pages(self, pages: List[bytes]) -> List[int]:
+        """Show new page images; returns the 1-based numbers that changed."""
+        hashes = [content_hash(page) for page in pages]
+        with self._cond:
+            changed = [
+                number
+                for number, digest in enumerate(hashes, 1)
+                if number > len(self._hashes) or self._hashes[number - 1] != digest
+            ]
+            self.pdf, self.pages, self._hashes = None, list(pages), hashes
+            self._published()
+        return changed
+
+    def _published(self) -> None:
+        self.building = False
+        self.error = None
+        self.updated_at = time.time()
+        self._changed()
+
+    def snapshot(self) -> dict:
+        """The state as sent to browsers."""
+        with self._cond:
+            return {
+                "version": self.version,
+                "building": self.building,
+                "error": self.error,
+                "updated_at": self.updated_at,
+                "kind": "pages" if self.pages else "pdf" if self.pdf else None,
+                "hashes": list(self._hashes),
+            }
+
+    def wait(self, version: int, timeout: float) -> int:
+        """Block until the state moves past version or timeout passes."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def page(self, number: int) -> Optional[bytes]:
+        with self._cond:
+            if 1 <= number <= len(self.pages):
+                return self.pages[number - 1]
+            return None
+
+
+_PAGE = """<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title_html} - rcv preview</title>
+<style>
+  body {{ margin: 0; background: #525659; font-family: sans-serif; }}
+  #status {{ position: fixed; top: 0; left: 0; right: 0; padding: 4px 10px;
+            font-size: 13px; background: #333; color: #ddd; z-index: 1; }}
+  #status.building {{ background: #8a6d00; }}
+  #status.error {{ background: #a02020; }}
+  #pdf {{ position: fixed; top: 26px; left: 0; width: 100%;
+         height: calc(100% - 26px); border: 0; }}
+  #pages {{ padding-top: 36px; text-align: center; }}
+  #pages img {{ display: block; margin: 0 auto 12px; max-width: 95%;
+               box-shadow: 0 2px 8px #0008; background: white; }}
+</style>
+</head>
+<body>
+<div id="status">Connecting...</div>
+<iframe id="pdf" hidden></iframe>
+<div id="pages"></div>
+<script>
+const status = document.getElementById("status");
+const pdf = document.getElementById("pdf");
+const pages = document.getElementById("pages");
+const title = {title_json};
+let shown = [];
+
+function show(state) {{
+  status.className = state.building ? "building" : state.error ? "error" : "";
+  if (state.building) {{
+    status.textContent = "Building... (showing the last good output)";
+  }} else if (state.error) {{
+    status.textContent = state.error;
+  }} else if (state.updated_at) {{
+    const at = new Date(state.updated_at * 1000).toLocaleTimeString();
+    status.textContent = title + " - updated " + at;
+  }} else {{
+    status.textContent = title + " - waiting for the first build";
+  }}
+  if (state.kind === "pdf" && state.hashes[0] !== shown[0]) {{
+    pages.hidden = true;
+    pdf.hidden = false;
+    pdf.src = "/resume.pdf?h=" + state.hashes[0];
+  }} else if (state.kind === "pages") {{
+    pdf.hidden = true;
+    pages.hidden = false;
+    state.hashes.forEach((hash, i) => {{
+      let img = pages.children[i];
+      if (!img) {{
+        img = document.createElement("img");
+        pages.appendChild(img);
+      }}
+      if (shown[i] !== hash) img.src = "/pages/" + (i + 1) + ".png?h=" + hash;
+    }});
+    while (pages.children.length > state.hashes.length) pages.lastChild.remove();
+  }}
+  if (state.kind) shown = state.hashes;
+}}
+
+const events = new EventSource("/events");
+events.addEventListener("state", (e) => show(JSON.parse(e.data)));
+events.onerror = () => {{
+  status.className = "error";
+  status.textContent = "Disconnected from rcv watch; retrying...";
+}};
+</script>
+</body>
+</html>
+"""
+
+
+class _PreviewHandler(BaseHTTPRequestHandler):
+    server: "PreviewServer"
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # keep the watch output readable
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        state = self.server.state
+        if path == "/":
+            page = _PAGE.format(
+                title_html=html.escape(state.title), title_json=json.dumps(state.title)
+            )
+            self._send(page.encode("utf-8"), "text/html")
+        elif path == "/events":
+            self._stream_events()
+        elif path == "/resume.pdf":
+            self._send(state.pdf, "application/pdf")
+        elif path.startswith("/pages/") and path.endswith(".png"):
+            try:
+                number = int(path[len("/pages/") : -len(".png")])
+            except ValueError:
+                number = 0
+            self._send(state.page(number), "image/png")
+        else:
+            self._send(None, "text/plain")
+
+    def _send(self, body: Optional[bytes], content_type: str) -> None:
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        # Outputs are addressed by content hash in the query string.
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        state = self.server.state
+        version = None
+        try:
+            while not self.server.closing.is_set():
+                snapshot = state.snapshot()
+                if snapshot["version"] != version:
+                    version = snapshot["version"]
+                    data = json.dumps(snapshot)
+                    self.wfile.write(f"event: state\ndata: {data}\n\n".encode())
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+                state.wait(version, KEEPALIVE_SECONDS)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class PreviewServer(ThreadingHTTPServer):
+    """HTTP server for a PreviewState, run in a background thread."""
+
+    daemon_threads = True
+
+    def __init__(self, state: PreviewState, address: Tuple[str, int]):
+        super().__init__(address, _PreviewHandler)
+        self.state = state
+        self.closing = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.closing.set()
+        self.shutdown()
+        self.server_close()
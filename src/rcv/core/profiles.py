@@ -0,0 +1,133 @@
+"""Named build profiles: how thoroughly a resume is compiled."""
+
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Dict, List, Mapping, Optional
+
+
+DRAFT = "draft"
+FINAL = "final"
+
+# Engines whose flag for "typeset but do not write a PDF" differs from
+# pdflatex/lualatex's -draftmode.
+_NO_PDF_FLAGS = {"xelatex": "-no-pdf"}
+
+
+@dataclass(frozen=True)
+class BuildProfile:
+    """Compile settings selected by name (`rcv build --profile draft`).
+
+    passes: LaTeX runs (the second resolves references).
+    draftmode: run every pass but the last without writing a PDF.
+    images: embed images; when false, graphicx's draft option draws
+        placeholder boxes instead (LaTeX only).
+    latex_compiler/typst_compiler: override the project's compilers.
+    """
+
+    name: str
+    passes: int = 2
+    draftmode: bool = True
+    images: bool = True
+    latex_compiler: Optional[str] = None
+    typst_compiler: Optional[str] = None
+
+    def settings(self) -> Dict[str, Any]:
+        """The profile's settings, without its name."""
+        data = asdict(self)
+        del data["name"]
+        return data
+
+    def fingerprint(self) -> str:
+        """Identify the output-affecting settings; empty for the defaults.
+
+        Recorded in the build manifest so switching profiles makes a
+        build stale. Compiler overrides are covered by the compiler name.
+        """
+        parts = []
+        if self.passes != 2:
+            parts.append(f"passes={self.passes}")
+        if not self.images:
+            parts.append("images=false")
+        return ",".join(parts)
+
+    def latex_runs(
+        self, compiler: str, output_dir: str, source_name: str
+    ) -> List[List[str]]:
+        """Command lines for each LaTeX pass, run from the source directory."""
+        runs = []
+        stem = source_name.rsplit(".", 1)[0]
+        for index in range(max(1, self.passes)):
+            argv = [
+                compiler,
+                "-interaction=nonstopmode",
+                f"-output-directory={output_dir}",
+            ]
+            if self.draftmode and index < self.passes - 1:
+                argv.append(_NO_PDF_FLAGS.get(compiler, "-draftmode"))
+            if self.images:
+                argv.append(source_name)
+            else:
+                argv += [
+                    f"-jobname={stem}",
+                    "\\PassOptionsToPackage{draft}{graphicx}"
+                    f"\\input{{{source_name}}}",
+                ]
+            runs.append(argv)
+        return runs
+
+
+BUILTIN_PROFILES: Dict[str, BuildProfile] = {
+    FINAL: BuildProfile(FINAL),
+    DRAFT: BuildProfile(DRAFT, passes=1, images=False),
+}
+
+
+def _coerce(key: str, value: Any) -> Any:
+    """Convert a .rcv.toml value (possibly a string from the fallback parser)."""
+    if key in ("draftmode", "images"):
+        if isinstance(value, str):
+            return value.strip().lower() == "true"
+        return bool(value)
+    if key == "passes":
+        return int(value)
+    return str(value)
+
+
+def profile_from_settings(
+    name: str, settings: Mapping[str, Any], base: Optional[BuildProfile] = None
+) -> BuildProfile:
+    """Build a profile from a `[profiles.NAME]` table over a base profile.
+
+    Raises ValueError for unknown keys or invalid values.
+    """
+    base = base or BUILTIN_PROFILES.get(name) or BuildProfile(name)
+    known = {f.name for f in fields(BuildProfile)} - {"name"}
+    changes = {}
+    for key, value in settings.items():
+        if key not in known:
+            raise ValueError(f"unknown setting in profile '{name}': {key}")
+        try:
+            changes[key] = _coerce(key, value)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid value for {key} in profile '{name}': {value}")
+    if changes.get("passes", base.passes) < 1:
+        raise ValueError(f"passes must be at least 1 in profile '{name}'")
+    return replace(base, name=name, **changes)
+
+
+def available_profiles(tables: Mapping[str, Mapping[str, Any]]) -> List[str]:
+    return sorted(set(BUILTIN_PROFILES) | set(tables))
+
+
+def resolve_profile(name: str, tables: Mapping[str, Mapping[str, Any]]) -> BuildProfile:
+    """Look up a profile by name among .rcv.toml tables and the built-ins.
+
+    Raises ValueError for an unknown name or an invalid table.
+    """
+    if name in tables:
+        return profile_from_settings(name, tables[name])
+    if name in BUILTIN_PROFILES:
+        return BUILTIN_PROFILES[name]
+    raise ValueError(
+        f"unknown build profile '{name}' "
+        f"(available: {', '.join(available_profiles(tables))})"
+    )
@@ -0,0 +1,187 @@
+"""Incremental mirroring of built PDFs to a (slow, synced) destination."""
+
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from rcv.core.cache import HashCache, JsonCache
+
+
+# Copies are I/O-bound; more threads than this just queue on the sync client.
+DEFAULT_COPY_JOBS = 8
+
+
+@dataclass
+class PublishPlan:
+    """What a publish would do, keyed by path relative to the destination."""
+
+    copy: Dict[str, Path] = field(default_factory=dict)  # relpath -> local PDF
+    unchanged: List[str] = field(default_factory=list)
+    orphans: List[str] = field(default_factory=list)
+    hashes: Dict[str, str] = field(default_factory=dict)  # relpath -> local hash
+
+
+@dataclass
+class PublishResult:
+    copied: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def copy_atomic(source: Path, target: Path) -> os.stat_result:
+    """Copy source to target via a temp file in the target directory.
+
+    The synced folder only ever sees a complete file appear under the
+    final name. Returns the stat of the published file.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(source, "rb") as src, open(partial, "wb") as dst:
+            while chunk := src.read(1024 * 1024):
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(partial, target)
+    finally:
+        partial.unlink(missing_ok=True)
+    return target.stat()
+
+
+class Publisher:
+    """Mirror PDFs to a destination, copying only changed content.
+
+    What was last published to each destination (hash, size and mtime of
+    the destination file) is remembered in the project cache, so an
+    unchanged PDF costs one stat() of the destination file. Destination
+    files with no record, or whose stat changed, are hashed before being
+    overwritten, so publishing into an existing mirror does not re-upload
+    identical files.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        destination: Path,
+        hashes: HashCache,
+        jobs: Optional[int] = None,
+    ):
+        self.destination = destination
+        self.hashes = hashes
+        self.jobs = jobs or DEFAULT_COPY_JOBS
+        self._cache = JsonCache.for_project(project_dir, "publish")
+        self._key = str(destination.resolve())
+
+    def _published(self) -> Dict[str, list]:
+        return self._cache.get(self._key) or {}
+
+    def _is_current(self, relpath: str, digest: str) -> bool:
+        target = self.destination / relpath
+        try:
+            stat = target.stat()
+        except OSError:
+            return False
+        if self._published().get(relpath) == [digest, stat.st_size, stat.st_mtime_ns]:
+            return True
+        try:
+            current = self.hashes.hash_file(target)
+        except OSError:
+            return False
+        if current != digest:
+            return False
+        self._remember(relpath, digest, stat)
+        return True
+
+    def _remember(self, relpath: str, digest: str, stat: os.stat_result) -> None:
+        record = [digest, stat.st_size, stat.st_mtime_ns]
+        self._cache.edit(self._key, {})[relpath] = record
+
+    def plan(
+        self, files: Dict[str, Path], keep: Iterable[str] = (), delete: bool = False
+    ) -> PublishPlan:
+        """Work out which files to copy and, with delete, which to remove.
+
+        files maps destination-relative paths to local PDFs; keep lists
+        further relative paths that must not be treated as orphans.
+        Raises OSError if a local PDF cannot be read.
+        """
+        plan = PublishPlan()
+        for relpath, path in files.items():
+            plan.hashes[relpath] = self.hashes.hash_file(path)
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            current = dict(
+                zip(
+                    files,
+                    pool.map(
+                        lambda rel: self._is_current(rel, plan.hashes[rel]), files
+                    ),
+                )
+            )
+        for relpath, path in sorted(files.items()):
+            if current[relpath]:
+                plan.unchanged.append(relpath)
+            else:
+                plan.copy[relpath] = path
+
+        if delete and self.destination.is_dir():
+            live = set(files) | set(keep)
+            plan.orphans = sorted(
+                rel
+                for rel in (
+                    p.relative_to(self.destination).as_posix()
+                    for p in self.destination.rglob("*.pdf")
+                )
+                if rel not in live
+            )
+        return plan
+
+    def publish(self, plan: PublishPlan) -> PublishResult:
+        """Carry out a plan: parallel atomic copies, then orphan removal."""
+        result = PublishResult()
+
+        def copy(item: Tuple[str, Path]) -> Tuple[str, Optional[str]]:
+            relpath, source = item
+            try:
+                stat = copy_atomic(source, self.destination / relpath)
+            except OSError as e:
+                return relpath, str(e)
+            self._remember(relpath, plan.hashes[relpath], stat)
+            return relpath, None
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for relpath, error in pool.map(copy, sorted(plan.copy.items())):
+                if error is None:
+                    result.copied.append(relpath)
+                else:
+                    result.failed.append((relpath, error))
+
+        published = self._cache.edit(self._key, {})
+        for relpath in plan.orphans:
+            target = self.destination / relpath
+            try:
+                target.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                result.failed.append((relpath, str(e)))
+                continue
+            published.pop(relpath, None)
+            result.removed.append(relpath)
+            _remove_empty_parents(target.parent, self.destination)
+        return result
+
+    def save(self) -> None:
+        self._cache.save()
+
+
+def _remove_empty_parents(directory: Path, root: Path) -> None:
+    while directory != root and root in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
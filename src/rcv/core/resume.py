@@ -1,14 +1,31 @@
 """Resume model and metadata handling."""
 
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 import json
+import os
+
+from rcv.core.cache import HashCache
+from rcv.core.delta import apply_delta
+from rcv.core.objects import ObjectStore, content_hash, text_hash
+from rcv.core.storage import atomic_write_text, file_lock
 
 
 METADATA_FILE = ".meta.json"
 VARIANTS_DIR = "variants"
+SEED_SUFFIXES = (".tex", ".typ")
+
+
+class MetadataError(ValueError):
+    """Raised when a .meta.json file exists but cannot be parsed."""
+
+    def __init__(self, meta_file: Path, reason: str):
+        super().__init__(f"Corrupt metadata file {meta_file}: {reason}")
+        self.meta_file = meta_file
+        self.reason = reason
 
 
 @dataclass
@@ -21,10 +38,23 @@ class ResumeMetadata:
     notes: str = ""
     format: str = "latex"  # latex or typst
     archived: bool = False
+    # Set while the resume source is stored as a delta in the object store:
+    # {"base": oid, "delta": oid, "hash": oid, "mtime": float}
+    packed: Optional[Dict[str, Any]] = None
+    # Object id of the parent's source when this variant was branched
+    base_hash: Optional[str] = None
+    # Build profile used instead of the project's default_profile
+    profile: Optional[str] = None
+    # Build backend used instead of the project's backend for this format
+    backend: Optional[str] = None
+    # Page budget instead of the project's max_pages
+    max_pages: Optional[int] = None
+    # Object id of the source last written by `rcv render`
+    render_hash: Optional[str] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        data = {
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "tags": self.tags,
@@ -32,6 +62,19 @@ class ResumeMetadata:
             "format": self.format,
             "archived": self.archived,
         }
+        if self.packed is not None:
+            data["packed"] = self.packed
+        if self.base_hash is not None:
+            data["base_hash"] = self.base_hash
+        if self.profile is not None:
+            data["profile"] = self.profile
+        if self.backend is not None:
+            data["backend"] = self.backend
+        if self.max_pages is not None:
+            data["max_pages"] = self.max_pages
+        if self.render_hash is not None:
+            data["render_hash"] = self.render_hash
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "ResumeMetadata":
@@ -47,25 +90,44 @@ class ResumeMetadata:
             notes=data.get("notes", ""),
             format=data.get("format", "latex"),
             archived=data.get("archived", False),
+            packed=data.get("packed"),
+            base_hash=data.get("base_hash"),
+            profile=data.get("profile"),
+            backend=data.get("backend"),
+            max_pages=(
+                int(data["max_pages"]) if data.get("max_pages") is not None else None
+            ),
+            render_hash=data.get("render_hash"),
         )
 
     def save(self, path: Path) -> None:
-        """Save metadata to file."""
+        """Save metadata to file.
+
+        The file is replaced atomically so a crash or a concurrent reader
+        never observes a truncated .meta.json.
+        """
         self.updated_at = datetime.now()
         meta_file = path / METADATA_FILE
-        with open(meta_file, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        atomic_write_text(meta_file, json.dumps(self.to_dict(), indent=2))
 
     @classmethod
     def load(cls, path: Path) -> "ResumeMetadata":
-        """Load metadata from file."""
+        """Load metadata from file.
+
+        Raises MetadataError if the file exists but is not valid metadata.
+        """
         meta_file = path / METADATA_FILE
         if not meta_file.exists():
             return cls()
 
-        with open(meta_file) as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        try:
+            with open(meta_file) as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            return cls.from_dict(data)
+        except (ValueError, TypeError) as e:
+            raise MetadataError(meta_file, str(e)) from e
 
 
 @dataclass
@@ -96,13 +158,27 @@ class Resume:
 
     @property
     def parent_path(self) -> Optional[Path]:
-        """Get the parent resume path, if this is a variant."""
-        if VARIANTS_DIR not in self.path.parts:
+        """Get the direct parent resume path, if this is a variant."""
+        if self.path.parent.name != VARIANTS_DIR:
             return None
 
         # Go up past 'variants' directory
-        idx = list(self.path.parts).index(VARIANTS_DIR)
-        return Path(*self.path.parts[:idx])
+        return self.path.parent.parent
+
+    @property
+    def project_dir(self) -> Path:
+        """Get the project root containing this resume's root ancestor."""
+        path = self.path
+        while path.parent.name == VARIANTS_DIR:
+            path = path.parent.parent
+        return path.parent
+
+    def get_parent(self) -> Optional["Resume"]:
+        """Load the direct parent resume, if this is a variant."""
+        parent = self.parent_path
+        if parent is None or not (parent / METADATA_FILE).exists():
+            return None
+        return Resume.load(parent)
 
     @property
     def parent_name(self) -> Optional[str]:
@@ -121,8 +197,60 @@ class Resume:
         ext = ".tex" if self.metadata.format == "latex" else ".typ"
         return self.path / f"resume{ext}"
 
-    def get_variants(self) -> List["Resume"]:
-        """Get all direct variants of this resume."""
+    @property
+    def is_packed(self) -> bool:
+        """Whether the source lives in the object store instead of on disk."""
+        return self.metadata.packed is not None
+
+    def has_source(self) -> bool:
+        """Whether the resume source is available (on disk or packed)."""
+        return self.is_packed or self.resume_file.exists()
+
+    def read_source(self) -> str:
+        """Read the resume source, expanding it from the pack if needed."""
+        packed = self.metadata.packed
+        if packed is None:
+            return self.resume_file.read_bytes().decode("utf-8")
+
+        store = ObjectStore.for_project(self.project_dir)
+        base = store.get_text(packed["base"])
+        text = apply_delta(base, store.get(packed["delta"]))
+        if text_hash(text) != packed["hash"]:
+            raise ValueError(f"Packed source of {self.full_name} failed verification")
+        return text
+
+    def source_hash(self, hashes: Optional[HashCache] = None) -> str:
+        """Get the object id of the resume source without unpacking it."""
+        if self.metadata.packed is not None:
+            return self.metadata.packed["hash"]
+        if hashes is not None:
+            return hashes.hash_file(self.resume_file)
+        return content_hash(self.resume_file.read_bytes())
+
+    def ensure_source_file(self) -> Path:
+        """Unpack the resume source to disk if needed and return its path.
+
+        Commands that hand the file to a compiler or editor call this;
+        read-only commands should prefer read_source().
+        """
+        if self.is_packed:
+            text = self.read_source()
+            with self.edit_metadata() as metadata:
+                if metadata.packed is not None:
+                    mtime = metadata.packed.get("mtime")
+                    atomic_write_text(self.resume_file, text)
+                    if mtime is not None:
+                        os.utime(self.resume_file, (mtime, mtime))
+                    metadata.packed = None
+        return self.resume_file
+
+    def get_variants(
+        self, errors: Optional[List[MetadataError]] = None
+    ) -> List["Resume"]:
+        """Get all direct variants of this resume.
+
+        Variants with corrupt metadata are skipped and appended to errors.
+        """
         variants = []
         variants_path = self.variants_dir
 
@@ -131,22 +259,41 @@ class Resume:
 
         for item in variants_path.iterdir():
             if item.is_dir() and (item / METADATA_FILE).exists():
-                variants.append(Resume.load(item))
+                resume = _load_tolerant(item, errors)
+                if resume is not None:
+                    variants.append(resume)
 
         return sorted(variants, key=lambda r: r.name)
 
-    def get_all_descendants(self) -> List["Resume"]:
+    def get_all_descendants(
+        self, errors: Optional[List[MetadataError]] = None
+    ) -> List["Resume"]:
         """Get all variants recursively."""
         descendants = []
-        for variant in self.get_variants():
+        for variant in self.get_variants(errors):
             descendants.append(variant)
-            descendants.extend(variant.get_all_descendants())
+            descendants.extend(variant.get_all_descendants(errors))
         return descendants
 
     def save(self) -> None:
         """Save resume metadata."""
         self.metadata.save(self.path)
 
+    @contextmanager
+    def edit_metadata(self) -> Iterator[ResumeMetadata]:
+        """Lock, reload and save metadata around a read-modify-write cycle.
+
+        Use this instead of mutating self.metadata and calling save() when
+        other rcv processes may update the same resume concurrently. The
+        file is only rewritten if the metadata actually changed.
+        """
+        with file_lock(self.path):
+            self.metadata = ResumeMetadata.load(self.path)
+            before = json.dumps(self.metadata.to_dict())
+            yield self.metadata
+            if json.dumps(self.metadata.to_dict()) != before:
+                self.metadata.save(self.path)
+
     @classmethod
     def load(cls, path: Path) -> "Resume":
         """Load a resume from a directory."""
@@ -159,11 +306,13 @@ class Resume:
         path: Path,
         format: str = "latex",
         template_content: Optional[str] = None,
+        metadata: Optional[ResumeMetadata] = None,
     ) -> "Resume":
-        """Create a new resume."""
+        """Create a new resume (with fresh metadata unless given)."""
         path.mkdir(parents=True, exist_ok=True)
 
-        metadata = ResumeMetadata(format=format)
+        if metadata is None:
+            metadata = ResumeMetadata(format=format)
         metadata.save(path)
 
         # Create the resume file
@@ -182,8 +331,26 @@ class Resume:
         return cls(path=path, metadata=metadata)
 
 
-def get_all_resumes(resumes_dir: Path) -> List[Resume]:
-    """Get all resumes in the resumes directory."""
+def _load_tolerant(
+    path: Path, errors: Optional[List[MetadataError]]
+) -> Optional[Resume]:
+    """Load a resume, recording corrupt metadata instead of raising."""
+    try:
+        return Resume.load(path)
+    except MetadataError as e:
+        if errors is not None:
+            errors.append(e)
+        return None
+
+
+def get_all_resumes(
+    resumes_dir: Path, errors: Optional[List[MetadataError]] = None
+) -> List[Resume]:
+    """Get all resumes in the resumes directory.
+
+    Resumes whose .meta.json is corrupt are skipped; pass a list as errors
+    to collect them for reporting.
+    """
     resumes = []
 
     if not resumes_dir.exists():
@@ -191,13 +358,16 @@ def get_all_resumes(resumes_dir: Path) -> List[Resume]:
 
     # Find all directories with .meta.json
     for meta_file in resumes_dir.rglob(METADATA_FILE):
-        resume_path = meta_file.parent
-        resumes.append(Resume.load(resume_path))
+        resume = _load_tolerant(meta_file.parent, errors)
+        if resume is not None:
+            resumes.append(resume)
 
     return sorted(resumes, key=lambda r: r.full_name)
 
 
-def get_root_resumes(resumes_dir: Path) -> List[Resume]:
+def get_root_resumes(
+    resumes_dir: Path, errors: Optional[List[MetadataError]] = None
+) -> List[Resume]:
     """Get only root-level resumes (not variants)."""
     resumes = []
 
@@ -206,17 +376,24 @@ def get_root_resumes(resumes_dir: Path) -> List[Resume]:
 
     for item in resumes_dir.iterdir():
         if item.is_dir() and (item / METADATA_FILE).exists():
-            resumes.append(Resume.load(item))
+            resume = _load_tolerant(item, errors)
+            if resume is not None:
+                resumes.append(resume)
 
     return sorted(resumes, key=lambda r: r.name)
 
 
-def find_resume(resumes_dir: Path, name: str) -> Optional[Resume]:
+def find_resume(
+    resumes_dir: Path, name: str, errors: Optional[List[MetadataError]] = None
+) -> Optional[Resume]:
     """Find a resume by name.
 
     Name can be:
     - Simple name: "swe" -> finds resumes_dir/swe
     - Path name: "swe/google" -> finds resumes_dir/swe/variants/google
+
+    A resume whose .meta.json is corrupt is not found; pass a list as
+    errors to collect its MetadataError for reporting.
     """
     name = name.strip()
     if not name:
@@ -230,9 +407,12 @@ def find_resume(resumes_dir: Path, name: str) -> Optional[Resume]:
 
     if len(parts) == 1:
         # Simple name - could be anywhere
-        for resume in get_all_resumes(resumes_dir):
+        corrupt: List[MetadataError] = []
+        for resume in get_all_resumes(resumes_dir, corrupt):
             if resume.name == name:
                 return resume
+        if errors is not None:
+            errors.extend(e for e in corrupt if e.meta_file.parent.name == name)
         return None
 
     # Path-style name - build the actual path
@@ -241,11 +421,33 @@ def find_resume(resumes_dir: Path, name: str) -> Optional[Resume]:
         path = path / VARIANTS_DIR / part
 
     if (path / METADATA_FILE).exists():
-        return Resume.load(path)
+        return _load_tolerant(path, errors)
 
     return None
 
 
+def find_seed_file(seed: str, bases: List[Path]) -> Optional[Path]:
+    """Resolve a seed path to a .tex/.typ file.
+
+    Absolute paths are used as is; relative ones are tried against each
+    of bases in turn.
+    """
+    seed_path = Path(seed)
+    if seed_path.is_absolute():
+        candidates = [seed_path]
+    else:
+        candidates = [base / seed_path for base in bases]
+    for candidate in candidates:
+        if candidate.is_file() and candidate.suffix in SEED_SUFFIXES:
+            return candidate
+    return None
+
+
+def seed_format(path: Path) -> str:
+    """The resume format of a seed file."""
+    return "latex" if path.suffix == ".tex" else "typst"
+
+
 # Templates
 
 LATEX_TEMPLATE = r"""\documentclass[11pt,a4paper]{article}
@@ -0,0 +1,141 @@
+"""Persistent inverted index over resume sources for full-text search."""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from rcv.core.cache import JsonCache
+from rcv.core.resume import Resume
+
+
+_TERM_RE = re.compile(r"\w{2,}")
+
+# Line numbers (1-based) per content hash
+Postings = Dict[str, List[int]]
+
+
+def terms(text: str) -> List[str]:
+    """Split text into lowercase search terms."""
+    return [term.lower() for term in _TERM_RE.findall(text)]
+
+
+def index_text(text: str) -> Dict[str, List[int]]:
+    """Map each term of a source to the lines it occurs on."""
+    lines: Dict[str, List[int]] = {}
+    for number, line in enumerate(text.splitlines(), start=1):
+        for term in set(terms(line)):
+            lines.setdefault(term, []).append(number)
+    return lines
+
+
+class SearchIndex:
+    """Term -> {content hash -> line numbers}, updated incrementally.
+
+    Documents are keyed by content hash, so identical sources are indexed
+    once and only new or edited content is ever re-read. The index lives
+    in two caches: postings per term and the vocabulary per document,
+    which is what allows a stale document to be removed again.
+    """
+
+    def __init__(self, project_dir: Path):
+        self._postings = JsonCache.for_project(project_dir, "search_terms")
+        self._documents = JsonCache.for_project(project_dir, "search_docs")
+
+    def update(self, sources: Dict[str, Resume]) -> int:
+        """Sync the index with content hash -> resume holding that content.
+
+        Returns the number of documents (re)indexed.
+        """
+        for digest in self._documents.keys():
+            if digest not in sources:
+                self._remove(digest)
+
+        indexed = 0
+        for digest, resume in sources.items():
+            if self._documents.get(digest) is not None:
+                continue
+            try:
+                text = resume.read_source()
+            except (OSError, ValueError):
+                continue
+            self._add(digest, text)
+            indexed += 1
+        return indexed
+
+    def _add(self, digest: str, text: str) -> None:
+        lines = index_text(text)
+        for term, numbers in lines.items():
+            self._postings.edit(term, {})[digest] = numbers
+        self._documents.set(digest, sorted(lines))
+
+    def _remove(self, digest: str) -> None:
+        for term in self._documents.get(digest) or []:
+            postings = self._postings.edit(term, {})
+            postings.pop(digest, None)
+            if not postings:
+                self._postings.discard(term)
+        self._documents.discard(digest)
+
+    def __contains__(self, digest: str) -> bool:
+        """Whether a document was indexed (unreadable sources are not)."""
+        return self._documents.get(digest) is not None
+
+    def lookup(self, term: str) -> Postings:
+        """Get the documents and lines containing a term."""
+        return self._postings.get(term.lower()) or {}
+
+    def literal_candidates(self, text: str) -> Optional[Set[str]]:
+        """Documents that may contain text, a literal of words and spaces.
+
+        Inner words must be whole terms, the first word must end a term
+        and the last must start one; a lone word may sit anywhere inside
+        a term. None if the index cannot tell (a one-letter word, which
+        may stand alone and is not indexed).
+        """
+        pieces = text.lower().split(" ")
+        if not any(pieces) or any(len(piece) == 1 for piece in pieces):
+            return None
+        found: Optional[Set[str]] = None
+        last = len(pieces) - 1
+        for i, piece in enumerate(pieces):
+            if not piece:
+                continue
+            if 0 < i < last:
+                documents = set(self.lookup(piece))
+            else:
+                documents = set()
+                for term in self._postings.keys():
+                    if (
+                        (i == 0 or term.startswith(piece))
+                        and (i == last or term.endswith(piece))
+                        and piece in term
+                    ):
+                        documents.update(self.lookup(term))
+            found = documents if found is None else found & documents
+        return found
+
+    def search(self, query: Iterable[str], match_all: bool = True) -> Postings:
+        """Find documents containing all (or any) query terms.
+
+        Returns the matching lines of each document, i.e. the lines that
+        contain at least one query term.
+        """
+        results: Optional[Dict[str, Set[int]]] = None
+        for term in query:
+            postings = self.lookup(term)
+            if results is None:
+                results = {d: set(lines) for d, lines in postings.items()}
+            elif match_all:
+                results = {
+                    d: lines | set(postings[d])
+                    for d, lines in results.items()
+                    if d in postings
+                }
+            else:
+                for digest, lines in postings.items():
+                    results.setdefault(digest, set()).update(lines)
+        return {d: sorted(lines) for d, lines in (results or {}).items()}
+
+    def save(self) -> None:
+        self._postings.save()
+        self._documents.save()
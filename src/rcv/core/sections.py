@@ -0,0 +1,294 @@
+"""Section-level parsing and structural diffing of resume sources."""
+
+import difflib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from rcv.core.cache import JsonCache
+from rcv.core.objects import text_hash
+
+
+BLOCK_LINE = "line"
+BLOCK_BULLET = "bullet"
+
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_MODIFIED = "modified"
+
+PREAMBLE_TITLE = "(preamble)"
+
+_LATEX_HEADING_RE = re.compile(r"^\s*\\(section|subsection|subsubsection)\*?\{(.*)\}")
+_LATEX_LEVELS = {"section": 1, "subsection": 2, "subsubsection": 3}
+_LATEX_ITEM_RE = re.compile(r"^\s*\\item\b")
+_LATEX_LIST_END_RE = re.compile(r"^\s*\\(end|begin)\{(itemize|enumerate)\}")
+_TYPST_HEADING_RE = re.compile(r"^(=+)\s+(.*)$")
+_TYPST_ITEM_RE = re.compile(r"^\s*[-+]\s")
+_BULLET_MARKER_RE = re.compile(r"^\s*(\\item\b|[-+]\s)\s*")
+_SPACE_RE = re.compile(r"\s+")
+
+# (kind, text) where text keeps the source lines, newlines included
+Block = Tuple[str, str]
+
+
+@dataclass
+class Section:
+    """A heading and its content, up to the next heading.
+
+    The path holds the titles of the enclosing headings, so a flat list of
+    sections in document order describes the whole section tree.
+    """
+
+    path: Tuple[str, ...]
+    level: int
+    blocks: List[Block] = field(default_factory=list)
+
+    @property
+    def title(self) -> str:
+        return self.path[-1]
+
+    @property
+    def text(self) -> str:
+        return "".join(text for _, text in self.blocks)
+
+    @property
+    def hash(self) -> str:
+        return text_hash(self.text)
+
+    @property
+    def bullets(self) -> List[str]:
+        return [text for kind, text in self.blocks if kind == BLOCK_BULLET]
+
+    def to_dict(self) -> dict:
+        return {"path": list(self.path), "level": self.level, "blocks": self.blocks}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Section":
+        return cls(
+            path=tuple(data["path"]),
+            level=data["level"],
+            blocks=[(kind, text) for kind, text in data["blocks"]],
+        )
+
+
+def _heading(line: str, format: str) -> Optional[Tuple[int, str]]:
+    if format == "typst":
+        match = _TYPST_HEADING_RE.match(line)
+        if match:
+            return len(match.group(1)), match.group(2).strip()
+        return None
+    match = _LATEX_HEADING_RE.match(line)
+    if match:
+        return _LATEX_LEVELS[match.group(1)], match.group(2).strip()
+    return None
+
+
+def parse_sections(text: str, format: str = "latex") -> List[Section]:
+    """Split a resume source into sections of lines and bullets.
+
+    LaTeX \\section*/\\subsection* and typst =/== headings start sections;
+    \\item entries and typst -/+ list items (with their continuation lines)
+    become bullet blocks. Content before the first heading forms a
+    preamble section.
+    """
+    item_re = _TYPST_ITEM_RE if format == "typst" else _LATEX_ITEM_RE
+    sections = [Section(path=(PREAMBLE_TITLE,), level=0)]
+    stack: List[Tuple[int, str]] = []
+    in_bullet = False
+
+    for line in text.splitlines(keepends=True):
+        current = sections[-1]
+        heading = _heading(line, format)
+        if heading is not None:
+            level, title = heading
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, title))
+            sections.append(
+                Section(path=tuple(t for _, t in stack), level=level, blocks=[])
+            )
+            sections[-1].blocks.append((BLOCK_LINE, line))
+            in_bullet = False
+        elif item_re.match(line):
+            current.blocks.append((BLOCK_BULLET, line))
+            in_bullet = True
+        elif in_bullet and _continues_bullet(line, format):
+            kind, previous = current.blocks[-1]
+            current.blocks[-1] = (kind, previous + line)
+        else:
+            current.blocks.append((BLOCK_LINE, line))
+            in_bullet = False
+
+    if not sections[0].blocks:
+        sections.pop(0)
+    return sections
+
+
+def _continues_bullet(line: str, format: str) -> bool:
+    if not line.strip():
+        return False
+    if format == "typst":
+        return line[:1].isspace()
+    return not _LATEX_LIST_END_RE.match(line) and not line.lstrip().startswith("\\")
+
+
+def normalize_bullet(text: str) -> str:
+    """Reduce a bullet to its words so moves survive re-indentation."""
+    return _SPACE_RE.sub(" ", _BULLET_MARKER_RE.sub("", text, count=1)).strip()
+
+
+class SectionCache:
+    """Parsed sections keyed by source content hash, cached across runs."""
+
+    def __init__(self, project_dir: Path):
+        self._cache = JsonCache.for_project(project_dir, "sections")
+
+    def parse(self, text: str, format: str) -> List[Section]:
+        """Parse a source, reusing the cached parse of identical content."""
+        key = f"{format}:{text_hash(text)}"
+        cached = self._cache.get(key)
+        if cached is not None:
+            return [Section.from_dict(data) for data in cached]
+        sections = parse_sections(text, format)
+        self._cache.set(key, [section.to_dict() for section in sections])
+        return sections
+
+    def save(self) -> None:
+        self._cache.save()
+
+
+@dataclass
+class BlockChange:
+    """One changed block within a section.
+
+    op is "-" or "+" for removed/added content and "~" for a bullet that
+    moved: moved_from is set where it arrived, moved_to where it left.
+    """
+
+    op: str
+    kind: str
+    text: str
+    moved_from: Optional[Tuple[str, ...]] = None
+    moved_to: Optional[Tuple[str, ...]] = None
+
+
+@dataclass
+class SectionChange:
+    """A section that differs between two sources."""
+
+    path: Tuple[str, ...]
+    change: str
+    blocks: List[BlockChange] = field(default_factory=list)
+
+
+@dataclass
+class StructuralDiff:
+    """Section-by-section differences between two sources."""
+
+    changes: List[SectionChange]
+    unchanged: int
+    reordered: bool
+
+    @property
+    def moved(self) -> int:
+        return sum(
+            1
+            for section in self.changes
+            for block in section.blocks
+            if block.op == "~" and block.moved_from is not None
+        )
+
+
+def _keyed(sections: List[Section]) -> Dict[Tuple[Tuple[str, ...], int], Section]:
+    """Key sections by path plus occurrence, so repeated titles stay distinct."""
+    seen: Dict[Tuple[str, ...], int] = {}
+    keyed: Dict[Tuple[Tuple[str, ...], int], Section] = {}
+    for section in sections:
+        index = seen.get(section.path, 0)
+        seen[section.path] = index + 1
+        keyed[(section.path, index)] = section
+    return keyed
+
+
+def structural_diff(old: List[Section], new: List[Section]) -> StructuralDiff:
+    """Diff two parsed sources section by section.
+
+    Sections with identical hashes are skipped without diffing. Bullets
+    that disappear from one place and reappear verbatim (ignoring
+    whitespace) elsewhere are reported as moves rather than -/+ pairs.
+    """
+    old_keyed = _keyed(old)
+    new_keyed = _keyed(new)
+
+    common = [key for key in old_keyed if key in new_keyed]
+    new_order = [key for key in new_keyed if key in old_keyed]
+    reordered = common != new_order
+
+    unchanged = 0
+    changes: Dict[Tuple[Tuple[str, ...], int], SectionChange] = {}
+    for key in [*old_keyed, *(k for k in new_keyed if k not in old_keyed)]:
+        before = old_keyed.get(key)
+        after = new_keyed.get(key)
+        if before is not None and after is not None and before.hash == after.hash:
+            unchanged += 1
+            continue
+        if after is None:
+            change = SectionChange(key[0], CHANGE_REMOVED)
+            change.blocks = [BlockChange("-", k, t) for k, t in before.blocks]
+        elif before is None:
+            change = SectionChange(key[0], CHANGE_ADDED)
+            change.blocks = [BlockChange("+", k, t) for k, t in after.blocks]
+        else:
+            change = SectionChange(key[0], CHANGE_MODIFIED)
+            change.blocks = list(_diff_blocks(before.blocks, after.blocks))
+        changes[key] = change
+
+    _mark_moves(list(changes.values()))
+
+    # Report in the new document's order, then sections that were removed.
+    order = [k for k in new_keyed if k in changes]
+    order += [k for k in old_keyed if k in changes and k not in new_keyed]
+    return StructuralDiff(
+        changes=[changes[k] for k in order], unchanged=unchanged, reordered=reordered
+    )
+
+
+def _diff_blocks(before: List[Block], after: List[Block]) -> Iterator[BlockChange]:
+    matcher = difflib.SequenceMatcher(None, before, after, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        for kind, text in before[i1:i2]:
+            yield BlockChange("-", kind, text)
+        for kind, text in after[j1:j2]:
+            yield BlockChange("+", kind, text)
+
+
+def _mark_moves(changes: List[SectionChange]) -> None:
+    """Pair removed and added bullets with the same words into moves."""
+    removed: Dict[str, List[Tuple[SectionChange, BlockChange]]] = {}
+    for section in changes:
+        for block in section.blocks:
+            if block.op == "-" and block.kind == BLOCK_BULLET:
+                key = normalize_bullet(block.text)
+                removed.setdefault(key, []).append((section, block))
+
+    for section in changes:
+        for block in section.blocks:
+            if block.op != "+" or block.kind != BLOCK_BULLET:
+                continue
+            candidates = removed.get(normalize_bullet(block.text))
+            if not candidates:
+                continue
+            source, old_block = candidates.pop(0)
+            block.op = "~"
+            block.moved_from = source.path
+            old_block.op = "~"
+            old_block.moved_to = section.path
+
+    # A bullet reordered within its section is reported once, where it lands.
+    for section in changes:
+        section.blocks = [
+            block for block in section.blocks if block.moved_to != section.path
+        ]
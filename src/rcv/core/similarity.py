@@ -0,0 +1,170 @@
+"""MinHash signatures and LSH for near-duplicate detection across resumes."""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from itertools import combinations, product
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 61) - 1
+_SEED = 0x52435600  # fixed so cached signatures stay comparable across runs
+
+_rng = random.Random(_SEED)
+_PERMUTATIONS: List[Tuple[int, int]] = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_WORD_RE = re.compile(r"\w+")
+
+Signature = List[int]
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hash the word n-grams of a text to 64-bit integers."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+    return {
+        int.from_bytes(
+            hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for gram in grams
+    }
+
+
+def minhash(text: str) -> Signature:
+    """Compute the MinHash signature of a text."""
+    values = shingles(text)
+    if not values:
+        return [_MAX_HASH] * NUM_PERM
+    return [
+        min((a * v + b) % _MERSENNE_PRIME for v in values) for a, b in _PERMUTATIONS
+    ]
+
+
+def estimate_similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def candidate_pairs(signatures: Dict[str, Signature]) -> Set[Tuple[str, str]]:
+    """Find pairs that share at least one LSH band bucket.
+
+    Bucketing is linear in the number of signatures; only pairs that land
+    in the same bucket are compared, instead of all n^2 pairs.
+    """
+    pairs: Set[Tuple[str, str]] = set()
+    for band in range(BANDS):
+        start = band * ROWS
+        buckets: Dict[Tuple[int, ...], List[str]] = defaultdict(list)
+        for key, signature in signatures.items():
+            buckets[tuple(signature[start : start + ROWS])].append(key)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            members.sort()
+            for i, first in enumerate(members):
+                for second in members[i + 1 :]:
+                    pairs.add((first, second))
+    return pairs
+
+
+def group_identical(
+    signatures: Dict[str, Signature],
+) -> Tuple[Dict[str, Signature], Dict[str, List[str]]]:
+    """Collapse keys with identical signatures into one group each.
+
+    Returns the signature of each group's first key, and the sorted keys
+    of each group by that first key. Copies of one resume all share every
+    LSH bucket, so they are compared once as a group instead of pairwise.
+    """
+    groups: Dict[Tuple[int, ...], List[str]] = defaultdict(list)
+    for key in sorted(signatures):
+        groups[tuple(signatures[key])].append(key)
+    unique = {members[0]: signatures[members[0]] for members in groups.values()}
+    return unique, {members[0]: members for members in groups.values()}
+
+
+def _scored_groups(
+    signatures: Dict[str, Signature], threshold: float
+) -> Tuple[Dict[str, List[str]], List[Tuple[str, str, float]]]:
+    unique, groups = group_identical(signatures)
+    scored = []
+    for a, b in candidate_pairs(unique):
+        score = estimate_similarity(unique[a], unique[b])
+        if score >= threshold:
+            scored.append((a, b, score))
+    scored.sort(key=lambda item: (-item[2], item[0], item[1]))
+    return groups, scored
+
+
+def similar_pairs(
+    signatures: Dict[str, Signature], threshold: float
+) -> Iterator[Tuple[str, str, float]]:
+    """Yield pairs at or above threshold, most similar first.
+
+    Pairs are scored between groups of identical signatures and expanded
+    lazily, so take only as many as are needed: n copies of one resume
+    yield n^2/2 pairs.
+    """
+    groups, scored = _scored_groups(signatures, threshold)
+    for members in groups.values():
+        yield from ((a, b, 1.0) for a, b in combinations(members, 2))
+    for a, b, score in scored:
+        for first, second in product(groups[a], groups[b]):
+            yield (min(first, second), max(first, second), score)
+
+
+def similar_clusters(
+    signatures: Dict[str, Signature], threshold: float
+) -> List[List[str]]:
+    """Cluster keys whose similarity reaches threshold; singletons dropped."""
+    groups, scored = _scored_groups(signatures, threshold)
+    merged = clusters(groups, scored)
+    seen = {first for cluster in merged for first in cluster}
+    expanded = [
+        sorted(k for first in cluster for k in groups[first]) for cluster in merged
+    ]
+    expanded += [
+        members
+        for first, members in groups.items()
+        if first not in seen and len(members) > 1
+    ]
+    return sorted(expanded, key=lambda members: (-len(members), members[0]))
+
+
+def clusters(
+    keys: Iterable[str], pairs: Iterable[Tuple[str, str, float]]
+) -> List[List[str]]:
+    """Group keys connected by pairs (union-find); singletons are dropped."""
+    parent = {key: key for key in keys}
+
+    def find(key: str) -> str:
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for a, b, _ in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for key in parent:
+        groups[find(key)].append(key)
+    return sorted(
+        (sorted(members) for members in groups.values() if len(members) > 1),
+        key=lambda members: (-len(members), members[0]),
+    )
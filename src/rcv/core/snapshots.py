@@ -0,0 +1,218 @@
+"""Content-addressed snapshot history for individual resumes."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from rcv.core.deps import find_dependencies
+from rcv.core.objects import ObjectStore, content_hash, get_state_dir
+from rcv.core.resume import Resume
+from rcv.core.storage import file_lock
+
+
+SNAPSHOTS_DIR = "snapshots"
+LOG_SUFFIX = ".jsonl"
+
+TRIGGER_MANUAL = "manual"
+TRIGGER_BUILD = "build"
+TRIGGER_RESTORE = "restore"
+TRIGGER_SYNC = "sync"
+
+
+@dataclass
+class Snapshot:
+    """A single recorded version of a resume."""
+
+    number: int
+    created_at: datetime
+    source: str  # object id of the resume source
+    format: str
+    trigger: str = TRIGGER_MANUAL
+    pdf: Optional[str] = None  # object id of the built PDF, if recorded
+    message: str = ""
+    inputs: Optional[str] = None  # hash of the source and all its includes
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        data = {
+            "n": self.number,
+            "created_at": self.created_at.isoformat(),
+            "source": self.source,
+            "format": self.format,
+            "trigger": self.trigger,
+            "message": self.message,
+        }
+        if self.pdf is not None:
+            data["pdf"] = self.pdf
+        if self.inputs is not None:
+            data["inputs"] = self.inputs
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Snapshot":
+        """Create from dictionary."""
+        return cls(
+            number=int(data["n"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            source=data["source"],
+            format=data.get("format", "latex"),
+            trigger=data.get("trigger", TRIGGER_MANUAL),
+            pdf=data.get("pdf"),
+            message=data.get("message", ""),
+            inputs=data.get("inputs"),
+        )
+
+
+def inputs_hash(resume: Resume, source_text: str) -> str:
+    """Hash a resume's source together with every local file it includes.
+
+    Shared sections and other includes are part of what a snapshot's PDF
+    was built from, so editing one changes this hash too.
+    """
+    h = hashlib.sha256(source_text.encode("utf-8"))
+    source_dir = resume.resume_file.parent
+    for dep in find_dependencies(
+        resume.resume_file, resume.metadata.format, source_text
+    ):
+        h.update(b"\0" + os.path.relpath(dep, source_dir).encode("utf-8") + b"\0")
+        h.update(content_hash(dep.read_bytes()).encode("ascii"))
+    return h.hexdigest()
+
+
+def parse_snapshot_ref(ref: str) -> Tuple[str, Optional[int]]:
+    """Split "name@n" into (name, n). A bare name refers to the latest."""
+    name, sep, number = ref.rpartition("@")
+    if not sep:
+        return ref, None
+    try:
+        return name, int(number)
+    except ValueError:
+        raise ValueError(f"Invalid snapshot reference: {ref}") from None
+
+
+class SnapshotLog:
+    """Append-only snapshot log of one resume.
+
+    Each resume has its own JSON-lines file under .rcv/snapshots/ named
+    after its logical path, so recording a snapshot appends one line and
+    never rewrites other history. Source and PDF blobs go to the shared
+    object store and are deduplicated by content.
+    """
+
+    def __init__(self, project_dir: Path, full_name: str):
+        self.project_dir = project_dir
+        self.full_name = full_name
+        self.store = ObjectStore.for_project(project_dir)
+        *parents, leaf = full_name.split("/")
+        self.log_file = (
+            get_state_dir(project_dir)
+            / SNAPSHOTS_DIR
+            / Path(*parents, leaf + LOG_SUFFIX)
+        )
+
+    @classmethod
+    def for_resume(cls, resume: Resume) -> "SnapshotLog":
+        """Open the snapshot log of a resume."""
+        return cls(resume.project_dir, resume.full_name)
+
+    def entries(self) -> List[Snapshot]:
+        """Read all snapshots, oldest first. Malformed lines are skipped."""
+        if not self.log_file.exists():
+            return []
+        snapshots = []
+        for line in self.log_file.read_text().splitlines():
+            if not line.strip():
+                continue
+            try:
+                snapshots.append(Snapshot.from_dict(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                continue
+        return snapshots
+
+    def get(self, number: Optional[int] = None) -> Optional[Snapshot]:
+        """Get snapshot number n, or the latest one if n is None."""
+        entries = self.entries()
+        if not entries:
+            return None
+        if number is None:
+            return entries[-1]
+        for snapshot in entries:
+            if snapshot.number == number:
+                return snapshot
+        return None
+
+    def record(
+        self,
+        source_text: str,
+        format: str,
+        pdf_file: Optional[Path] = None,
+        trigger: str = TRIGGER_MANUAL,
+        message: str = "",
+        force: bool = False,
+        inputs: Optional[str] = None,
+    ) -> Tuple[Snapshot, bool]:
+        """Record a snapshot, returning (snapshot, created).
+
+        inputs is the inputs_hash() of the source. If the latest snapshot
+        has the same source, inputs and (when one is given) PDF, nothing
+        is written and that snapshot is returned, which makes recording
+        on every build cheap.
+        """
+        source_oid = self.store.put_text(source_text)
+        pdf_data = None
+        if pdf_file is not None and pdf_file.exists():
+            pdf_data = pdf_file.read_bytes()
+        pdf_hash = content_hash(pdf_data) if pdf_data is not None else None
+
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.log_file.parent):
+            latest = self.get()
+            if (
+                latest is not None
+                and not force
+                and latest.source == source_oid
+                and latest.inputs == inputs
+                and (pdf_file is None or latest.pdf == pdf_hash)
+            ):
+                return latest, False
+
+            pdf_oid = self.store.put(pdf_data) if pdf_data is not None else None
+
+            snapshot = Snapshot(
+                number=(latest.number + 1) if latest is not None else 1,
+                created_at=datetime.now(),
+                source=source_oid,
+                format=format,
+                trigger=trigger,
+                pdf=pdf_oid,
+                message=message,
+                inputs=inputs,
+            )
+            line = json.dumps(snapshot.to_dict(), separators=(",", ":")) + "\n"
+            fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        return snapshot, True
+
+
+def referenced_objects(project_dir: Path) -> Set[str]:
+    """Collect object ids referenced by any snapshot log in the project."""
+    live: Set[str] = set()
+    snapshots_dir = get_state_dir(project_dir) / SNAPSHOTS_DIR
+    if not snapshots_dir.exists():
+        return live
+    for log_file in snapshots_dir.rglob(f"*{LOG_SUFFIX}"):
+        full_name = log_file.relative_to(snapshots_dir).as_posix()[: -len(LOG_SUFFIX)]
+        log = SnapshotLog(project_dir, full_name)
+        for snapshot in log.entries():
+            live.add(snapshot.source)
+            if snapshot.pdf is not None:
+                live.add(snapshot.pdf)
+    return live
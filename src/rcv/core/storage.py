@@ -0,0 +1,207 @@
+"""File persistence helpers: atomic writes, locking and cheap copies."""
+
+import ctypes
+import ctypes.util
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ModuleNotFoundError:  # pragma: no cover - POSIX
+    msvcrt = None
+
+
+LOCK_FILE_NAME = ".rcv.lock"
+
+# Linux ioctl request number for FICLONE (_IOW(0x94, 9, int)).
+_FICLONE = 0x40049409
+
+CLONE_REFLINK = "reflink"
+CLONE_HARDLINK = "hardlink"
+CLONE_COPY = "copy"
+
+
+@lru_cache(maxsize=None)
+def _umask() -> int:
+    # Reading the umask means setting it; done once, before any threads
+    # are likely to be creating files.
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def _file_mode(path: Path) -> int:
+    """Permissions for a rewrite of path: its own, or the umask default."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        return 0o666 & ~_umask()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path via a temp file in the same directory and rename.
+
+    Readers see either the old content or the new content, never a
+    truncated file, even if the process dies mid-write. The file keeps
+    its permissions; new files get the usual umask-based ones rather than
+    the temp file's private 0600.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, _file_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write text to path atomically (UTF-8)."""
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+@contextmanager
+def file_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on a directory.
+
+    Used around read-modify-write cycles of files inside the directory
+    (e.g. appending a tag to .meta.json) so concurrent rcv processes
+    serialize instead of losing updates. On POSIX the directory itself is
+    locked; on Windows a lock file inside it is used. Filesystems that do
+    not support locking fall back to unlocked access.
+    """
+    if fcntl is not None:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            yield
+            return
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError:
+                pass
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+        return
+
+    if msvcrt is not None:  # pragma: no cover - Windows
+        lock_path = directory / LOCK_FILE_NAME
+        with open(lock_path, "a+b") as f:
+            f.seek(0)
+            locked = False
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                locked = True
+            except OSError:
+                pass
+            try:
+                yield
+            finally:
+                if locked:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+
+    yield  # pragma: no cover - no locking primitive available
+
+
+def _reflink_linux(src: Path, dst: Path) -> bool:
+    """Clone src to dst with the FICLONE ioctl (btrfs, XFS, ...)."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                failed = True
+            else:
+                failed = False
+    except OSError:
+        return False
+    if failed:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _reflink_darwin(src: Path, dst: Path) -> bool:
+    """Clone src to dst with clonefile(2) (APFS)."""
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return False
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return False
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile.restype = ctypes.c_int
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def reflink_file(src: Path, dst: Path) -> bool:
+    """Create dst as a copy-on-write clone of src, if the filesystem allows.
+
+    Returns False (leaving dst absent) when cloning is not supported.
+    """
+    if sys.platform.startswith("linux") and fcntl is not None:
+        return _reflink_linux(src, dst)
+    if sys.platform == "darwin":
+        return _reflink_darwin(src, dst)
+    return False
+
+
+def clone_file(src: Path, dst: Path, share: bool = False) -> str:
+    """Duplicate src at dst as cheaply as possible.
+
+    Tries a copy-on-write reflink first and falls back to a full copy.
+    With share=True, a hardlink is tried before the reflink so that both
+    paths reference the same data; only use that for files that are
+    replaced rather than edited in place (e.g. images and fonts).
+
+    Returns the method used: "hardlink", "reflink" or "copy".
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if share:
+        try:
+            os.link(src, dst)
+            return CLONE_HARDLINK
+        except OSError:
+            pass
+    if reflink_file(src, dst):
+        return CLONE_REFLINK
+    shutil.copy2(src, dst)
+    return CLONE_COPY
+
+
+def is_binary_file(path: Path, sniff_bytes: int = 8192) -> bool:
+    """Guess whether a file is binary by looking for NUL bytes."""
+    try:
+        with open(path, "rb") as f:
+            return b"\0" in f.read(sniff_bytes)
+    except OSError:
+        return False
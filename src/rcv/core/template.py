@@ -0,0 +1,443 @@
+"""Rendering resume sources from a shared template and per-variant data.
+
+A resume is templated when its directory holds a data file (data.toml or
+data.json). Its source is rendered from the nearest template.tex /
+template.typ in the resume's directory or its parents, with the data of
+every ancestor merged under its own. Templates are ordinary sources with
+<<key>> placeholders and whole-line directives written as comments
+(`%@` in LaTeX, `//@` in typst):
+
+    %@ if remote            ... %@ else ... %@ end
+    %@ section experience   ... %@ end   (reorderable, top level only)
+    %@ bullet kafka         ... %@ end   (selectable)
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from rcv.core.cache import HashCache
+from rcv.core.deps import rebase_references
+from rcv.core.objects import text_hash
+from rcv.core.resume import VARIANTS_DIR, Resume
+from rcv.core.storage import atomic_write_text
+
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:  # pragma: no cover - fallback for Python 3.10
+    tomllib = None
+
+
+TEMPLATE_STEM = "template"
+DATA_FILES = ("data.toml", "data.json")
+
+# Data keys with a meaning beyond placeholders.
+KEY_TEMPLATE = "template"
+KEY_SECTIONS = "sections"
+KEY_BULLETS = "bullets"
+
+RENDER_CHANGED = "changed"
+RENDER_UNCHANGED = "unchanged"
+RENDER_EDITED = "edited"
+RENDER_FAILED = "failed"
+
+_DIRECTIVE_RES = {
+    "latex": re.compile(r"^\s*%@\s*(\w+)(?:\s+(.*?))?\s*$"),
+    "typst": re.compile(r"^\s*//@\s*(\w+)(?:\s+(.*?))?\s*$"),
+}
+_KEY = r"[A-Za-z_][\w-]*(?:\.[\w-]+)*"
+_KEY_RE = re.compile(f"^{_KEY}$")
+_PLACEHOLDER_RE = re.compile(rf"<<\s*({_KEY})\s*(\|\s*raw\s*)?>>")
+_NAME_RE = re.compile(r"^[\w-]+$")
+_LATEX_SPECIALS = {
+    "\\": r"\textbackslash{}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+    **{c: "\\" + c for c in "&%$#_{}"},
+}
+_LATEX_ESCAPE_RE = re.compile(r"[\\~^&%$#_{}]")
+_TYPST_ESCAPE_RE = re.compile(r"([\\#$*_@<>\[\]`~])")
+
+
+class TemplateError(ValueError):
+    """Raised for templates or data that cannot be rendered."""
+
+    def __init__(self, path: Path, message: str, line: Optional[int] = None):
+        where = f"{path}:{line}" if line is not None else str(path)
+        super().__init__(f"{where}: {message}")
+        self.path = path
+        self.line = line
+
+
+@dataclass
+class _Value:
+    key: str
+    raw: bool
+    line: int
+
+
+@dataclass
+class _Block:
+    kind: str  # "if", "section" or "bullet"
+    arg: str
+    line: int
+    negate: bool = False
+    body: List["_Node"] = field(default_factory=list)
+    orelse: List["_Node"] = field(default_factory=list)
+
+
+_Node = Union[str, _Value, _Block]
+
+
+def escape_value(text: str, format: str) -> str:
+    """Escape a data value so it renders literally in the source format."""
+    if format == "typst":
+        return _TYPST_ESCAPE_RE.sub(r"\\\1", text)
+    return _LATEX_ESCAPE_RE.sub(lambda m: _LATEX_SPECIALS[m[0]], text)
+
+
+def _text_nodes(line: str, number: int) -> List[_Node]:
+    nodes: List[_Node] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(line):
+        if match.start() > pos:
+            nodes.append(line[pos : match.start()])
+        nodes.append(_Value(match[1], match[2] is not None, number))
+        pos = match.end()
+    if pos < len(line):
+        nodes.append(line[pos:])
+    return nodes
+
+
+class Template:
+    """A template parsed once into blocks and text, rendered per variant."""
+
+    def __init__(self, path: Path, text: str, format: str):
+        self.path = path
+        self.format = format
+        self.sections: Dict[str, _Block] = {}
+        self.bullets: Set[str] = set()
+        self.nodes = self._parse(text)
+
+    def _error(self, message: str, line: Optional[int] = None) -> TemplateError:
+        return TemplateError(self.path, message, line)
+
+    def _parse(self, text: str) -> List[_Node]:
+        directive_re = _DIRECTIVE_RES.get(self.format, _DIRECTIVE_RES["latex"])
+        root: List[_Node] = []
+        stack: List[Tuple[_Block, List[_Node]]] = []
+        body = root
+        for number, line in enumerate(text.splitlines(keepends=True), 1):
+            match = directive_re.match(line)
+            if match is None:
+                body.extend(_text_nodes(line, number))
+                continue
+            name, arg = match[1], (match[2] or "").strip()
+            if name == "end":
+                if not stack:
+                    raise self._error("'end' without an open block", number)
+                _, body = stack.pop()
+            elif name == "else":
+                if (
+                    not stack
+                    or stack[-1][0].kind != "if"
+                    or body is stack[-1][0].orelse
+                ):
+                    raise self._error("'else' outside an 'if' block", number)
+                body = stack[-1][0].orelse
+            elif name in ("if", "section", "bullet"):
+                block = self._block(name, arg, number, nested=bool(stack))
+                body.append(block)
+                stack.append((block, body))
+                body = block.body
+            else:
+                raise self._error(f"unknown directive '{name}'", number)
+        if stack:
+            block = stack[-1][0]
+            raise self._error(f"'{block.kind}' block is never closed", block.line)
+        return root
+
+    def _block(self, kind: str, arg: str, line: int, nested: bool) -> _Block:
+        negate = False
+        if kind == "if" and arg.startswith("not "):
+            negate, arg = True, arg[4:].strip()
+        pattern = _KEY_RE if kind == "if" else _NAME_RE
+        if not pattern.match(arg):
+            raise self._error(f"'{kind}' needs a name, got '{arg}'", line)
+        block = _Block(kind, arg, line, negate)
+        if kind == "section":
+            if nested:
+                raise self._error("sections must not be inside other blocks", line)
+            if arg in self.sections:
+                raise self._error(f"duplicate section '{arg}'", line)
+            self.sections[arg] = block
+        elif kind == "bullet":
+            self.bullets.add(arg)
+        return block
+
+    def render(self, data: Dict[str, Any], data_path: Optional[Path] = None) -> str:
+        """Render the template with a variant's data.
+
+        Sections keep their positions in the template; `sections` in the
+        data decides which section fills each position (unlisted ones are
+        left out). `bullets` lists the bullet blocks to keep.
+        """
+        data_path = data_path or self.path
+        order = _name_list(data, KEY_SECTIONS, data_path)
+        if order is not None:
+            unknown = [name for name in order if name not in self.sections]
+            if unknown:
+                raise TemplateError(
+                    data_path, f"unknown section(s): {', '.join(unknown)}"
+                )
+            fill = iter([self.sections[name] for name in order])
+        else:
+            fill = iter(self.sections.values())
+        bullets = _name_list(data, KEY_BULLETS, data_path)
+        if bullets is not None:
+            unknown = [name for name in bullets if name not in self.bullets]
+            if unknown:
+                raise TemplateError(
+                    data_path, f"unknown bullet(s): {', '.join(unknown)}"
+                )
+
+        selected = set(bullets) if bullets is not None else None
+        out: List[str] = []
+        for node in self.nodes:
+            if isinstance(node, _Block) and node.kind == "section":
+                section = next(fill, None)
+                if section is not None:
+                    self._emit(section.body, data, selected, out)
+            else:
+                self._emit([node], data, selected, out)
+        return "".join(out)
+
+    def _emit(
+        self,
+        nodes: List[_Node],
+        data: Dict[str, Any],
+        selected: Optional[Set[str]],
+        out: List[str],
+    ) -> None:
+        for node in nodes:
+            if isinstance(node, str):
+                out.append(node)
+            elif isinstance(node, _Value):
+                out.append(self._value(node, data))
+            elif node.kind == "if":
+                found, value = _lookup(data, node.arg)
+                if bool(found and value) != node.negate:
+                    self._emit(node.body, data, selected, out)
+                else:
+                    self._emit(node.orelse, data, selected, out)
+            elif node.kind == "bullet":
+                if selected is None or node.arg in selected:
+                    self._emit(node.body, data, selected, out)
+            else:
+                self._emit(node.body, data, selected, out)
+
+    def _value(self, node: _Value, data: Dict[str, Any]) -> str:
+        found, value = _lookup(data, node.key)
+        if not found:
+            raise self._error(f"no value for '{node.key}'", node.line)
+        if isinstance(value, dict):
+            raise self._error(f"'{node.key}' is a table, not a value", node.line)
+        if isinstance(value, bool):
+            text = "true" if value else "false"
+        elif isinstance(value, list):
+            text = ", ".join(str(item) for item in value)
+        else:
+            text = str(value)
+        return text if node.raw else escape_value(text, self.format)
+
+
+def _lookup(data: Dict[str, Any], key: str) -> Tuple[bool, Any]:
+    value: Any = data
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return False, None
+        value = value[part]
+    return True, value
+
+
+def _name_list(data: Dict[str, Any], key: str, path: Path) -> Optional[List[str]]:
+    value = data.get(key)
+    if value is None:
+        return None
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise TemplateError(path, f"'{key}' must be a list of names")
+    return value
+
+
+def find_data_file(directory: Path) -> Optional[Path]:
+    """The data file of a resume directory, if it has one."""
+    for name in DATA_FILES:
+        path = directory / name
+        if path.is_file():
+            return path
+    return None
+
+
+def is_templated(resume: Resume) -> bool:
+    """Whether the resume's source is rendered from a template."""
+    return find_data_file(resume.path) is not None
+
+
+def load_data_file(path: Path) -> Dict[str, Any]:
+    """Parse a TOML or JSON data file into a table."""
+    is_json = path.suffix == ".json"
+    if not is_json and tomllib is None:
+        raise TemplateError(path, "TOML data files need Python 3.11+; use JSON")
+    try:
+        text = path.read_text(encoding="utf-8")
+        data = json.loads(text) if is_json else tomllib.loads(text)
+    except (OSError, ValueError) as e:
+        raise TemplateError(path, f"cannot read data: {e}") from e
+    if not isinstance(data, dict):
+        raise TemplateError(path, "expected a table of values")
+    return data
+
+
+def merge_data(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge override into base; tables merge key by key, the rest replaces."""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_data(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _lineage(resume: Resume) -> List[Path]:
+    """The resume's directory and its ancestors' directories, root first."""
+    paths = [resume.path]
+    while paths[-1].parent.name == VARIANTS_DIR:
+        paths.append(paths[-1].parent.parent)
+    return paths[::-1]
+
+
+@dataclass
+class RenderSource:
+    """What a templated resume is rendered from."""
+
+    template: Path
+    data: Dict[str, Any]
+    data_file: Path
+
+
+def resolve_source(resume: Resume) -> RenderSource:
+    """Find a templated resume's template and merge its data.
+
+    A `template` key in a data file names the template relative to that
+    file; otherwise the nearest template.<ext> up the lineage is used.
+    """
+    data_file = find_data_file(resume.path)
+    if data_file is None:
+        raise TemplateError(resume.path, "not templated (no data.toml or data.json)")
+    ext = ".tex" if resume.metadata.format == "latex" else ".typ"
+    data: Dict[str, Any] = {}
+    named: Optional[Path] = None
+    nearest: Optional[Path] = None
+    for directory in _lineage(resume):
+        candidate = directory / f"{TEMPLATE_STEM}{ext}"
+        if candidate.is_file():
+            nearest = candidate
+        path = find_data_file(directory)
+        if path is None:
+            continue
+        layer = load_data_file(path)
+        if isinstance(layer.get(KEY_TEMPLATE), str):
+            named = (path.parent / layer[KEY_TEMPLATE]).resolve()
+            nearest = None
+        data = merge_data(data, layer)
+    template = nearest or named
+    if template is None:
+        raise TemplateError(
+            data_file, f"no {TEMPLATE_STEM}{ext} in this resume or its parents"
+        )
+    if not template.is_file():
+        raise TemplateError(data_file, f"template not found: {template}")
+    return RenderSource(template, data, data_file)
+
+
+@dataclass
+class RenderResult:
+    resume: Resume
+    status: str
+    error: Optional[str] = None
+
+
+class Renderer:
+    """Render templated resumes, parsing each template once per run.
+
+    A resume's source is only rewritten when the rendered text differs
+    from it, so unchanged variants keep their file (and mtime) and later
+    builds see them as up to date. The hash of each render is kept in the
+    resume's metadata; a source whose hash no longer matches was edited by
+    hand and is not overwritten unless forced.
+    """
+
+    def __init__(self, hashes: Optional[HashCache] = None):
+        self.hashes = hashes
+        self._templates: Dict[Path, Template] = {}
+
+    def template(self, path: Path, format: str) -> Template:
+        template = self._templates.get(path)
+        if template is None:
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, ValueError) as e:
+                raise TemplateError(path, f"cannot read template: {e}") from e
+            template = Template(path, text, format)
+            self._templates[path] = template
+        return template
+
+    @property
+    def compiled(self) -> int:
+        """Number of distinct templates parsed so far."""
+        return len(self._templates)
+
+    def render_text(self, resume: Resume) -> str:
+        """Render a resume's source text.
+
+        Includes in an inherited template are relative to the template's
+        directory; they are rebased so they resolve from the resume's own,
+        as `rcv branch` does for sources.
+        """
+        source = resolve_source(resume)
+        format = resume.metadata.format
+        template = self.template(source.template, format)
+        text = template.render(source.data, source.data_file)
+        return rebase_references(
+            text, format, source.template.parent, resume.resume_file.parent
+        )
+
+    def render(
+        self, resume: Resume, force: bool = False, dry_run: bool = False
+    ) -> RenderResult:
+        """Render a resume and write its source if the text changed."""
+        try:
+            text = self.render_text(resume)
+        except TemplateError as e:
+            return RenderResult(resume, RENDER_FAILED, str(e))
+        digest = text_hash(text)
+
+        current = resume.source_hash(self.hashes) if resume.has_source() else None
+        rendered = resume.metadata.render_hash
+        if current == digest:
+            if rendered != digest and not dry_run:
+                with resume.edit_metadata() as metadata:
+                    metadata.render_hash = digest
+            return RenderResult(resume, RENDER_UNCHANGED)
+        if current is not None and rendered not in (None, current) and not force:
+            return RenderResult(resume, RENDER_EDITED)
+        if not dry_run:
+            if resume.is_packed:
+                resume.ensure_source_file()
+            atomic_write_text(resume.resume_file, text)
+            with resume.edit_metadata() as metadata:
+                metadata.render_hash = digest
+        return RenderResult(resume, RENDER_CHANGED)
@@ -0,0 +1,528 @@
+"""Build workers: a socket protocol for compiling resumes on other machines.
+
+A job bundles a source file, the local files it depends on, the build
+backend and the compiler to run. Paths inside a job are relative to the deepest directory
+containing all of those files, so includes like `../../assets/preamble.tex`
+resolve the same way on the worker. Messages are length-prefixed JSON
+frames; file contents are base64-encoded.
+"""
+
+import asyncio
+import base64
+import hmac
+import json
+import os
+import struct
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from rcv.core.backends import Backend, get_backend
+from rcv.core.engine import BuildEngine
+from rcv.core.profiles import BuildProfile, profile_from_settings
+
+
+PROTOCOL_VERSION = 1
+DEFAULT_PORT = 7878
+TOKEN_ENV = "RCV_WORKER_TOKEN"
+LOCAL = "local"
+
+# Compilers a worker runs unless told otherwise; jobs naming anything else
+# are refused, so a worker never executes arbitrary programs for a client.
+DEFAULT_COMPILERS = ("pdflatex", "xelatex", "lualatex", "latexmk", "tectonic", "typst")
+
+# Files a job may not carry: latexmk runs these as code from the build
+# directory.
+REFUSED_FILES = ("latexmkrc", ".latexmkrc")
+
+MAX_FRAME = 256 * 1024 * 1024
+_HEADER = struct.Struct(">I")
+
+
+class WorkerError(Exception):
+    """Raised when a worker cannot be reached or breaks the protocol."""
+
+
+@dataclass
+class BuildJob:
+    """A self-contained compile request."""
+
+    name: str
+    format: str
+    compiler: str
+    source: str  # path of the source within files
+    files: Dict[str, bytes]
+    profile: Dict[str, Any] = field(default_factory=dict)  # BuildProfile settings
+    backend: str = ""  # empty for the format's built-in backend
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "format": self.format,
+            "compiler": self.compiler,
+            "source": self.source,
+            "files": {
+                path: base64.b64encode(data).decode("ascii")
+                for path, data in self.files.items()
+            },
+            "profile": self.profile,
+            "backend": self.backend,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BuildJob":
+        return cls(
+            name=str(data["name"]),
+            format=str(data["format"]),
+            compiler=str(data["compiler"]),
+            source=str(data["source"]),
+            files={
+                str(path): base64.b64decode(encoded)
+                for path, encoded in data["files"].items()
+            },
+            profile=dict(data.get("profile") or {}),
+            backend=str(data.get("backend") or ""),
+        )
+
+
+@dataclass
+class BuildResult:
+    """Outcome of a job: the PDF on success, compiler diagnostics otherwise.
+
+    warnings are the layout warnings (overfull boxes) of a successful build.
+    """
+
+    ok: bool
+    pdf: Optional[bytes] = None
+    diagnostics: str = ""
+    duration: float = 0.0
+    killed: Optional[str] = None
+    worker: str = LOCAL
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "ok": self.ok,
+            "pdf": base64.b64encode(self.pdf).decode("ascii") if self.pdf else None,
+            "diagnostics": self.diagnostics,
+            "duration": self.duration,
+            "killed": self.killed,
+            "warnings": self.warnings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, worker: str) -> "BuildResult":
+        pdf = data.get("pdf")
+        return cls(
+            ok=bool(data["ok"]),
+            pdf=base64.b64decode(pdf) if pdf else None,
+            diagnostics=str(data.get("diagnostics", "")),
+            duration=float(data.get("duration", 0.0)),
+            killed=data.get("killed"),
+            worker=worker,
+            warnings=[str(line) for line in data.get("warnings", [])],
+        )
+
+
+def make_job(
+    name: str,
+    format: str,
+    compiler: str,
+    source: Path,
+    dependencies: List[Path],
+    profile: Optional[BuildProfile] = None,
+    backend: str = "",
+) -> BuildJob:
+    """Bundle a source and its dependencies into a job.
+
+    Raises OSError if a file cannot be read.
+    """
+    source = source.resolve()
+    paths = [source, *(dep.resolve() for dep in dependencies)]
+    root = Path(os.path.commonpath([str(p.parent) for p in paths]))
+    return BuildJob(
+        name=name,
+        format=format,
+        compiler=compiler,
+        source=source.relative_to(root).as_posix(),
+        files={p.relative_to(root).as_posix(): p.read_bytes() for p in paths},
+        profile={
+            key: value
+            for key, value in (profile.settings() if profile else {}).items()
+            if value is not None
+        },
+        backend=backend,
+    )
+
+
+# --- Framing ---------------------------------------------------------------
+
+
+async def send_message(writer: asyncio.StreamWriter, message: dict) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    writer.write(_HEADER.pack(len(payload)) + payload)
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader) -> dict:
+    """Read one frame; raises WorkerError on EOF or a malformed frame."""
+    try:
+        (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+        if size > MAX_FRAME:
+            raise WorkerError(f"frame of {size} bytes exceeds limit")
+        message = json.loads(await reader.readexactly(size))
+    except asyncio.IncompleteReadError:
+        raise WorkerError("connection closed")
+    except ValueError as e:
+        raise WorkerError(f"malformed message: {e}")
+    if not isinstance(message, dict):
+        raise WorkerError("malformed message")
+    return message
+
+
+# --- Addresses -------------------------------------------------------------
+
+Address = Union[Tuple[str, int], str]  # (host, port) or a Unix socket path
+
+
+def parse_address(spec: str) -> Address:
+    """Parse `host:port`, `:port`, `host`, `unix:PATH` or a socket path."""
+    spec = spec.strip()
+    if spec.startswith("unix:"):
+        return spec[len("unix:") :]
+    if "/" in spec:
+        return spec
+    host, sep, port = spec.rpartition(":")
+    if not sep:
+        return (spec, DEFAULT_PORT)
+    if not port.isdigit():
+        raise ValueError(f"invalid port in worker address: {spec}")
+    return (host.strip("[]") or "127.0.0.1", int(port))
+
+
+def format_address(address: Address) -> str:
+    if isinstance(address, str):
+        return f"unix:{address}"
+    return f"{address[0]}:{address[1]}"
+
+
+async def _open(address: Address, timeout: float):
+    if isinstance(address, str):
+        connect = asyncio.open_unix_connection(address)
+    else:
+        connect = asyncio.open_connection(address[0], address[1])
+    return await asyncio.wait_for(connect, timeout)
+
+
+# --- Server ----------------------------------------------------------------
+
+
+def _safe_relative(path: str) -> PurePosixPath:
+    relative = PurePosixPath(path)
+    if relative.is_absolute() or ".." in relative.parts or not relative.parts:
+        raise WorkerError(f"unsafe path in job: {path}")
+    if relative.name in REFUSED_FILES:
+        raise WorkerError(f"file not allowed in job: {path}")
+    return relative
+
+
+def job_backend(job: BuildJob) -> Backend:
+    """The backend a job asks for; raises ValueError if unknown here."""
+    return get_backend(job.backend or job.format, job.format)
+
+
+async def compile_job(job: BuildJob, engine: BuildEngine) -> BuildResult:
+    """Compile a job in a scratch directory and collect the PDF.
+
+    Incremental backends start from scratch here: a worker keeps no state
+    between jobs.
+    """
+    started = time.monotonic()
+    try:
+        backend = job_backend(job)
+        profile = profile_from_settings(
+            job.name, job.profile, base=BuildProfile(job.name)
+        )
+    except ValueError as e:
+        return BuildResult(ok=False, diagnostics=str(e))
+    with tempfile.TemporaryDirectory(prefix="rcv-job-") as tmp:
+        root = Path(tmp) / "src"
+        out = Path(tmp) / "out"
+        out.mkdir()
+        for path, data in job.files.items():
+            target = root / _safe_relative(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        source = root / _safe_relative(job.source)
+        plan = backend.plan(source, out, job.compiler, profile)
+
+        result = None
+        for argv in plan.commands:
+            result = await engine.run(job.name, argv, cwd=plan.cwd)
+            if result.killed is not None:
+                return BuildResult(
+                    ok=False,
+                    diagnostics=f"{argv[0]} killed ({result.killed}) "
+                    f"after {result.duration:.1f}s",
+                    duration=time.monotonic() - started,
+                    killed=result.killed,
+                )
+            if result.returncode != 0:
+                break
+
+        ok = result is not None and result.returncode == 0 and plan.pdf.is_file()
+        diagnostics = ""
+        if not ok and result is not None:
+            diagnostics = "\n".join(backend.diagnostics(result))
+        return BuildResult(
+            ok=ok,
+            pdf=plan.pdf.read_bytes() if ok else None,
+            diagnostics=diagnostics,
+            duration=time.monotonic() - started,
+            warnings=backend.warnings(result, plan) if ok else [],
+        )
+
+
+class BuildServer:
+    """Accepts jobs over a socket and compiles them with a BuildEngine.
+
+    Each connection carries one job at a time; clients open one
+    connection per concurrent job. The engine's job limit caps how many
+    compiles run at once regardless of the number of connections.
+    """
+
+    def __init__(
+        self,
+        engine: BuildEngine,
+        compilers: Tuple[str, ...] = DEFAULT_COMPILERS,
+        token: Optional[str] = None,
+        on_job: Optional[Callable[[BuildJob, BuildResult], None]] = None,
+    ):
+        self.engine = engine
+        self.compilers = compilers
+        self.token = token
+        self.on_job = on_job
+
+    async def start(self, address: Address) -> asyncio.AbstractServer:
+        if isinstance(address, str):
+            return await asyncio.start_unix_server(self._handle, path=address)
+        return await asyncio.start_server(self._handle, address[0], address[1])
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                except WorkerError:
+                    break
+                reply = await self._dispatch(message)
+                await send_message(writer, reply)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, message: dict) -> dict:
+        sent = str(message.get("token", "")).encode("utf-8")
+        if self.token and not hmac.compare_digest(sent, self.token.encode("utf-8")):
+            return {"type": "error", "error": "invalid token"}
+        kind = message.get("type")
+        if kind == "hello":
+            return {
+                "type": "hello",
+                "version": PROTOCOL_VERSION,
+                "jobs": self.engine.jobs,
+                "compilers": list(self.compilers),
+            }
+        if kind != "build":
+            return {"type": "error", "error": f"unknown message type: {kind}"}
+        try:
+            job = BuildJob.from_dict(message["job"])
+        except (KeyError, TypeError, ValueError) as e:
+            return {"type": "error", "error": f"malformed job: {e}"}
+        try:
+            programs = job_backend(job).programs(job.compiler)
+            for path in job.files:
+                _safe_relative(path)
+        except (ValueError, WorkerError) as e:
+            result = BuildResult(ok=False, diagnostics=str(e))
+        else:
+            refused = [p for p in programs if p not in self.compilers]
+            if refused:
+                result = BuildResult(
+                    ok=False,
+                    diagnostics=f"compiler not allowed here: {', '.join(refused)}",
+                )
+            else:
+                async with self.engine.slot():
+                    try:
+                        result = await compile_job(job, self.engine)
+                    except (WorkerError, OSError) as e:
+                        result = BuildResult(ok=False, diagnostics=str(e))
+        if self.on_job is not None:
+            self.on_job(job, result)
+        return {"type": "result", "result": result.to_dict()}
+
+
+# --- Client ----------------------------------------------------------------
+
+
+class RemoteWorker:
+    """Client side of a build worker."""
+
+    def __init__(
+        self, address: Address, token: Optional[str] = None, timeout: float = 10.0
+    ):
+        self.address = address
+        self.name = format_address(address)
+        self.token = token
+        self.timeout = timeout
+        self.capacity = 1
+        self.active = 0
+        self.alive = True
+
+    async def _request(self, message: dict, timeout: Optional[float]) -> dict:
+        if self.token:
+            message = {**message, "token": self.token}
+        try:
+            reader, writer = await _open(self.address, self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise WorkerError(f"cannot connect to {self.name}: {e}")
+        try:
+            await send_message(writer, message)
+            reply = await asyncio.wait_for(read_message(reader), timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise WorkerError(f"{self.name}: {e or 'timed out'}")
+        finally:
+            writer.close()
+        if reply.get("type") == "error":
+            raise WorkerError(f"{self.name}: {reply.get('error')}")
+        return reply
+
+    async def connect(self) -> None:
+        """Handshake with the worker and learn its capacity."""
+        reply = await self._request({"type": "hello"}, self.timeout)
+        if reply.get("version") != PROTOCOL_VERSION:
+            raise WorkerError(
+                f"{self.name}: protocol version {reply.get('version')}, "
+                f"expected {PROTOCOL_VERSION}"
+            )
+        self.capacity = max(1, int(reply.get("jobs", 1)))
+
+    async def build(self, job: BuildJob) -> BuildResult:
+        # No reply timeout: the worker enforces its own compile timeouts.
+        reply = await self._request({"type": "build", "job": job.to_dict()}, None)
+        try:
+            return BuildResult.from_dict(reply["result"], self.name)
+        except (KeyError, TypeError, ValueError) as e:
+            raise WorkerError(f"{self.name}: malformed result: {e}")
+
+
+@dataclass
+class _Local:
+    capacity: int
+    active: int = 0
+    name: str = LOCAL
+
+
+@dataclass
+class PoolStats:
+    """Jobs completed per worker, plus workers dropped after errors."""
+
+    jobs: Dict[str, int] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    retries: int = 0
+
+
+class WorkerPool:
+    """Spread jobs over local slots and remote workers.
+
+    Each job goes to the least-loaded worker with a free slot (active jobs
+    relative to capacity). A worker that fails with a connection or
+    protocol error is dropped and the job is retried elsewhere; compile
+    failures are not retried. If every remote worker is gone, jobs fall
+    back to `fallback_slots` local slots.
+    """
+
+    def __init__(
+        self,
+        remotes: List[RemoteWorker],
+        local_slots: int,
+        fallback_slots: int = 1,
+        retries: int = 2,
+        on_drop: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.remotes = remotes
+        self.local = _Local(capacity=local_slots)
+        self.fallback_slots = max(1, fallback_slots)
+        self.retries = retries
+        self.on_drop = on_drop
+        self.stats = PoolStats()
+        self._changed: Optional[asyncio.Condition] = None
+
+    async def start(self) -> None:
+        """Handshake with every remote worker, dropping unreachable ones."""
+
+        async def connect(worker: RemoteWorker) -> None:
+            try:
+                await worker.connect()
+            except WorkerError as e:
+                self._drop(worker, str(e))
+
+        await asyncio.gather(*(connect(w) for w in self.remotes))
+
+    def _drop(self, worker: RemoteWorker, error: str) -> None:
+        if not worker.alive:
+            return
+        worker.alive = False
+        self.stats.failures[worker.name] = error
+        if self.on_drop is not None:
+            self.on_drop(worker.name, error)
+        if not any(w.alive for w in self.remotes):
+            self.local.capacity = max(self.local.capacity, self.fallback_slots)
+
+    def _pick(self) -> Optional[Union[RemoteWorker, _Local]]:
+        candidates: List[Union[RemoteWorker, _Local]] = [
+            w for w in self.remotes if w.alive and w.active < w.capacity
+        ]
+        if self.local.active < self.local.capacity:
+            candidates.append(self.local)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: w.active / w.capacity)
+
+    async def run(
+        self, job: BuildJob, build_local: Callable[[], Awaitable[BuildResult]]
+    ) -> BuildResult:
+        """Run a job on some worker; build_local compiles it on this machine."""
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        attempts = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._pick() is not None)
+                worker = self._pick()
+                assert worker is not None
+                worker.active += 1
+            try:
+                if isinstance(worker, _Local):
+                    result = await build_local()
+                else:
+                    result = await worker.build(job)
+            except WorkerError as e:
+                self._drop(worker, str(e))
+                attempts += 1
+                self.stats.retries += 1
+                if attempts > self.retries:
+                    return BuildResult(ok=False, diagnostics=str(e), worker=worker.name)
+                continue
+            finally:
+                async with self._changed:
+                    worker.active -= 1
+                    self._changed.notify_all()
+            self.stats.jobs[worker.name] = self.stats.jobs.get(worker.name, 0) + 1
+            return result
@@ -0,0 +1,31 @@
+"""Helpers for spreading CPU-bound work over processes."""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Below this many items, running inline beats process start-up cost.
+PARALLEL_THRESHOLD = 8
+
+
+def process_map(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    jobs: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> List[R]:
+    """Map a picklable top-level function over items, in order.
+
+    Small batches (or jobs=1) run in the current process; larger ones use
+    a process pool, which sidesteps the GIL for pure-Python work such as
+    line diffing.
+    """
+    if len(items) < threshold or jobs == 1:
+        return [fn(item) for item in items]
+
+    chunksize = max(1, len(items) // (4 * (jobs or 8)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
@@ -0,0 +1,16 @@
+"""Console reporting shared by CLI commands."""
+
+from typing import List
+
+from rich.console import Console
+
+from rcv.core.resume import MetadataError
+
+console = Console()
+
+
+def print_metadata_errors(errors: List[MetadataError]) -> None:
+    """Report resumes skipped because their .meta.json is corrupt."""
+    for error in errors:
+        console.print(f"[yellow]Skipping corrupt metadata:[/yellow] {error.meta_file}")
+        console.print(f"[dim]  {error.reason}[/dim]")
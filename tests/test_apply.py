@@ -0,0 +1,84 @@
+"""rcv apply: declarative creation of resumes and variants."""
+
+import pytest
+from typer.testing import CliRunner
+
+from rcv.cli import app
+from rcv.commands import branch
+from rcv.core.resume import get_all_resumes
+
+PLAN = """
+[[new]]
+name = "swe"
+tags = ["base"]
+
+[[branch]]
+source = "swe/google"
+name = "cloud"
+
+[[branch]]
+source = "swe"
+name = "google"
+notes = "Referral"
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".rcv.toml").write_text("")
+    (tmp_path / "plan.toml").write_text(PLAN)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def apply(*args):
+    return CliRunner().invoke(app, ["apply", "plan.toml", *args])
+
+
+def names(project):
+    return [resume.full_name for resume in get_all_resumes(project)]
+
+
+def test_apply_is_idempotent(project):
+    result = apply()
+    assert result.exit_code == 0, result.output
+    assert names(project) == ["swe", "swe/google", "swe/google/cloud"]
+    google = get_all_resumes(project)[1]
+    assert google.metadata.notes == "Referral"
+    assert google.metadata.base_hash is not None
+
+    result = apply()
+    assert result.exit_code == 0, result.output
+    assert "Created 0, updated 0, unchanged 3" in result.output
+
+
+def test_dry_run_writes_nothing(project):
+    result = apply("--dry-run")
+    assert result.exit_code == 0, result.output
+    assert "Would create 3" in result.output
+    assert names(project) == []
+
+
+def test_failed_entry_is_retried_by_the_next_run(project, monkeypatch):
+    def broken(*args, **kwargs):
+        raise UnicodeDecodeError("utf-8", b"\xe9", 0, 1, "invalid byte")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(branch, "rebase_references", broken)
+        result = apply()
+    assert result.exit_code == 1
+    assert "Failed to create swe/google" in result.output
+    assert names(project) == ["swe"]
+    assert [p.name for p in (project / "swe" / "variants").iterdir()] == []
+
+    result = apply()
+    assert result.exit_code == 0, result.output
+    assert "Created 2, updated 0, unchanged 1" in result.output
+
+
+def test_invalid_plan_creates_nothing(project):
+    (project / "plan.toml").write_text(PLAN + '\n[[branch]]\nsource = "nope"\n')
+    result = apply()
+    assert result.exit_code == 1
+    assert "branch #3: missing 'name'" in result.output
+    assert names(project) == []
@@ -0,0 +1,59 @@
+"""Creating variants."""
+
+import pytest
+
+from rcv.commands import branch
+from rcv.core.objects import ObjectStore
+from rcv.core.pack import pack_resume
+from rcv.core.resume import Resume
+
+
+@pytest.fixture
+def swe(tmp_path):
+    (tmp_path / "shared.tex").write_text("% shared preamble\n")
+    return Resume.create(tmp_path / "swe", template_content="\\input{../shared}\n")
+
+
+def test_seed_that_is_not_utf8_is_copied_as_is(swe, tmp_path):
+    seed = tmp_path / "latin1.tex"
+    seed.write_bytes("R\xe9sum\xe9\n".encode("latin-1"))
+    branch.create_variant(swe, "fr", seed)
+    assert (swe.variants_dir / "fr" / "resume.tex").read_bytes() == seed.read_bytes()
+
+
+def test_includes_are_rebased(swe):
+    branch.create_variant(swe, "google")
+    variant = Resume.load(swe.variants_dir / "google")
+    assert variant.read_source() == "\\input{../../../shared}\n"
+    assert variant.metadata.base_hash is not None
+
+
+def test_packed_source_stays_packed(swe, tmp_path):
+    branch.create_variant(swe, "google")
+    google = Resume.load(swe.variants_dir / "google")
+    pack_resume(google, ObjectStore.for_project(tmp_path))
+
+    branch.create_variant(google, "search")
+    assert Resume.load(google.path).is_packed
+    assert not google.resume_file.exists()
+    search = Resume.load(google.variants_dir / "search")
+    assert search.read_source() == "\\input{../../../../../shared}\n"
+
+
+def test_failure_leaves_no_partial_variant(swe, monkeypatch):
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(branch, "clone_file", broken)
+    (swe.path / "photo.png").write_bytes(b"\x89PNG")
+    with pytest.raises(OSError):
+        branch.create_variant(swe, "google")
+    assert list(swe.variants_dir.iterdir()) == []
+
+
+def test_existing_variant_directory_is_not_replaced(swe):
+    (swe.variants_dir / "google").mkdir(parents=True)
+    with pytest.raises(FileExistsError):
+        branch.create_variant(swe, "google")
+    assert [p.name for p in swe.variants_dir.iterdir()] == ["google"]
+    assert not any((swe.variants_dir / "google").iterdir())
@@ -0,0 +1,19 @@
+"""Variant drift against parents and branch bases."""
+
+from rcv.commands import branch
+from rcv.core.drift import STATE_EDITED, compute_drift, compute_parent_diffs
+from rcv.core.resume import Resume
+
+
+def test_sources_that_are_not_utf8_are_unreadable_not_missing(tmp_path):
+    swe = Resume.create(tmp_path / "swe", template_content="Jane Doe\n")
+    branch.create_variant(swe, "fr")
+    fr = Resume.load(swe.variants_dir / "fr")
+    fr.resume_file.write_bytes("R\xe9sum\xe9\n".encode("latin-1"))
+
+    (diff,) = compute_parent_diffs([swe, fr], tmp_path, 1)
+    assert diff.unreadable and not diff.missing
+
+    (report,) = compute_drift([swe, fr], tmp_path, 1)
+    assert report.state == STATE_EDITED
+    assert report.local is None and report.unreadable
@@ -0,0 +1,39 @@
+"""Running compiler subprocesses."""
+
+import asyncio
+import os
+
+import pytest
+
+from rcv.core.engine import KILL_CANCELLED, BuildEngine
+
+
+def alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+# One tick cancels while the child is being started; more cancel it
+# while it runs.
+@pytest.mark.parametrize("ticks", [1, 2, 50])
+def test_cancelled_job_is_killed_and_reaped(tmp_path, ticks):
+    engine = BuildEngine(jobs=1)
+    pid_file = tmp_path / "pid"
+
+    async def main():
+        task = asyncio.ensure_future(
+            engine.run("swe", ["sh", "-c", f"echo $$ > {pid_file}; exec sleep 30"])
+        )
+        for _ in range(ticks):
+            await asyncio.sleep(0 if ticks < 50 else 0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 10)
+
+    asyncio.run(main())
+    assert [killed.reason for killed in engine.killed] == [KILL_CANCELLED]
+    if pid_file.exists() and pid_file.read_text().strip():
+        assert not alive(int(pid_file.read_text()))
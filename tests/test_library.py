@@ -0,0 +1,41 @@
+"""Sharing sections through the project library."""
+
+import pytest
+
+from rcv.commands import branch
+from rcv.core.library import (
+    UnreadableSourceError,
+    library_file,
+    plan_extract,
+    section_users,
+)
+from rcv.core.objects import ObjectStore
+from rcv.core.pack import pack_resume
+from rcv.core.resume import Resume
+
+SOURCE = "\\section{Education}\nMIT\n"
+
+
+@pytest.fixture
+def swe(tmp_path):
+    return Resume.create(tmp_path / "swe", template_content=SOURCE)
+
+
+def test_source_that_is_not_utf8_cannot_be_extracted(swe, tmp_path):
+    swe.resume_file.write_bytes(
+        "\\section{Education}\nUniversit\xe9\n".encode("latin-1")
+    )
+    with pytest.raises(UnreadableSourceError, match="swe"):
+        plan_extract(swe, "Education", library_file(tmp_path, "education", "latex"))
+
+
+def test_unreadable_packed_sources_are_skipped(swe, tmp_path):
+    branch.create_variant(swe, "google")
+    google = Resume.load(swe.variants_dir / "google")
+    pack_resume(google, ObjectStore.for_project(tmp_path))
+    google = Resume.load(google.path)
+    ObjectStore.for_project(tmp_path).delete(google.metadata.packed["delta"])
+
+    unreadable = []
+    assert section_users([swe, google], tmp_path, unreadable) == {}
+    assert [resume.full_name for resume in unreadable] == ["swe/google"]
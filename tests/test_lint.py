@@ -0,0 +1,21 @@
+"""Static checks of LaTeX sources."""
+
+from rcv.core.lint import scan_source
+
+
+def latex_problems(text):
+    return scan_source((text, "latex"))["problems"]
+
+
+def test_percent_in_urls_is_not_a_comment():
+    text = (
+        "\\url{https://example.com/a%20b}\n"
+        "\\href{https://example.com/?q=a%20b#top}{Profile 100\\%}\n"
+        "\\nolinkurl{x.com/%7Euser}\n"
+    )
+    assert latex_problems(text) == []
+
+
+def test_comments_still_hide_braces():
+    assert latex_problems("text % {\n\\textbf{x}\n") == []
+    assert latex_problems("\\textbf{x\n") == [[1, "'{' is never closed"]]
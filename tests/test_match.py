@@ -0,0 +1,15 @@
+"""Ranking resumes against a job description."""
+
+from rcv.core.match import TermVectorCache
+from rcv.core.resume import Resume
+
+
+def test_sources_that_are_not_utf8_are_left_out(tmp_path):
+    swe = Resume.create(tmp_path / "swe", template_content="Kubernetes and Go\n")
+    fr = Resume.create(tmp_path / "fr")
+    fr.resume_file.write_bytes("R\xe9sum\xe9\n".encode("latin-1"))
+
+    unreadable = []
+    documents = TermVectorCache(tmp_path).load({"a": swe, "b": fr}, 1, unreadable)
+    assert list(documents) == ["a"]
+    assert unreadable == ["b"]
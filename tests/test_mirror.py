@@ -0,0 +1,43 @@
+"""Local working copies of projects on synced drives."""
+
+import os
+
+import pytest
+
+from rcv.core.mirror import Mirror
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    origin = tmp_path / "origin"
+    (origin / "swe").mkdir(parents=True)
+    (origin / "swe" / "resume.tex").write_text("Jane Doe\n")
+    (origin / ".rcv" / "objects").mkdir(parents=True)
+    (origin / ".rcv" / "objects" / "ab").write_bytes(b"blob")
+    (origin / "PDFs").mkdir()
+    (origin / "PDFs" / "swe.pdf").write_bytes(b"%PDF")
+    mirror = Mirror(origin, tmp_path / "local")
+    mirror.pull()
+    return mirror
+
+
+def touch_later(path, data):
+    path.write_bytes(data)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_edits_only_check_skips_state_and_pdfs(mirror):
+    touch_later(mirror.origin / ".rcv" / "objects" / "ab", b"other blob")
+    touch_later(mirror.origin / "PDFs" / "swe.pdf", b"%PDF-2")
+    assert not mirror.origin_changed(edits_only=True)
+    assert mirror.origin_changed()
+
+    touch_later(mirror.origin / "swe" / "resume.tex", b"Jane Q. Doe\n")
+    assert mirror.origin_changed(edits_only=True)
+
+
+def test_origin_check_is_rate_limited(mirror):
+    assert mirror.origin_check_due(60)
+    assert not mirror.origin_check_due(60)
+    assert mirror.origin_check_due(0)
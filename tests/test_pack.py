@@ -0,0 +1,34 @@
+"""Delta-packing variant sources."""
+
+import pytest
+
+from rcv.commands import branch
+from rcv.core import resume as resume_module
+from rcv.core.objects import ObjectStore
+from rcv.core.pack import PackError, pack_resume
+from rcv.core.resume import Resume
+
+
+@pytest.fixture
+def variant(tmp_path):
+    swe = Resume.create(tmp_path / "swe", template_content="Jane Doe\n")
+    branch.create_variant(swe, "google")
+    return Resume.load(swe.variants_dir / "google")
+
+
+def test_pack_replaces_source_with_delta(variant, tmp_path):
+    pack_resume(variant, ObjectStore.for_project(tmp_path))
+    packed = Resume.load(variant.path)
+    assert not packed.resume_file.exists()
+    assert packed.is_packed
+    assert packed.read_source() == "Jane Doe\n"
+
+
+def test_source_is_kept_when_metadata_cannot_be_saved(variant, tmp_path, monkeypatch):
+    def broken(self, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(resume_module.ResumeMetadata, "save", broken)
+    with pytest.raises(PackError, match="disk full"):
+        pack_resume(variant, ObjectStore.for_project(tmp_path))
+    assert variant.resume_file.read_text() == "Jane Doe\n"
@@ -0,0 +1,29 @@
+"""Finding resumes by name."""
+
+import pytest
+
+from rcv.commands import branch
+from rcv.core.resume import METADATA_FILE, Resume, find_resume
+
+
+@pytest.fixture
+def corrupt(tmp_path):
+    swe = Resume.create(tmp_path / "swe", template_content="Jane Doe\n")
+    branch.create_variant(swe, "meta")
+    meta_file = swe.variants_dir / "meta" / METADATA_FILE
+    meta_file.write_text("{bad")
+    return meta_file
+
+
+@pytest.mark.parametrize("name", ["swe/meta", "meta"])
+def test_corrupt_metadata_is_reported_not_raised(tmp_path, corrupt, name):
+    errors = []
+    assert find_resume(tmp_path, name, errors) is None
+    assert [error.meta_file for error in errors] == [corrupt]
+
+
+def test_other_corrupt_resumes_are_not_reported(tmp_path, corrupt):
+    errors = []
+    assert find_resume(tmp_path, "swe", errors).name == "swe"
+    assert find_resume(tmp_path, "google", errors) is None
+    assert errors == []
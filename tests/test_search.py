@@ -0,0 +1,69 @@
+"""Narrowing grep candidates with the search index."""
+
+import pytest
+from typer.testing import CliRunner
+
+from rcv.cli import app
+from rcv.core.resume import Resume
+from rcv.core.search import SearchIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    sources = {
+        "k8s": "Ran Kubernetes clusters\nmy_config loader\n",
+        "spark": "Tuned Spark jobs on a cluster\n",
+    }
+    index = SearchIndex(tmp_path)
+    index.update(
+        {
+            digest: Resume.create(tmp_path / digest, template_content=text)
+            for digest, text in sources.items()
+        }
+    )
+    return index
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Kube", {"k8s"}),
+        ("ernet", {"k8s"}),
+        ("cluster", {"k8s", "spark"}),
+        ("netes clus", {"k8s"}),
+        ("Ran Kubernetes clusters", {"k8s"}),
+        ("Ran Kube", {"k8s"}),
+        ("an Kube", {"k8s"}),
+        ("config", {"k8s"}),
+        ("Spark clusters", set()),
+        ("jobs on a", None),
+        ("a", None),
+    ],
+)
+def test_literal_candidates(index, text, expected):
+    assert index.literal_candidates(text) == expected
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".rcv.toml").write_text("")
+    Resume.create(tmp_path / "swe", template_content="Ran Kubernetes clusters\n")
+    fr = Resume.create(tmp_path / "fr")
+    fr.resume_file.write_bytes("R\xe9sum\xe9 Kubernetes\n".encode("latin-1"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("pattern", ["Kubernetes", "Kube.*"])
+def test_grep_skips_sources_that_are_not_utf8(project, pattern):
+    result = CliRunner().invoke(app, ["grep", "-l", pattern])
+    assert result.exit_code == 0, result.output
+    assert "swe" in result.output
+    assert "Skipping unreadable source: fr" in result.output
+
+
+def test_grep_scans_sources_missing_from_the_index(project, monkeypatch):
+    monkeypatch.setattr(SearchIndex, "update", lambda self, sources: 0)
+    result = CliRunner().invoke(app, ["grep", "-l", "Kubernetes"])
+    assert result.exit_code == 0, result.output
+    assert "swe" in result.output
@@ -0,0 +1,49 @@
+"""Near-duplicate search over MinHash signatures."""
+
+from itertools import islice
+
+from rcv.commands import branch
+from rcv.commands.similar import load_signatures
+from rcv.core.resume import Resume
+from rcv.core.similarity import minhash, similar_clusters, similar_pairs
+
+RESUME = "Jane Doe software engineer Go Kubernetes distributed systems at scale"
+OTHER = "John Roe pastry chef croissants sourdough bread laminated dough"
+
+
+def test_identical_copies_are_paired_lazily():
+    signature = minhash(RESUME)
+    signatures = {f"copy{i:04d}": signature for i in range(1500)}
+    signatures["other"] = minhash(OTHER)
+
+    pairs = list(islice(similar_pairs(signatures, 0.5), 3))
+    assert pairs == [
+        ("copy0000", "copy0001", 1.0),
+        ("copy0000", "copy0002", 1.0),
+        ("copy0000", "copy0003", 1.0),
+    ]
+
+
+def test_clusters_expand_identical_groups():
+    signatures = {
+        "a": minhash(RESUME),
+        "b": minhash(RESUME),
+        "c": minhash(RESUME + " and Rust"),
+        "d": minhash(OTHER),
+        "e": minhash(OTHER),
+        "f": minhash("Alex Poe nurse intensive care"),
+    }
+
+    assert similar_clusters(signatures, 0.5) == [["a", "b", "c"], ["d", "e"]]
+    assert ("a", "c") in {(a, b) for a, b, _ in similar_pairs(signatures, 0.5)}
+
+
+def test_sources_that_are_not_utf8_are_skipped(tmp_path):
+    swe = Resume.create(tmp_path / "swe", template_content=RESUME)
+    for name in ("google", "fr"):
+        branch.create_variant(swe, name)
+    fr = Resume.load(swe.variants_dir / "fr")
+    fr.resume_file.write_bytes("R\xe9sum\xe9\n".encode("latin-1"))
+
+    resumes = [swe, *swe.get_all_descendants()]
+    assert sorted(load_signatures(resumes, tmp_path)) == ["swe", "swe/google"]
@@ -0,0 +1,43 @@
+"""Snapshot history and its deduplication."""
+
+import pytest
+
+from rcv.core.resume import Resume
+from rcv.core.snapshots import SnapshotLog, inputs_hash
+
+
+@pytest.fixture
+def swe(tmp_path):
+    (tmp_path / "experience.tex").write_text("Acme\n")
+    return Resume.create(tmp_path / "swe", template_content="\\input{../experience}\n")
+
+
+def record(resume, pdf_file=None):
+    text = resume.read_source()
+    return SnapshotLog.for_resume(resume).record(
+        text, "latex", pdf_file=pdf_file, inputs=inputs_hash(resume, text)
+    )
+
+
+def test_unchanged_inputs_are_not_recorded_again(swe):
+    first, created = record(swe)
+    assert created
+    assert record(swe) == (first, False)
+
+
+def test_edited_include_is_recorded(swe, tmp_path):
+    record(swe)
+    (tmp_path / "experience.tex").write_text("Acme, then Initech\n")
+    snapshot, created = record(swe)
+    assert created and snapshot.number == 2
+
+
+def test_changed_pdf_is_recorded(swe, tmp_path):
+    pdf = tmp_path / "swe.pdf"
+    pdf.write_bytes(b"%PDF-1")
+    record(swe, pdf)
+    assert not record(swe, pdf)[1]
+    pdf.write_bytes(b"%PDF-2")
+    snapshot, created = record(swe, pdf)
+    assert created
+    assert SnapshotLog.for_resume(swe).store.get(snapshot.pdf) == b"%PDF-2"
@@ -0,0 +1,34 @@
+"""Atomic writes."""
+
+import os
+import stat
+
+import pytest
+
+from rcv.core.storage import _umask, atomic_write_text
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+
+
+def mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_new_files_follow_umask(tmp_path):
+    _umask.cache_clear()
+    previous = os.umask(0o027)
+    try:
+        atomic_write_text(tmp_path / "new.json", "{}")
+    finally:
+        os.umask(previous)
+        _umask.cache_clear()
+    assert mode(tmp_path / "new.json") == 0o640
+
+
+def test_rewrites_keep_permissions(tmp_path):
+    path = tmp_path / "resume.tex"
+    path.write_text("old")
+    path.chmod(0o664)
+    atomic_write_text(path, "new")
+    assert path.read_text() == "new"
+    assert mode(path) == 0o664
@@ -0,0 +1,79 @@
+"""rcv sync: merging parent changes into variants."""
+
+import pytest
+from typer.testing import CliRunner
+
+from rcv.cli import app
+from rcv.commands import branch
+from rcv.core.resume import Resume
+
+BASE = "Jane Doe\nGo\nKubernetes\nPostgres\n"
+
+
+@pytest.fixture
+def swe(tmp_path, monkeypatch):
+    (tmp_path / ".rcv.toml").write_text("")
+    swe = Resume.create(tmp_path / "swe", template_content=BASE)
+    branch.create_variant(swe, "google")
+    branch.create_variant(variant(swe, "google"), "cloud")
+    monkeypatch.chdir(tmp_path)
+    return swe
+
+
+def variant(parent, name):
+    return Resume.load(parent.variants_dir / name)
+
+
+def sync(*args):
+    return CliRunner().invoke(app, ["sync", "swe", "-r", *args])
+
+
+def test_clean_merge_reaches_grandchildren(swe):
+    google = variant(swe, "google")
+    google.resume_file.write_text(BASE.replace("Go\n", "Go at Google\n"))
+    swe.resume_file.write_text(BASE.replace("Postgres", "Postgres and Kafka"))
+
+    result = sync()
+    assert result.exit_code == 0, result.output
+    assert "Updated 2 variant(s)" in result.output
+    assert (
+        google.read_source()
+        == "Jane Doe\nGo at Google\nKubernetes\nPostgres and Kafka\n"
+    )
+    assert variant(google, "cloud").read_source() == google.read_source()
+
+
+def test_conflict_is_left_untouched(swe):
+    google = variant(swe, "google")
+    google.resume_file.write_text(BASE.replace("Postgres", "Spanner"))
+    swe.resume_file.write_text(BASE.replace("Postgres", "MySQL"))
+
+    result = sync()
+    assert result.exit_code == 0, result.output
+    assert "conflict (1)" in result.output
+    assert google.read_source() == BASE.replace("Postgres", "Spanner")
+    # cloud follows google's text as it stands on disk
+    assert variant(google, "cloud").read_source() == google.read_source()
+
+
+def test_markers_are_not_merged_into_descendants(swe):
+    google = variant(swe, "google")
+    google.resume_file.write_text(BASE.replace("Postgres", "Spanner"))
+    swe.resume_file.write_text(BASE.replace("Postgres", "MySQL"))
+
+    result = sync("--markers")
+    assert result.exit_code == 0, result.output
+    assert "<<<<<<<" in google.read_source()
+    assert "parent conflicted" in result.output
+    assert variant(google, "cloud").read_source() == BASE
+
+
+def test_unreadable_variant_fails_alone(swe):
+    branch.create_variant(swe, "fr")
+    variant(swe, "fr").resume_file.write_bytes("R\xe9sum\xe9\n".encode("latin-1"))
+    swe.resume_file.write_text(BASE.replace("Postgres", "MySQL"))
+
+    result = sync()
+    assert result.exit_code == 0, result.output
+    assert "unreadable" in result.output
+    assert variant(swe, "google").read_source() == BASE.replace("Postgres", "MySQL")
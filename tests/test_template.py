@@ -0,0 +1,34 @@
+"""Rendering templated resumes."""
+
+from rcv.commands import branch
+from rcv.core.resume import Resume
+from rcv.core.template import RENDER_CHANGED, RENDER_FAILED, Renderer
+
+TEMPLATE = "\\input{../shared/preamble}\n\\textbf{<<name>>}\n"
+
+
+def test_inherited_template_includes_are_rebased(tmp_path):
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "preamble.tex").write_text("% preamble\n")
+    swe = Resume.create(tmp_path / "swe")
+    (swe.path / "template.tex").write_text(TEMPLATE)
+    (swe.path / "data.toml").write_text('name = "Jane Doe"\n')
+    branch.create_variant(swe, "google")
+    google = Resume.load(swe.variants_dir / "google")
+
+    renderer = Renderer()
+    assert renderer.render(swe).status == RENDER_CHANGED
+    assert renderer.render(google, force=True).status == RENDER_CHANGED
+    assert swe.read_source() == "\\input{../shared/preamble}\n\\textbf{Jane Doe}\n"
+    assert google.read_source() == (
+        "\\input{../../../shared/preamble}\n\\textbf{Jane Doe}\n"
+    )
+
+
+def test_template_that_is_not_utf8_fails_to_render(tmp_path):
+    swe = Resume.create(tmp_path / "swe")
+    (swe.path / "template.tex").write_bytes("R\xe9sum\xe9\n".encode("latin-1"))
+    (swe.path / "data.toml").write_text("")
+    result = Renderer().render(swe)
+    assert result.status == RENDER_FAILED
+    assert "cannot read template" in result.error
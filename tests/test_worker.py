@@ -0,0 +1,170 @@
+"""Build workers, exercised with servers on localhost."""
+
+import asyncio
+import os
+import socket
+from pathlib import Path
+
+import pytest
+
+from rcv.core.engine import BuildEngine
+from rcv.core.worker import (
+    BuildResult,
+    BuildServer,
+    RemoteWorker,
+    WorkerError,
+    WorkerPool,
+    make_job,
+)
+
+TOKEN = "s3cret"
+
+# Stands in for `typst compile --root ROOT SOURCE PDF`: the "PDF" is a
+# copy of the source.
+FAKE_TYPST = '#!/bin/sh\ncp "$4" "$5"\n'
+
+
+@pytest.fixture
+def fake_typst(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    typst = bin_dir / "typst"
+    typst.write_text(FAKE_TYPST)
+    typst.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return typst
+
+
+def serve(server, client):
+    """Run client(address) against server listening on a free local port."""
+
+    async def main():
+        running = await server.start(("127.0.0.1", 0))
+        port = running.sockets[0].getsockname()[1]
+        async with running:
+            return await client(("127.0.0.1", port))
+
+    return asyncio.run(main())
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def typst_job(tmp_path: Path, **changes):
+    source = tmp_path / "swe" / "resume.typ"
+    source.parent.mkdir(parents=True, exist_ok=True)
+    source.write_text("= Jane Doe\n")
+    job = make_job("swe", "typst", "typst", source, [])
+    for key, value in changes.items():
+        setattr(job, key, value)
+    return job
+
+
+def test_builds_job_on_localhost(tmp_path, fake_typst):
+    server = BuildServer(BuildEngine(jobs=2), token=TOKEN)
+
+    async def client(address):
+        worker = RemoteWorker(address, token=TOKEN)
+        await worker.connect()
+        return worker.capacity, await worker.build(typst_job(tmp_path))
+
+    capacity, result = serve(server, client)
+    assert capacity == 2
+    assert result.ok, result.diagnostics
+    assert result.pdf == b"= Jane Doe\n"
+
+
+def test_refuses_requests_without_token(tmp_path):
+    server = BuildServer(BuildEngine(jobs=1), token=TOKEN)
+
+    async def client(address):
+        with pytest.raises(WorkerError, match="invalid token"):
+            await RemoteWorker(address).connect()
+        with pytest.raises(WorkerError, match="invalid token"):
+            await RemoteWorker(address, token="guess").build(typst_job(tmp_path))
+
+    serve(server, client)
+
+
+def test_refuses_compiler_outside_allowlist(tmp_path):
+    marker = tmp_path / "pwned"
+    job = typst_job(tmp_path, format="latex", backend="latexmk")
+    job.compiler = f"touch {marker}; pdflatex"
+    server = BuildServer(BuildEngine(jobs=1), token=TOKEN)
+
+    async def client(address):
+        return await RemoteWorker(address, token=TOKEN).build(job)
+
+    result = serve(server, client)
+    assert not result.ok
+    assert "not allowed" in result.diagnostics
+    assert not marker.exists()
+
+
+@pytest.mark.parametrize("name", ["latexmkrc", ".latexmkrc", "sub/latexmkrc"])
+def test_refuses_latexmkrc_in_job(tmp_path, name):
+    job = typst_job(tmp_path, format="latex", backend="latexmk", compiler="pdflatex")
+    job.files[name] = b"system('touch pwned');\n"
+    server = BuildServer(BuildEngine(jobs=1), token=TOKEN)
+
+    async def client(address):
+        return await RemoteWorker(address, token=TOKEN).build(job)
+
+    result = serve(server, client)
+    assert not result.ok
+    assert "not allowed" in result.diagnostics
+
+
+def test_refuses_paths_outside_job(tmp_path):
+    job = typst_job(tmp_path)
+    job.files["../escape.typ"] = b""
+    server = BuildServer(BuildEngine(jobs=1), token=TOKEN)
+
+    async def client(address):
+        return await RemoteWorker(address, token=TOKEN).build(job)
+
+    result = serve(server, client)
+    assert not result.ok
+    assert "unsafe path" in result.diagnostics
+
+
+def test_pool_drops_unreachable_worker(tmp_path, fake_typst):
+    server = BuildServer(BuildEngine(jobs=1), token=TOKEN)
+    dead = ("127.0.0.1", unused_port())
+
+    async def client(address):
+        remotes = [RemoteWorker(dead, token=TOKEN, timeout=1.0)]
+        remotes.append(RemoteWorker(address, token=TOKEN))
+        pool = WorkerPool(remotes, local_slots=0)
+        await pool.start()
+
+        async def build_local():
+            raise AssertionError("a remote worker is still alive")
+
+        result = await pool.run(typst_job(tmp_path), build_local)
+        return pool.stats, result
+
+    stats, result = serve(server, client)
+    assert result.ok, result.diagnostics
+    assert list(stats.failures) == [f"127.0.0.1:{dead[1]}"]
+    assert "local" not in stats.jobs and sum(stats.jobs.values()) == 1
+
+
+def test_pool_falls_back_to_local_builds(tmp_path):
+    dead = ("127.0.0.1", unused_port())
+
+    async def main():
+        pool = WorkerPool([RemoteWorker(dead, timeout=1.0)], local_slots=0)
+        await pool.start()
+
+        async def build_local():
+            return BuildResult(ok=True, pdf=b"%PDF")
+
+        return pool.stats, await pool.run(typst_job(tmp_path), build_local)
+
+    stats, result = asyncio.run(main())
+    assert result.ok and result.worker == "local"
+    assert stats.jobs == {"local": 1}